@@ -8,7 +8,8 @@
  * across a local network.
  *
  * ENDPOINTS:
- * GET  /status  - Returns current status as JSON
+ * GET  /status  - Returns current status as JSON (ETag / If-None-Match aware)
+ * GET  /events  - Server-Sent Events stream of status changes
  * GET  /health  - Simple health check (returns "ok")
  * POST /run     - Start execution with JSON body: {"jsonPath":"..."} or {"json":"..."}
  * POST /stop    - Trigger StopGently
@@ -17,11 +18,19 @@
  * IMPLEMENTATION:
  * Uses TcpListener instead of HttpListener because HttpListener
  * requires assembly references not available in RebornBuddy's runtime.
+ * HTTP/1.1 keep-alive is supported so a polling master can reuse one
+ * connection instead of reconnecting for every request.
  *
  * NOTES FOR CLAUDE:
  * - Uses raw TCP sockets with manual HTTP parsing
  * - Server runs on a background thread
+ * - Each connection gets its own background thread and serves requests
+ *   until the client sends "Connection: close" or goes idle
  * - All responses are JSON (except /health which is plain text)
+ * - /status carries a "version" that increases whenever the status changes,
+ *   and an ETag built from it; a matching If-None-Match gets 304 Not Modified
+ * - /events holds its connection open and pushes a status event on every
+ *   state change plus a periodic tick, so the master does not need to poll
  */
 
 using System;
@@ -42,6 +51,42 @@ namespace TheWrangler
     /// </summary>
     public class RemoteServer : IDisposable
     {
+        #region Constants
+
+        /// <summary>
+        /// How long an idle keep-alive connection is held open. Longer than the
+        /// master's poll interval so consecutive polls share a connection.
+        /// </summary>
+        private const int KeepAliveTimeoutMs = 30000;
+
+        /// <summary>
+        /// Maximum requests served on one connection before it is closed.
+        /// </summary>
+        private const int KeepAliveMaxRequests = 1000;
+
+        /// <summary>
+        /// Connections above this count are served once and then closed.
+        /// </summary>
+        private const int MaxKeepAliveConnections = 64;
+
+        /// <summary>
+        /// How often an /events stream checks the controller for a state change.
+        /// </summary>
+        private const int EventCheckIntervalMs = 250;
+
+        /// <summary>
+        /// Maximum gap between /events messages. Carries runtime updates and
+        /// lets the subscriber detect a dead connection.
+        /// </summary>
+        private const int EventTickIntervalMs = 5000;
+
+        /// <summary>
+        /// Maximum concurrent /events subscribers.
+        /// </summary>
+        private const int MaxEventSubscribers = 16;
+
+        #endregion
+
         #region Fields
 
         private readonly WranglerController _controller;
@@ -49,6 +94,15 @@ namespace TheWrangler
         private Thread _listenerThread;
         private volatile bool _isRunning;
         private readonly int _port;
+        private int _openConnections;
+        private int _eventSubscribers;
+
+        // Status versioning for ETag / If-None-Match. The epoch keeps ETags from
+        // a previous server run from matching after a restart.
+        private readonly object _versionLock = new object();
+        private readonly string _statusEpoch = DateTime.UtcNow.Ticks.ToString("x");
+        private long _statusVersion;
+        private string _versionSignature;
 
         #endregion
 
@@ -160,8 +214,14 @@ namespace TheWrangler
                     // AcceptTcpClient blocks until a client connects
                     var client = _listener.AcceptTcpClient();
 
-                    // Handle request on thread pool
-                    ThreadPool.QueueUserWorkItem(_ => HandleClient(client));
+                    // Keep-alive connections can sit idle for a while, so give each
+                    // one a dedicated background thread instead of a pool thread
+                    var connectionThread = new Thread(() => HandleClient(client))
+                    {
+                        IsBackground = true,
+                        Name = "TheWrangler Remote Connection"
+                    };
+                    connectionThread.Start();
                 }
                 catch (SocketException)
                 {
@@ -178,50 +238,78 @@ namespace TheWrangler
         }
 
         /// <summary>
-        /// Handles a connected client.
+        /// Handles a connected client, serving requests until the connection closes.
         /// </summary>
         private void HandleClient(TcpClient client)
         {
+            var connections = Interlocked.Increment(ref _openConnections);
+
             try
             {
                 using (client)
                 using (var stream = client.GetStream())
                 {
-                    // Set timeouts
-                    stream.ReadTimeout = 5000;
+                    // Set timeouts - reads also bound how long an idle connection is kept
+                    stream.ReadTimeout = KeepAliveTimeoutMs;
                     stream.WriteTimeout = 5000;
 
-                    // Read HTTP request
-                    var request = ReadHttpRequest(stream);
-                    if (request == null)
+                    // One reader per connection so buffered bytes of a pipelined
+                    // request are not lost between requests
+                    var reader = new StreamReader(stream, Encoding.UTF8, false, 4096, true);
+                    var allowKeepAlive = connections <= MaxKeepAliveConnections;
+
+                    for (int served = 1; _isRunning; served++)
                     {
-                        return; // Invalid request
-                    }
+                        // Read HTTP request
+                        var request = ReadHttpRequest(reader);
+                        if (request == null)
+                        {
+                            return; // Invalid request, idle timeout or client closed
+                        }
 
-                    // Process request and get response
-                    var response = ProcessRequest(request);
+                        // The event stream owns the connection until the subscriber leaves
+                        if (request.Path == "/events" && request.Method == "GET")
+                        {
+                            StreamEvents(stream);
+                            return;
+                        }
+
+                        request.KeepAlive = request.KeepAlive && allowKeepAlive
+                            && served < KeepAliveMaxRequests;
+
+                        // Process request and get response
+                        var response = ProcessRequest(request);
 
-                    // Send response
-                    var responseBytes = Encoding.UTF8.GetBytes(response);
-                    stream.Write(responseBytes, 0, responseBytes.Length);
-                    stream.Flush();
+                        // Send response
+                        var responseBytes = Encoding.UTF8.GetBytes(response);
+                        stream.Write(responseBytes, 0, responseBytes.Length);
+                        stream.Flush();
+
+                        if (!request.KeepAlive)
+                        {
+                            return;
+                        }
+                    }
                 }
             }
             catch (Exception ex)
             {
                 Log($"Error handling client: {ex.Message}");
             }
+            finally
+            {
+                Interlocked.Decrement(ref _openConnections);
+            }
         }
 
         /// <summary>
-        /// Reads and parses an HTTP request from the stream.
+        /// Reads and parses an HTTP request from the connection's reader.
+        /// Returns null on a malformed request or short body, a closed connection or an idle timeout.
         /// </summary>
-        private HttpRequest ReadHttpRequest(NetworkStream stream)
+        private HttpRequest ReadHttpRequest(StreamReader reader)
         {
             try
             {
-                var reader = new StreamReader(stream, Encoding.UTF8, false, 4096, true);
-
                 // Read request line
                 var requestLine = reader.ReadLine();
                 if (string.IsNullOrEmpty(requestLine))
@@ -235,6 +323,7 @@ namespace TheWrangler
                 {
                     Method = parts[0].ToUpper(),
                     Path = parts[1].ToLower(),
+                    Version = parts.Length > 2 ? parts[2].ToUpper() : "HTTP/1.0",
                     Headers = new Dictionary<string, string>()
                 };
 
@@ -257,16 +346,63 @@ namespace TheWrangler
                     }
                 }
 
-                // Read body if present
+                // HTTP/1.1 defaults to keep-alive, HTTP/1.0 must ask for it
+                string connection;
+                request.Headers.TryGetValue("connection", out connection);
+                connection = connection?.ToLower() ?? "";
+                request.KeepAlive = request.Version == "HTTP/1.1"
+                    ? !connection.Contains("close")
+                    : connection.Contains("keep-alive");
+
+                // Read body if present. Content-Length counts bytes but the reader
+                // hands out chars, so keep reading until exactly that many bytes
+                // have arrived; a short body would leave the rest of it to be
+                // parsed as the next keep-alive request, so drop the connection
+                if (contentLength < 0)
+                    return null;
+
                 if (contentLength > 0)
                 {
-                    var buffer = new char[contentLength];
-                    var read = reader.Read(buffer, 0, contentLength);
-                    request.Body = new string(buffer, 0, read);
+                    var body = new StringBuilder(contentLength);
+                    var buffer = new char[Math.Min(contentLength, 4096) + 1];
+                    int bytesRead = 0;
+                    while (bytesRead < contentLength)
+                    {
+                        // A char is at most 3 UTF-8 bytes, so asking for a third of the
+                        // remaining bytes never reads into the next pipelined request
+                        var wanted = Math.Min(buffer.Length - 1, Math.Max(1, (contentLength - bytesRead) / 3));
+                        var read = reader.Read(buffer, 0, wanted);
+
+                        // Keep surrogate pairs together so they count as 4 bytes, not 3 + 3
+                        if (read > 0 && char.IsHighSurrogate(buffer[read - 1]))
+                            read += reader.Read(buffer, read, 1);
+
+                        if (read == 0)
+                        {
+                            Log($"Request body ended after {bytesRead} of {contentLength} bytes, closing connection.");
+                            return null;
+                        }
+
+                        bytesRead += Encoding.UTF8.GetByteCount(buffer, 0, read);
+                        body.Append(buffer, 0, read);
+                    }
+
+                    if (bytesRead != contentLength)
+                    {
+                        Log($"Request body ran past Content-Length ({bytesRead} of {contentLength} bytes), closing connection.");
+                        return null;
+                    }
+
+                    request.Body = body.ToString();
                 }
 
                 return request;
             }
+            catch (IOException)
+            {
+                // Idle keep-alive timeout or the client hung up
+                return null;
+            }
             catch (Exception ex)
             {
                 Log($"Error reading request: {ex.Message}");
@@ -289,7 +425,7 @@ namespace TheWrangler
                 // Handle CORS preflight
                 if (request.Method == "OPTIONS")
                 {
-                    return BuildResponse(200, "OK", "text/plain", "",
+                    return BuildResponse(200, "OK", "text/plain", "", request.KeepAlive,
                         "Access-Control-Allow-Origin: *",
                         "Access-Control-Allow-Methods: GET, POST, OPTIONS",
                         "Access-Control-Allow-Headers: Content-Type");
@@ -299,8 +435,21 @@ namespace TheWrangler
                 switch (request.Path)
                 {
                     case "/status":
-                        body = HandleStatus();
-                        break;
+                        string etag;
+                        body = HandleStatus(out etag);
+
+                        string ifNoneMatch;
+                        if (request.Headers.TryGetValue("if-none-match", out ifNoneMatch) && ifNoneMatch == etag)
+                        {
+                            return BuildResponse(304, "Not Modified", contentType, "", request.KeepAlive,
+                                $"ETag: {etag}",
+                                "Access-Control-Allow-Origin: *");
+                        }
+
+                        return BuildResponse(statusCode, statusText, contentType, body, request.KeepAlive,
+                            $"ETag: {etag}",
+                            "Cache-Control: no-cache",
+                            "Access-Control-Allow-Origin: *");
 
                     case "/health":
                         body = "ok";
@@ -374,21 +523,109 @@ namespace TheWrangler
                 body = JsonConvert.SerializeObject(new { error = ex.Message });
             }
 
-            return BuildResponse(statusCode, statusText, contentType, body,
+            return BuildResponse(statusCode, statusText, contentType, body, request.KeepAlive,
                 "Access-Control-Allow-Origin: *");
         }
 
+        /// <summary>
+        /// Handles GET /events - streams status as Server-Sent Events.
+        /// Each event is written as one HTTP chunk so clients see it immediately.
+        /// </summary>
+        private void StreamEvents(NetworkStream stream)
+        {
+            var subscribers = Interlocked.Increment(ref _eventSubscribers);
+
+            try
+            {
+                if (subscribers > MaxEventSubscribers)
+                {
+                    var busy = BuildResponse(503, "Service Unavailable", "application/json",
+                        JsonConvert.SerializeObject(new { error = "Too many event subscribers" }), false,
+                        "Access-Control-Allow-Origin: *");
+                    var busyBytes = Encoding.UTF8.GetBytes(busy);
+                    stream.Write(busyBytes, 0, busyBytes.Length);
+                    return;
+                }
+
+                var header = new StringBuilder();
+                header.AppendLine("HTTP/1.1 200 OK");
+                header.AppendLine("Content-Type: text/event-stream; charset=utf-8");
+                header.AppendLine("Cache-Control: no-cache");
+                header.AppendLine("Transfer-Encoding: chunked");
+                header.AppendLine("Connection: close");
+                header.AppendLine("Access-Control-Allow-Origin: *");
+                header.AppendLine();
+                var headerBytes = Encoding.ASCII.GetBytes(header.ToString());
+                stream.Write(headerBytes, 0, headerBytes.Length);
+
+                string lastSignature = null;
+                var lastSent = DateTime.MinValue;
+
+                while (_isRunning)
+                {
+                    var signature = GetStatusSignature();
+                    var changed = signature != lastSignature;
+
+                    if (changed || (DateTime.UtcNow - lastSent).TotalMilliseconds >= EventTickIntervalMs)
+                    {
+                        string etag;
+                        var data = HandleStatus(out etag);
+                        var message = $"event: {(changed ? "state" : "tick")}\ndata: {data}\n\n";
+                        WriteChunk(stream, Encoding.UTF8.GetBytes(message));
+
+                        lastSignature = signature;
+                        lastSent = DateTime.UtcNow;
+                    }
+
+                    Thread.Sleep(EventCheckIntervalMs);
+                }
+
+                // Terminating chunk - the server is shutting down
+                WriteChunk(stream, new byte[0]);
+            }
+            catch (IOException)
+            {
+                // Subscriber disconnected
+            }
+            finally
+            {
+                Interlocked.Decrement(ref _eventSubscribers);
+            }
+        }
+
+        /// <summary>
+        /// Writes one chunk of a chunked-encoded response and flushes it.
+        /// </summary>
+        private static void WriteChunk(NetworkStream stream, byte[] data)
+        {
+            var size = Encoding.ASCII.GetBytes($"{data.Length:X}\r\n");
+            var crlf = Encoding.ASCII.GetBytes("\r\n");
+            stream.Write(size, 0, size.Length);
+            stream.Write(data, 0, data.Length);
+            stream.Write(crlf, 0, crlf.Length);
+            stream.Flush();
+        }
+
         /// <summary>
         /// Builds an HTTP response string.
         /// </summary>
         private string BuildResponse(int statusCode, string statusText, string contentType,
-            string body, params string[] extraHeaders)
+            string body, bool keepAlive, params string[] extraHeaders)
         {
             var sb = new StringBuilder();
             sb.AppendLine($"HTTP/1.1 {statusCode} {statusText}");
             sb.AppendLine($"Content-Type: {contentType}; charset=utf-8");
             sb.AppendLine($"Content-Length: {Encoding.UTF8.GetByteCount(body)}");
-            sb.AppendLine("Connection: close");
+
+            if (keepAlive)
+            {
+                sb.AppendLine("Connection: keep-alive");
+                sb.AppendLine($"Keep-Alive: timeout={KeepAliveTimeoutMs / 1000}, max={KeepAliveMaxRequests}");
+            }
+            else
+            {
+                sb.AppendLine("Connection: close");
+            }
 
             foreach (var header in extraHeaders)
             {
@@ -402,9 +639,9 @@ namespace TheWrangler
         }
 
         /// <summary>
-        /// Handles GET /status - returns current state.
+        /// Handles GET /status - returns current state and its ETag.
         /// </summary>
-        private string HandleStatus()
+        private string HandleStatus(out string etag)
         {
             // Get character info if available
             string characterName = "Unknown";
@@ -420,8 +657,13 @@ namespace TheWrangler
                 // Ignore errors - character info may not be available
             }
 
+            var runtimeSeconds = _controller.ExecutionRuntimeSeconds;
+            var version = GetStatusVersion($"{GetStatusSignature()}|{characterName}|{runtimeSeconds}");
+            etag = $"\"{_statusEpoch}-{version}\"";
+
             var status = new
             {
+                version = version,
                 state = GetStateString(),
                 isExecuting = _controller.IsExecuting,
                 hasPendingOrder = _controller.HasPendingOrder,
@@ -430,13 +672,44 @@ namespace TheWrangler
                 apiStatus = _controller.ApiStatus,
                 botRunning = TheWranglerBotBase.IsBotRunning,
                 characterName = characterName,
-                runtimeSeconds = _controller.ExecutionRuntimeSeconds,
+                runtimeSeconds = runtimeSeconds,
                 timestamp = DateTime.UtcNow.ToString("o")
             };
 
             return JsonConvert.SerializeObject(status);
         }
 
+        /// <summary>
+        /// Returns the status version, bumping it when the signature differs
+        /// from the one last seen.
+        /// </summary>
+        private long GetStatusVersion(string signature)
+        {
+            lock (_versionLock)
+            {
+                if (signature != _versionSignature)
+                {
+                    _versionSignature = signature;
+                    _statusVersion++;
+                }
+                return _statusVersion;
+            }
+        }
+
+        /// <summary>
+        /// Summarizes the fields whose change should push an /events message.
+        /// Runtime and timestamp are left out; they ride along on the periodic tick.
+        /// </summary>
+        private string GetStatusSignature()
+        {
+            return string.Join("|",
+                GetStateString(),
+                _controller.HasIncompleteOrders(),
+                WranglerSettings.Instance.JsonFileName ?? "None",
+                _controller.ApiStatus,
+                TheWranglerBotBase.IsBotRunning);
+        }
+
         /// <summary>
         /// Gets a human-readable state string.
         /// </summary>
@@ -603,8 +876,10 @@ namespace TheWrangler
         {
             public string Method { get; set; }
             public string Path { get; set; }
+            public string Version { get; set; }
             public Dictionary<string, string> Headers { get; set; }
             public string Body { get; set; }
+            public bool KeepAlive { get; set; }
         }
 
         #endregion
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark: background image rendering, main thread vs worker pipeline
+=====================================================================
+
+Uses a generated 4K wallpaper (or --image) and simulates dragging the
+window edge, then a maximize / restore:
+
+- before: LANCZOS from the original on every settled resize - time the
+  Tk main thread was blocked (PhotoImage conversion not included)
+- after:  BackgroundRenderer - one-time decode + downscale to screen
+  size, nearest-neighbour previews during the drag, LANCZOS once it
+  settles, cache hits for sizes seen before. All of it runs in the
+  worker; the main thread only receives finished images.
+
+Needs Pillow (no display).
+
+Usage:
+    python benchmarks/bench_background.py [--image wallpaper.jpg] [--screen 1920x1080]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PIL import Image  # noqa: E402
+
+from wrangler_background import BackgroundRenderer, SETTLE_DELAY  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--image", help="wallpaper to use (default: a generated 3840x2160 JPEG)")
+    parser.add_argument("--screen", default="1920x1080")
+    args = parser.parse_args()
+    screen = tuple(int(n) for n in args.screen.split("x"))
+
+    path = args.image
+    if not path:
+        path = str(Path(tempfile.gettempdir()) / "wrangler_bench_4k.jpg")
+        Image.effect_mandelbrot((3840, 2160), (-2, -1, 1, 1), 60).convert("RGB").save(path, quality=90)
+
+    drag = [(950 + n * 10, 750 + n * 5) for n in range(30)]  # ~0.5 s of dragging at 60 Hz
+    sizes = [drag[-1], (950, 750), screen, (950, 750)]  # settle, restore, maximize, restore
+
+    # Before: every settled size resampled from the original on the main thread
+    original = Image.open(path).convert("RGB")
+    blocked = []
+    for size in sizes:
+        start = time.perf_counter()
+        original.resize(size, Image.Resampling.LANCZOS)
+        blocked.append((time.perf_counter() - start) * 1000)
+
+    # After
+    results = []
+    ready = threading.Event()
+
+    def on_ready(generation, size, image, final):
+        results.append((time.perf_counter(), size, final))
+        ready.set()
+
+    renderer = BackgroundRenderer(on_ready)
+    start = time.perf_counter()
+    renderer.load(path, screen)
+    renderer.request((950, 750))
+    ready.wait(30)
+    first = (time.perf_counter() - start) * 1000
+
+    results.clear()
+    for size in drag:
+        renderer.request(size, final=False)
+        time.sleep(1 / 60)
+    previews = sum(1 for _, _, final in results if not final)
+    time.sleep(SETTLE_DELAY)
+
+    finals = []
+    for size in sizes:
+        ready.clear()
+        start = time.perf_counter()
+        renderer.request(size, final=True)
+        ready.wait(30)
+        finals.append((time.perf_counter() - start) * 1000)
+
+    print(f"image: {original.size[0]}x{original.size[1]}, screen: {screen[0]}x{screen[1]}")
+    print("before (main thread blocked per settled resize): "
+          + ", ".join(f"{ms:.0f}" for ms in blocked) + " ms")
+    print(f"after  first render (worker, incl. decode):       {first:.0f} ms")
+    print(f"after  previews during a {len(drag)}-event drag:          {previews}")
+    print("after  final renders (worker; settle, restore, maximize, restore): "
+          + ", ".join(f"{ms:.0f}" for ms in finals) + " ms")
+
+
+if __name__ == "__main__":
+    main()
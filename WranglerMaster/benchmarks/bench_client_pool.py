@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call connections vs pooled keep-alive sessions
+=============================================================
+
+Starts a local mock Wrangler server and measures /status requests per
+second for:
+
+- before: module-level requests.get() against a server that answers with
+  "Connection: close" (the old WranglerClient / RemoteServer behaviour)
+- after:  WranglerClient's pooled session against a keep-alive server
+
+Usage:
+    python benchmarks/bench_client_pool.py [--requests 2000] [--threads 1]
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+
+from wrangler_core import WranglerClient, WranglerInstance, REQUEST_TIMEOUT  # noqa: E402
+
+
+STATUS_BODY = json.dumps({
+    "state": "executing",
+    "isExecuting": True,
+    "hasPendingOrder": False,
+    "hasIncompleteOrders": True,
+    "currentFile": "orders.json",
+    "apiStatus": "Ready",
+    "botRunning": True,
+    "characterName": "Frog Giraffe",
+    "runtimeSeconds": 1234,
+}).encode("utf-8")
+
+
+def make_handler(keep_alive: bool):
+    """Builds a request handler that mimics RemoteServer's /status."""
+
+    class MockWranglerHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+
+        def do_GET(self):
+            # Single write like RemoteServer, so Nagle/delayed-ACK does not skew results
+            head = (
+                "HTTP/1.1 200 OK\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(STATUS_BODY)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                "\r\n"
+            )
+            self.wfile.write(head.encode("ascii") + STATUS_BODY)
+
+        def log_message(self, format, *args):
+            pass
+
+    return MockWranglerHandler
+
+
+def start_server(keep_alive: bool) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(keep_alive))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(fetch, total: int, threads: int) -> float:
+    """Runs `total` fetches over `threads` workers and returns requests/second."""
+    per_thread = total // threads
+
+    def worker():
+        for _ in range(per_thread):
+            fetch()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in range(threads):
+            pool.submit(worker)
+    elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    close_server = start_server(keep_alive=False)
+    keep_server = start_server(keep_alive=True)
+
+    before_url = f"http://127.0.0.1:{close_server.server_address[1]}/status"
+
+    def before():
+        response = requests.get(before_url, timeout=REQUEST_TIMEOUT)
+        response.json()
+
+    client = WranglerClient()
+    instance = WranglerInstance(name="bench", host="127.0.0.1", port=keep_server.server_address[1])
+
+    def after():
+        status = client.get_status(instance)
+        assert status.reachable, status.error
+
+    # Warm up both paths (imports, first connection)
+    before()
+    after()
+
+    before_rps = run(before, args.requests, args.threads)
+    after_rps = run(after, args.requests, args.threads)
+
+    print(f"requests: {args.requests}, threads: {args.threads}")
+    print(f"before (new connection per call): {before_rps:8.0f} req/s")
+    print(f"after  (pooled keep-alive):       {after_rps:8.0f} req/s")
+    print(f"speedup: {after_rps / before_rps:.2f}x")
+
+    client.close()
+    close_server.shutdown()
+    keep_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: debounced, atomic config writes
+==========================================
+
+Toggles "Go Home after session" on one of N instances --toggles times,
+one every --interval seconds (a user hammering the checkbox), calling
+ConfigWriter.save() after each toggle the way the frontends'
+_save_config does. Meanwhile a reader thread re-reads
+wrangler_config.json in a loop, as a crash or another process could at
+any moment. Reports:
+
+- how many files were written (must be a handful, not one per toggle)
+- how long the toggling thread spent in save() - the UI thread's cost
+- whether any read saw a truncated or unparsable file (must be none)
+- whether the file after flush() holds the final toggle state
+
+Exits non-zero if any check fails. No GUI toolkit needed.
+
+Usage:
+    python benchmarks/bench_config_writes.py [--instances 200] [--toggles 1000] [--interval 0.003]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wrangler_core import WranglerInstance, ConfigWriter, load_config, save_config  # noqa: E402
+
+MAX_WRITES = 10  # a handful: one per CONFIG_SAVE_MAX_DELAY of toggling, plus the flush
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=200)
+    parser.add_argument("--toggles", type=int, default=1000)
+    parser.add_argument("--interval", type=float, default=0.003)
+    args = parser.parse_args()
+
+    instances = [WranglerInstance(name=f"Instance {n}", host="10.0.0.1", port=8000 + n)
+                 for n in range(args.instances)]
+    path = Path(tempfile.mkdtemp()) / "wrangler_config.json"
+
+    start = time.perf_counter()
+    save_config(path, instances, "order.json")
+    direct_ms = (time.perf_counter() - start) * 1000
+
+    reads = bad_reads = 0
+    stop = threading.Event()
+
+    def reader():
+        nonlocal reads, bad_reads
+        while not stop.is_set():
+            try:
+                with open(path, "r") as f:
+                    config = json.load(f)
+                if len(config["instances"]) != args.instances:
+                    bad_reads += 1
+            except (ValueError, KeyError):
+                bad_reads += 1
+            except OSError:
+                pass  # Windows: the file is being replaced right now
+            reads += 1
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    writer = ConfigWriter(path)
+    target = instances[0]
+    save_ms = 0.0
+    for _ in range(args.toggles):
+        target.go_home_after_session = not target.go_home_after_session
+        start = time.perf_counter()
+        writer.save(instances, "order.json")
+        save_ms += (time.perf_counter() - start) * 1000
+        time.sleep(args.interval)
+    writer.flush()
+    stop.set()
+
+    saved, _ = load_config(path)
+    final_ok = saved[0].go_home_after_session == target.go_home_after_session
+
+    print(f"{args.toggles} toggles on a {args.instances}-instance config")
+    print(f"before: {args.toggles} writes on the UI thread, ~{direct_ms:.1f} ms each "
+          f"(~{direct_ms * args.toggles:.0f} ms total)")
+    print(f"after:  {writer.writes} write(s) in the background, {save_ms:.1f} ms total in save()")
+    print(f"reads during the burst: {reads}, truncated or corrupt: {bad_reads}")
+    print(f"final state on disk: {'ok' if final_ok else 'WRONG'}")
+
+    failed = writer.writes > MAX_WRITES or bad_reads or not final_ok
+    print("FAIL" if failed else "PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
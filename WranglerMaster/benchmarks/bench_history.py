@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: StatusHistory memory and sparkline cost
+==================================================
+
+Simulates a long-running master: N instances polled every 2 s (the active
+poll interval) for --hours of fake time, alternating between idle and
+executing, with a fleet sample every FLEET_SAMPLE_INTERVAL. Reports:
+
+- bytes held per sample and in total - must stop growing once the rings
+  are full, however many hours are simulated
+- the same samples as a list of InstanceStatus objects, for comparison
+- time to record one poll and to compute one panel sparkline and the
+  fleet graph
+
+No GUI toolkit needed.
+
+Usage:
+    python benchmarks/bench_history.py [--instances 100] [--hours 12]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wrangler_core import InstanceStatus  # noqa: E402
+from wrangler_history import StatusHistory, HISTORY_SAMPLES  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=100)
+    parser.add_argument("--hours", type=float, default=12)
+    args = parser.parse_args()
+
+    clock = [0.0]
+    history = StatusHistory(clock=lambda: clock[0])
+    keys = [f"10.0.0.{n // 250}:{8000 + n % 250}" for n in range(args.instances)]
+    idle = InstanceStatus(state="idle", reachable=True, latency=0.015)
+    executing = InstanceStatus(state="executing", is_executing=True, reachable=True,
+                               runtime_seconds=600, latency=0.02)
+
+    polls = int(args.hours * 3600 / 2)
+    checkpoints = {polls // 4, polls // 2, polls - 1}
+    record_time = 0.0
+    for n in range(polls):
+        clock[0] += 2
+        status = executing if (n // 900) % 2 else idle  # 30 minutes each
+        start = time.perf_counter()
+        for key in keys:
+            history.record(key, status)
+        record_time += time.perf_counter() - start
+        history.sample_fleet([status] * len(keys))  # Only taken every FLEET_SAMPLE_INTERVAL
+        if n in checkpoints:
+            samples = min(n + 1, HISTORY_SAMPLES) * len(keys)
+            print(f"after {clock[0] / 3600:5.1f} h: {history.nbytes / 1024:8.0f} KB "
+                  f"({history.nbytes / samples:.1f} bytes/sample incl. fleet ring)")
+
+    tracemalloc.start()
+    objects = [InstanceStatus(state="idle", reachable=True) for _ in range(HISTORY_SAMPLES)]
+    object_bytes = tracemalloc.get_traced_memory()[0] / len(objects)
+    tracemalloc.stop()
+    del objects
+    print(f"InstanceStatus objects instead: {object_bytes:.0f} bytes/sample, "
+          f"{object_bytes * HISTORY_SAMPLES * len(keys) / 1024:.0f} KB for the same rings")
+
+    start = time.perf_counter()
+    for key in keys:
+        history.sparkline(key)
+    sparkline_ms = (time.perf_counter() - start) * 1000 / len(keys)
+    start = time.perf_counter()
+    history.fleet_series()
+    fleet_ms = (time.perf_counter() - start) * 1000
+
+    print(f"record one poll:   {record_time * 1e6 / (polls * len(keys)):.1f} us")
+    print(f"panel sparkline:   {sparkline_ms:.3f} ms")
+    print(f"fleet graph:       {fleet_ms:.3f} ms")
+    print("sparkline:", "".join("#" if c == "executing" else "." if c else " " for c in history.sparkline(keys[0])))
+
+
+if __name__ == "__main__":
+    main()
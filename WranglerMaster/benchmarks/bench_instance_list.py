@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: virtualized instance list at 10 vs 1000 instances (CustomTkinter)
+============================================================================
+
+Builds WranglerMasterApp's instance list (VirtualPanelGrid over a
+FleetModel) for each fleet size and measures, including layout
+(update_idletasks):
+
+- initial build
+- adding one instance and removing one from the middle
+- scrolling one row, and a full scroll from top to bottom
+- a status update for every instance, recorded in the StatusHistory as
+  the App does (only visible rows redraw, sparklines included)
+
+and how many InstancePanels exist. With virtualization the panel count
+and the per-action times should barely change between 10 and 1000.
+
+Needs customtkinter and a display (on Linux: xvfb-run python ...).
+
+Usage:
+    python benchmarks/bench_instance_list.py [--sizes 10 1000] [--rounds 5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import customtkinter as ctk  # noqa: E402
+
+from wrangler_core import WranglerInstance, InstanceStatus  # noqa: E402
+from wrangler_master import WranglerMasterApp, VirtualPanelGrid, PANEL_ROW_HEIGHT  # noqa: E402
+from wrangler_history import StatusHistory  # noqa: E402
+from wrangler_model import FleetModel  # noqa: E402
+
+
+class _Stub:
+    """Accepts any call - stands in for the client, streams and queue."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: ""
+
+
+class ListHarness:
+    """Just the state _refresh_panels and _make_panel need, without polling or config files."""
+
+    def __init__(self, root, instances):
+        self.instances = instances
+        self.model = FleetModel()
+        self.history = StatusHistory()
+        self.streams = self.client = self.queue = _Stub()
+        for callback in ("_on_panel_run", "_on_panel_stop", "_on_panel_resume",
+                         "_on_panel_advanced_run", "_on_panel_remove", "_save_config", "_show_queue"):
+            setattr(self, callback, lambda *args: None)
+        self.panels_scroll = VirtualPanelGrid(root, self.model, self.history, self._make_panel)
+        self.panels_scroll.pack(fill="both", expand=True)
+        self.view = self.panels_scroll  # The card view; the App switches this with the table view
+
+    refresh = WranglerMasterApp._refresh_panels
+    _make_panel = WranglerMasterApp._make_panel
+
+
+def timed(root, action) -> float:
+    start = time.perf_counter()
+    action()
+    root.update_idletasks()
+    return (time.perf_counter() - start) * 1000
+
+
+def median(values) -> float:
+    return sorted(values)[len(values) // 2]
+
+
+def run(root, size: int, rounds: int) -> dict:
+    instances = [WranglerInstance(name=f"Instance {n}", host="10.0.0.1", port=8000 + n) for n in range(size)]
+    harness = ListHarness(root, instances)
+    view = harness.panels_scroll
+    root.update()
+
+    result = {"build": timed(root, harness.refresh)}
+
+    add, remove, scroll, sweep, status = [], [], [], [], []
+    for n in range(rounds):
+        instances.append(WranglerInstance(name="Added", host="10.0.0.2", port=9000 + n))
+        add.append(timed(root, harness.refresh))
+        del instances[len(instances) // 2]
+        remove.append(timed(root, harness.refresh))
+
+        scroll.append(timed(root, lambda: view.scroll_by(PANEL_ROW_HEIGHT)))
+
+        def sweep_all():
+            view.offset = 0
+            while view.offset < view._content_height() - view.viewport.winfo_height():
+                view.scroll_by(PANEL_ROW_HEIGHT // 3)
+        sweep.append(timed(root, sweep_all))
+
+        state = "executing" if n % 2 else "idle"
+
+        def update_all():
+            for instance in instances:
+                status = InstanceStatus(state=state, reachable=True)
+                harness.model.set_status(instance.key, status)
+                harness.history.record(instance.key, status)
+                view.refresh_key(instance.key)
+        status.append(timed(root, update_all))
+
+    result.update(add=median(add), remove=median(remove), scroll=median(scroll),
+                  sweep=median(sweep), status=median(status), panels=len(view._pool))
+    view.destroy()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    root = ctk.CTk()
+    root.geometry("1400x900")
+
+    print(f"rounds: {args.rounds} (median ms, layout included)")
+    print(f"{'instances':>10} {'panels':>7} {'build':>8} {'add':>8} {'remove':>8} "
+          f"{'scroll':>8} {'sweep':>9} {'status':>8}")
+    for size in args.sizes:
+        r = run(root, size, args.rounds)
+        print(f"{size:>10} {r['panels']:>7} {r['build']:8.1f} {r['add']:8.1f} {r['remove']:8.1f} "
+              f"{r['scroll']:8.1f} {r['sweep']:9.1f} {r['status']:8.1f}")
+    print("sweep = scrolling the whole list top to bottom, a third of a row per step")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dirty-checked InstancePanel.update_status (CustomTkinter)
+====================================================================
+
+Builds N InstancePanels, shows a status on each and then replays polls,
+counting widget reconfigurations with InstancePanel.reconfigurations:
+
+- steady state: every poll returns an equal (fresh) InstanceStatus - must
+  cause zero reconfigurations
+- one change:   a single instance starts executing - only its changed
+  widgets are touched
+- before:       the same steady-state poll with the dirty check defeated,
+  i.e. every widget configured on every update as update_status used to
+
+Needs customtkinter and a display (on Linux: xvfb-run python ...).
+
+Usage:
+    python benchmarks/bench_panel_updates.py [--instances 30] [--polls 20]
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import customtkinter as ctk  # noqa: E402
+
+from wrangler_core import WranglerInstance, InstanceStatus  # noqa: E402
+from wrangler_master import InstancePanel  # noqa: E402
+
+
+def idle_status(n: int) -> InstanceStatus:
+    return InstanceStatus(
+        state="idle", reachable=True, bot_running=True, api_status="Ready",
+        character_name=f"Crafter {n}", world_name="World", current_file="order.json",
+    )
+
+
+def poll(root, panels, statuses, forget: bool = False) -> float:
+    start = time.perf_counter()
+    for panel, status in zip(panels, statuses):
+        if forget:
+            panel._shown.clear()
+        panel.update_status(replace(status))
+    root.update_idletasks()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=30)
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    root = ctk.CTk()
+    root.geometry("1400x900")
+    frame = ctk.CTkScrollableFrame(root)
+    frame.pack(fill="both", expand=True)
+
+    panels = []
+    for n in range(args.instances):
+        instance = WranglerInstance(name=f"Instance {n}", host="10.0.0.1", port=8000 + n)
+        panel = InstancePanel(frame, instance, *(lambda *a: None for _ in range(5)))
+        panel.pack(fill="x", padx=5, pady=5)
+        panels.append(panel)
+    statuses = [idle_status(n) for n in range(args.instances)]
+    poll(root, panels, statuses)
+
+    InstancePanel.reconfigurations = 0
+    steady = [poll(root, panels, statuses) for _ in range(args.polls)]
+    steady_count = InstancePanel.reconfigurations
+
+    statuses[0] = replace(statuses[0], state="executing", is_executing=True, runtime_seconds=75)
+    InstancePanel.reconfigurations = 0
+    poll(root, panels, statuses)
+    change_count = InstancePanel.reconfigurations
+
+    InstancePanel.reconfigurations = 0
+    before = [poll(root, panels, statuses, forget=True) for _ in range(args.polls)]
+    before_count = InstancePanel.reconfigurations
+
+    print(f"instances: {args.instances}, polls: {args.polls} (median ms per poll, layout included)")
+    print(f"steady state:  {steady_count:6d} reconfigurations  {sorted(steady)[len(steady) // 2]:8.2f} ms")
+    print(f"one change:    {change_count:6d} reconfigurations")
+    print(f"before:        {before_count:6d} reconfigurations  {sorted(before)[len(before) // 2]:8.2f} ms")
+
+    root.destroy()
+    if steady_count:
+        sys.exit("FAIL: an unchanged poll reconfigured widgets")
+
+
+if __name__ == "__main__":
+    main()
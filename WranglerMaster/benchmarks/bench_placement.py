@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: gear placement from live /status payloads
+====================================================
+
+Serves two mock instances whose /status body has exactly the fields
+RemoteServer.HandleStatus sends (character name, no world), one for each
+character under Lisbeth/Debug: "Frog Giraffe" (high-level gear) and
+"Randy Orton'" (low-level gear). Fetches both through WranglerClient and
+drives PlacementEngine from the parsed statuses, the way Start All,
+shard and place do, with an order for a CRP recipe only Frog Giraffe's
+gear can craft. Reports and checks:
+
+- that both statuses resolve to their character's gear (no world given)
+- that blocked() skips Randy Orton' and rank() keeps Frog Giraffe
+- that plan_placed_shards() puts every shard on Frog Giraffe
+- time to resolve and place the order
+
+Exits non-zero if any check fails. Needs `requests`, no GUI toolkit.
+
+Usage:
+    python benchmarks/bench_placement.py
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wrangler_core import WranglerClient, WranglerInstance  # noqa: E402
+from wrangler_gearsets import GearsetIndex, PlacementEngine  # noqa: E402
+from wrangler_recipes import RECIPES_FILENAME, find_data_file, load_recipes  # noqa: E402
+from wrangler_shard import WorkEstimator, plan_placed_shards  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+CHARACTERS = {"Frog Giraffe": 7921, "Randy Orton'": 7922}  # character -> mock port
+
+
+def make_handler(character: str):
+    """/status as RemoteServer.HandleStatus writes it (there is no worldName)."""
+    body = json.dumps({
+        "version": 3,
+        "state": "idle",
+        "isExecuting": False,
+        "hasPendingOrder": False,
+        "hasIncompleteOrders": False,
+        "currentFile": "None",
+        "apiStatus": "Ready",
+        "botRunning": True,
+        "characterName": character,
+        "runtimeSeconds": 0,
+        "timestamp": "2026-10-16T12:00:00.0000000Z",
+    }).encode("utf-8")
+
+    class MockStatusHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return MockStatusHandler
+
+
+def pick_item(gear: GearsetIndex, placement: PlacementEngine, recipes) -> int:
+    """A CRP recipe Frog Giraffe can craft and Randy Orton' cannot."""
+    by_name = {character.character: character for character in gear.characters.values()}
+    frog, randy = by_name["Frog Giraffe"], by_name["Randy Orton'"]
+    for item_id, recipe in sorted(recipes.items()):
+        if recipe.job == "CRP" and placement.margin(frog, item_id) is not None \
+                and placement.margin(randy, item_id) is None:
+            return item_id
+    raise SystemExit("No recipe in recipes.csv separates the two gearsets")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    gear = GearsetIndex.load(REPO_ROOT / "Lisbeth" / "Debug")
+    recipes = load_recipes(find_data_file(RECIPES_FILENAME, REPO_ROOT / "WranglerMaster"))
+    placement = PlacementEngine(gear, recipes)
+    item_id = pick_item(gear, placement, recipes)
+    orders = [{"Item": item_id, "Amount": 10, "Enabled": True}]
+
+    instances = []
+    for character, port in CHARACTERS.items():
+        server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(character))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        instances.append(WranglerInstance(name=character, host="127.0.0.1", port=port))
+    frog, randy = (instance.key for instance in instances)
+
+    client = WranglerClient()
+    statuses = {instance.key: client.get_status(instance) for instance in instances}
+    client.close()
+
+    start = time.perf_counter()
+    characters = placement.characters_for(statuses)
+    blocked = placement.blocked(orders, characters)
+    ranked = placement.rank(orders, characters)
+    shards, unplaceable = plan_placed_shards(orders, 4, WorkEstimator(), placement, characters)
+    placement_ms = (time.perf_counter() - start) * 1000
+
+    checks = [
+        ("statuses report no world", all(s.world_name == "Unknown" for s in statuses.values())),
+        ("Frog Giraffe resolves to its gearsets", characters[frog] is not None
+         and characters[frog].character == "Frog Giraffe"),
+        ("Randy Orton' resolves to its gearsets", characters[randy] is not None
+         and characters[randy].character == "Randy Orton'"),
+        ("Randy Orton' is blocked", randy in blocked),
+        ("Frog Giraffe is not blocked", frog not in blocked),
+        ("rank() keeps only Frog Giraffe", [key for key, _ in ranked] == [frog]),
+        ("every shard goes to Frog Giraffe", bool(shards) and not unplaceable
+         and all(shard.eligible == frozenset({frog}) for shard in shards)),
+    ]
+
+    print(f"order: 10x {recipes[item_id].item_name} (CRP, craftsmanship {recipes[item_id].req_craftsmanship}, "
+          f"control {recipes[item_id].req_control})")
+    print(f"blocked: {blocked}")
+    for label, ok in checks:
+        print(f"{'ok  ' if ok else 'FAIL'} {label}")
+    print(f"resolve gear and place the order: {placement_ms:.2f} ms")
+
+    failed = not all(ok for _, ok in checks)
+    print("FAIL" if failed else "PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark: poll loop with one slow instance
+===========================================
+
+Runs the frontends' poll loop (PollScheduler + FleetPoller) for --seconds
+against a fake fleet of --instances executing instances, one of which
+("Frog Giraffe") takes REQUEST_TIMEOUT to answer every poll. Every
+executing instance should be polled every POLL_INTERVAL_ACTIVE seconds.
+Reports, for the fast instances:
+
+- before: FleetPoller.poll() per batch - the loop waits for the slowest
+  instance, so everyone's poll slips to its pace
+- after:  FleetPoller.submit() - each answer is applied as it arrives and
+  the loop goes straight back to the scheduler
+- the largest and median gap between two polls of the same instance
+
+Exits non-zero if a fast instance waits more than MAX_GAP seconds between
+polls with submit(). No network or GUI toolkit needed.
+
+Usage:
+    python benchmarks/bench_polling.py [--instances 20] [--seconds 15]
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wrangler_core import (  # noqa: E402
+    FleetPoller, InstanceStatus, PollScheduler, WranglerInstance,
+    POLL_INTERVAL_ACTIVE, REQUEST_TIMEOUT,
+)
+
+MAX_GAP = POLL_INTERVAL_ACTIVE + 1.0
+
+
+def run_loop(instances, seconds: float, batched: bool):
+    """Polls like _start_polling does; returns the poll times per instance key."""
+    slow = instances[0].key
+    polled = {instance.key: [] for instance in instances}
+    lock = threading.Lock()
+
+    def fetch(instance: WranglerInstance) -> InstanceStatus:
+        with lock:
+            polled[instance.key].append(time.monotonic())
+        if instance.key == slow:
+            time.sleep(REQUEST_TIMEOUT)
+        return InstanceStatus(state="executing", is_executing=True, reachable=True,
+                              character_name=instance.name, fetched_at=time.monotonic())
+
+    poller = FleetPoller(fetch)
+    scheduler = PollScheduler()
+
+    def on_status(instance: WranglerInstance, status: InstanceStatus):
+        scheduler.record(instance.key, status)
+
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        due = scheduler.due(instances)
+        if due:
+            if batched:
+                snapshot = poller.poll(due)
+                for instance in due:
+                    on_status(instance, snapshot[instance.key])
+            else:
+                poller.submit(due, on_status)
+        wait = scheduler.seconds_until_next(instances)
+        time.sleep(min(max(wait, 0.1), 1.0))
+    poller.shutdown()
+    return polled
+
+
+def gaps(polled, skip: str):
+    """Seconds between consecutive polls of every instance but `skip`."""
+    result = []
+    for key, times in polled.items():
+        if key != skip:
+            result.extend(b - a for a, b in zip(times, times[1:]))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=15)
+    args = parser.parse_args()
+
+    names = ["Frog Giraffe"] + [f"Crafter {n}" for n in range(1, args.instances)]
+    instances = [WranglerInstance(name=name, host="10.0.0.1", port=8000 + n)
+                 for n, name in enumerate(names)]
+    slow = instances[0].key
+
+    print(f"{args.instances} executing instances for {args.seconds:g} s, Frog Giraffe answers "
+          f"in {REQUEST_TIMEOUT} s, target interval {POLL_INTERVAL_ACTIVE:g} s")
+    worst = 0.0
+    for label, batched in (("before: poll()  ", True), ("after:  submit()", False)):
+        polled = run_loop(instances, args.seconds, batched)
+        fast = gaps(polled, slow)
+        polls = sum(len(times) for key, times in polled.items() if key != slow)
+        print(f"{label} {polls:4d} polls of fast instances, gap max {max(fast):5.2f} s, "
+              f"median {statistics.median(fast):5.2f} s")
+        if not batched:
+            worst = max(fast)
+
+    failed = worst > MAX_GAP
+    print("FAIL" if failed else "PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark: telemetry store size and query time
+==============================================
+
+Simulates --days of a fleet in fake time: N instances, each with its own
+character, polled every --interval seconds and alternating between
+executing and idle, a few going unreachable now and then ("Frog Giraffe"
+more than most), plus a run command and a timer start / expiry per
+instance every 6 hours. Everything goes through TelemetryStore the way
+the frontends feed it, with a rollup / retention pass every simulated
+hour. Reports:
+
+- insert throughput of the batched writer
+- database size and row counts at the end (must stay small for a year)
+- time for "uptime per character last week", "how often did Frog
+  Giraffe go unreachable" (last week and last year) and the command
+  stats - each must take milliseconds - and, for scale, uptime over the
+  whole year (one hourly bucket per character and hour, ~1 us each)
+- executing hours per character last week against the simulated truth
+
+Exits non-zero if one of the millisecond queries takes longer than
+MAX_QUERY_MS or the uptime is off by more than 1%. No GUI toolkit needed.
+
+Usage:
+    python benchmarks/bench_telemetry.py [--instances 20] [--days 365] [--interval 120]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wrangler_core import InstanceStatus  # noqa: E402
+from wrangler_telemetry import TelemetryStore, TELEMETRY_FILENAME  # noqa: E402
+
+MAX_QUERY_MS = 50.0
+WEEK = 7 * 86400
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=20)
+    parser.add_argument("--days", type=float, default=365)
+    parser.add_argument("--interval", type=float, default=120)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    path = Path(tempfile.mkdtemp()) / TELEMETRY_FILENAME
+    start_time = 1_700_000_000.0
+    clock = [start_time]
+    store = TelemetryStore(path, clock=lambda: clock[0])
+
+    keys = [f"10.0.0.{n // 250}:{8000 + n % 250}" for n in range(args.instances)]
+    names = ["Frog Giraffe"] + [f"Crafter {n}" for n in range(1, args.instances)]
+    phase = [rng.randrange(0, 8 * 3600) for _ in keys]
+    down_until = [0.0] * len(keys)
+    end_time = start_time + args.days * 86400
+    truth = {name: 0.0 for name in names}  # executing seconds in the last week
+    outages_year = outages_week = 0
+
+    cycles = int(args.days * 86400 / args.interval)
+    write_time = 0.0
+    next_hour = start_time + 3600
+    next_commands = start_time
+    for _ in range(cycles):
+        clock[0] += args.interval
+        now = clock[0]
+        snapshot = {}
+        for n, key in enumerate(keys):
+            if now >= down_until[n] and rng.random() < (0.002 if n == 0 else 0.0002):
+                down_until[n] = now + rng.randrange(1, 10) * args.interval
+                if n == 0:
+                    outages_year += 1
+                    outages_week += now >= end_time - WEEK
+            if now < down_until[n]:
+                snapshot[key] = InstanceStatus(reachable=False, error="Timeout")
+                continue
+            executing = (now + phase[n]) % (8 * 3600) < 6 * 3600  # 6 h sessions, 2 h breaks
+            if executing and now >= end_time - WEEK:
+                truth[names[n]] += args.interval
+            snapshot[key] = InstanceStatus(
+                state="executing" if executing else "idle", is_executing=executing, reachable=True,
+                character_name=names[n], world_name="Gilgamesh",
+                runtime_seconds=int((now + phase[n]) % (8 * 3600)), latency=0.015,
+            )
+        store.record_statuses(snapshot)
+
+        if now >= next_commands:
+            next_commands += 6 * 3600
+            for key in keys:
+                store.record_command(key, "run", rng.random() > 0.01, "Started", 0.03)
+                store.record_transition(key, "timer", "started")
+                store.record_transition(key, "timer", "expired")
+        if now >= next_hour:
+            next_hour += 3600
+            started = time.perf_counter()
+            store.flush(maintain=True)
+            write_time += time.perf_counter() - started
+    started = time.perf_counter()
+    store.flush(maintain=True)
+    write_time += time.perf_counter() - started
+
+    polls = cycles * len(keys)
+    print(f"{args.days:g} days, {args.instances} instances polled every {args.interval:g} s: "
+          f"{polls} polls, {store.rows_written} rows written")
+    print(f"writer: {store.rows_written / write_time:,.0f} rows/s "
+          f"(incl. hourly rollups and retention), {write_time:.1f} s total")
+
+    size = sum(p.stat().st_size for p in path.parent.glob(TELEMETRY_FILENAME + "*"))
+    print(f"database: {size / 1024 / 1024:.1f} MB on disk "
+          f"({size / polls:.1f} bytes per poll ever recorded)")
+    for table in ("polls", "rollups_1m", "rollups_1h", "events"):
+        count = store._query(f"SELECT COUNT(*) FROM {table}", ())[0][0]
+        print(f"  {table:<11} {count:>9} rows")
+
+    def timed(query, *query_args, **query_kwargs):
+        query(*query_args, **query_kwargs)  # warm the page cache, as a second report would
+        started = time.perf_counter()
+        result = query(*query_args, **query_kwargs)
+        return result, (time.perf_counter() - started) * 1000
+
+    week_ago = clock[0] - WEEK
+    year_ago = clock[0] - 365 * 86400
+    uptime, uptime_ms = timed(store.uptime, week_ago)
+    week, week_ms = timed(store.outages, week_ago, character="frog giraffe")
+    year, year_ms = timed(store.outages, year_ago, character="Frog Giraffe")
+    _, year_uptime_ms = timed(store.uptime, year_ago)
+    _, commands_ms = timed(store.command_stats, week_ago)
+    store.close()
+
+    print(f"uptime per character, last week:    {uptime_ms:6.2f} ms")
+    print(f"uptime per character, last year:    {year_uptime_ms:6.2f} ms")
+    print(f"Frog Giraffe unreachable, last week: {week_ms:6.2f} ms "
+          f"-> {week[0]['count'] if week else 0}x (simulated {outages_week})")
+    print(f"Frog Giraffe unreachable, last year: {year_ms:6.2f} ms "
+          f"-> {year[0]['count'] if year else 0}x (simulated {outages_year}, events kept 400 days)")
+    print(f"command stats, last week:           {commands_ms:6.2f} ms")
+
+    worst = 0.0
+    for row in uptime:
+        if row["character"] in truth and truth[row["character"]]:
+            worst = max(worst, abs(row["executing"] - truth[row["character"]]) / truth[row["character"]])
+    print(f"executing hours last week vs simulated: worst error {worst:.2%} "
+          f"(buckets lag by a few minutes)")
+
+    slowest = max(uptime_ms, week_ms, year_ms, commands_ms)
+    failed = slowest > MAX_QUERY_MS or worst > 0.01
+    print("FAIL" if failed else "PASS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Wrangler Background Images
+==========================
+
+Renders the window background off the UI thread.
+
+1. load() decodes the wallpaper once in the worker thread and scales it
+   down to screen resolution, so a 4K image is never resampled again.
+2. While the window is being resized, request(size, final=False) gets a
+   fast nearest-neighbour preview (at most one per PREVIEW_INTERVAL).
+3. When resizing settles, request(size, final=True) gets a high-quality
+   LANCZOS render; the last CACHE_SIZE final renders are kept, so going
+   back to a recent size (maximize / restore) costs nothing.
+
+Only the newest request is rendered - older ones are dropped. Results are
+handed to on_ready(generation, size, image, final) from the worker
+thread; the frontend turns them into a PhotoImage on its own thread.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from PIL import Image
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+CACHE_SIZE = 4  # final renders kept (a 1080p RGB render is ~6 MB)
+PREVIEW_INTERVAL = 0.1  # seconds between previews while the window is being resized
+SETTLE_DELAY = 0.15  # seconds without resize events before the final render
+
+
+class BackgroundRenderer:
+    """Scales one background image to window sizes in a worker thread."""
+
+    def __init__(self, on_ready: Callable[[int, Tuple[int, int], Image.Image, bool], None],
+                 cache_size: int = CACHE_SIZE):
+        self.on_ready = on_ready
+        self.cache_size = cache_size
+        self.generation = 0  # Bumped by every load(); results carry it so stale ones can be dropped
+        self.renders = 0  # Resamples done (cache hits do not count)
+
+        self._cond = threading.Condition()
+        self._source: Optional[Tuple[str, Tuple[int, int]]] = None  # (path, screen size) to load
+        self._base: Optional[Image.Image] = None  # Decoded image at screen resolution
+        self._request: Optional[Tuple[Tuple[int, int], bool]] = None
+        self._cache: "OrderedDict[Tuple[int, int], Image.Image]" = OrderedDict()
+        self._last_preview = 0.0
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def load(self, path: Optional[str], screen_size: Tuple[int, int]) -> int:
+        """Switches to another image (None clears it); returns the new generation."""
+        with self._cond:
+            self.generation += 1
+            self._source = (path, screen_size) if path else None
+            self._base = None
+            self._request = None
+            self._cache.clear()
+            self._cond.notify()
+            return self.generation
+
+    def request(self, size: Tuple[int, int], final: bool = True):
+        """Asks for a render at size; replaces any request not started yet."""
+        if size[0] < 10 or size[1] < 10:
+            return
+        with self._cond:
+            self._request = (size, final)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._source is None and (self._request is None or self._base is None):
+                    self._cond.wait()
+                source, self._source = self._source, None
+                generation = self.generation
+
+            if source is not None:
+                base = self._decode(*source)
+                with self._cond:
+                    if generation == self.generation:
+                        self._base = base
+                continue
+
+            with self._cond:
+                request, self._request = self._request, None
+                base = self._base
+                cached = self._cache.get(request[0]) if request else None
+                if cached is not None:
+                    self._cache.move_to_end(request[0])
+            if request is None or base is None:
+                continue
+            size, final = request
+
+            if cached is not None:
+                image = cached
+            elif final:
+                image = base.resize(size, Image.Resampling.LANCZOS)
+                self.renders += 1
+                with self._cond:
+                    if generation == self.generation:
+                        self._cache[size] = image
+                        while len(self._cache) > self.cache_size:
+                            self._cache.popitem(last=False)
+            else:
+                wait = self._last_preview + PREVIEW_INTERVAL - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                    with self._cond:
+                        if self._request is not None:
+                            continue  # A newer size arrived meanwhile - render that one
+                image = base.resize(size, Image.Resampling.NEAREST)
+                self.renders += 1
+                self._last_preview = time.monotonic()
+
+            self.on_ready(generation, size, image, final)
+
+    @staticmethod
+    def _decode(path: str, screen_size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Opens an image and scales it down (keeping its aspect) to just cover the screen."""
+        try:
+            img = Image.open(path)
+            img.draft("RGB", screen_size)  # JPEG: decode at a reduced scale directly
+            img = img.convert("RGB")
+            scale = max(screen_size[0] / img.width, screen_size[1] / img.height)
+            if scale < 1:
+                size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+                img = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            return img
+        except Exception as e:
+            print(f"Failed to process background image: {e}")
+            return None
@@ -0,0 +1,575 @@
+#!/usr/bin/env python3
+"""
+Wrangler Master CLI
+===================
+
+Headless control of a Wrangler fleet, for servers without a display and
+for scripting. Reads the same wrangler_config.json as the GUI frontends.
+
+Usage:
+    python wrangler_cli.py status [--json]
+    python wrangler_cli.py start-all [--json-path PATH] [ROLLOUT]
+    python wrangler_cli.py stop-all
+    python wrangler_cli.py resume-all [ROLLOUT]
+    python wrangler_cli.py shard [--json-path PATH] [--per-instance N] [--dry-run] [ROLLOUT]
+    python wrangler_cli.py place [--json-path PATH] [--run]
+    python wrangler_cli.py daemon [--start-timers] [ROLLOUT]
+    python wrangler_cli.py report [--days N] [--character NAME]
+
+ROLLOUT options stagger starts: --per-host N, --spacing SECONDS, --no-ramp.
+
+The daemon polls every instance (adaptive intervals plus /events push),
+logs state changes and runs the schedules saved in each instance's
+advanced run settings until interrupted. Timers and schedules still in
+the run journal from a previous session are restored first. Order
+queues set up in the GUI are dispatched as instances go idle.
+
+shard splits one order across the enabled instances, balanced by the
+work estimated from Data/recipes.csv, and hands the shards out as
+instances go idle until all are done. Both it and start-all skip
+characters whose Lisbeth gearsets (--gearsets, default Lisbeth/Debug)
+fall short of the recipe stats; place ranks the instances for one order
+and can start it on the best idle one.
+
+The daemon and the GUI frontends record every poll, command and
+timer / schedule transition in wrangler_telemetry.db; report summarizes
+the last N days from it: uptime per character, how often each went
+unreachable, and command outcomes.
+
+Exit codes: 0 success, 1 one or more instances failed, 2 bad usage/config.
+
+Only stdlib and wrangler_* modules are imported, so the CLI starts quickly
+and runs wherever `requests` is installed.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+from wrangler_core import (
+    WranglerClient, WranglerInstance, InstanceStatus, FleetPoller, PollScheduler,
+    BulkDispatcher, StatusStreamManager, StartThrottle, summarize_results, format_results_table,
+    ConfigWriter, load_config, ROLLOUT_MAX_PER_HOST, ROLLOUT_MIN_SPACING,
+)
+from wrangler_runs import AdvancedRunManager
+from wrangler_queue import OrderQueueManager
+from wrangler_journal import RunJournal, JOURNAL_FILENAME
+from wrangler_telemetry import TelemetryStore, TELEMETRY_FILENAME
+from wrangler_recipes import RECIPES_FILENAME, find_data_file, load_recipes
+from wrangler_shard import (
+    ShardRun, WorkEstimator, SHARDS_PER_INSTANCE, load_order, plan_shards, plan_placed_shards, describe_plan,
+)
+from wrangler_gearsets import GearsetIndex, PlacementEngine, find_lisbeth_debug_dir
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+CONFIG_FILENAME = "wrangler_config.json"
+
+logger = logging.getLogger("wrangler")
+
+
+def get_config_dir() -> Path:
+    """Get the directory for config files (next to the script or executable)."""
+    if getattr(sys, 'frozen', False):
+        return Path(sys.executable).parent
+    return Path(__file__).parent.resolve()
+
+
+# =============================================================================
+# One-shot Commands
+# =============================================================================
+
+def status_to_dict(instance: WranglerInstance, status: InstanceStatus) -> dict:
+    """Flattens an instance and its status for JSON output."""
+    return {
+        "name": instance.name,
+        "host": instance.host,
+        "port": instance.port,
+        "reachable": status.reachable,
+        "state": status.state,
+        "isExecuting": status.is_executing,
+        "hasIncompleteOrders": status.has_incomplete_orders,
+        "characterName": status.character_name,
+        "currentFile": status.current_file,
+        "runtimeSeconds": status.runtime_seconds,
+        "error": status.error,
+    }
+
+
+def cmd_status(args, instances, json_path) -> int:
+    client = WranglerClient()
+    poller = FleetPoller(client.get_status)
+    snapshot = poller.poll(instances)
+    poller.shutdown()
+    rows = [
+        status_to_dict(i, snapshot[i.key])
+        for i in instances if i.key in snapshot
+    ]
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        name_width = max([len("Instance")] + [len(r["name"]) for r in rows])
+        print(f"{'Instance':<{name_width}}  {'State':<11}  {'Character':<20}  {'Runtime':>8}  File")
+        for r in rows:
+            state = r["state"] if r["reachable"] else "unreachable"
+            print(f"{r['name']:<{name_width}}  {state:<11}  {r['characterName']:<20}  "
+                  f"{r['runtimeSeconds']:>7}s  {r['currentFile'] if r['reachable'] else r['error']}")
+
+    return 0 if all(r["reachable"] for r in rows) else 1
+
+
+def make_throttle(args, client: WranglerClient) -> StartThrottle:
+    return StartThrottle(client, args.per_host, args.spacing, not args.no_ramp)
+
+
+def _dispatch(instances, action, verb: str) -> int:
+    def on_result(result, done, total):
+        outcome = "skipped" if result.skipped else ("ok" if result.success else "FAILED")
+        print(f"[{len(done)}/{total}] {result.instance.name}: {outcome} - {result.message}",
+              file=sys.stderr)
+
+    results = BulkDispatcher().dispatch(instances, action, on_result=on_result)
+    successes, failures, skipped = summarize_results(results)
+    print(format_results_table(results))
+    print(f"{verb}: {successes} succeeded, {failures} failed, {skipped} skipped")
+    return 1 if failures else 0
+
+
+def make_placement(args, recipes) -> PlacementEngine:
+    """Returns a PlacementEngine, or None without gearsets or recipe data."""
+    debug_dir = args.gearsets or find_lisbeth_debug_dir()
+    gear = GearsetIndex.load(debug_dir) if debug_dir else GearsetIndex()
+    if not len(gear) or not recipes:
+        return None
+    return PlacementEngine(gear, recipes)
+
+
+def load_recipe_data() -> dict:
+    path = find_data_file(RECIPES_FILENAME)
+    if path is None:
+        print(f"{RECIPES_FILENAME} not found - balancing by item count, no gear checks", file=sys.stderr)
+        return {}
+    return load_recipes(path)
+
+
+def fetch_statuses(client: WranglerClient, instances) -> dict:
+    poller = FleetPoller(client.get_status)
+    try:
+        return poller.poll(instances)
+    finally:
+        poller.shutdown()
+
+
+def cmd_start_all(args, instances, json_path) -> int:
+    path = args.json_path or json_path
+    if not path:
+        print("No JSON file: pass --json-path or set one in the GUI", file=sys.stderr)
+        return 2
+    client = WranglerClient()
+    throttle = make_throttle(args, client)
+
+    blocked = {}
+    try:
+        orders = load_order(path)
+    except (OSError, ValueError):
+        orders = None  # Not a plain order list - let the instances decide
+    if orders is not None:
+        placement = make_placement(args, load_recipe_data())
+        if placement:
+            statuses = fetch_statuses(client, instances)
+            blocked = placement.blocked(orders, placement.characters_for(statuses))
+
+    def start_one(instance: WranglerInstance):
+        if instance.key in blocked:
+            return None, blocked[instance.key]
+        return throttle.start(instance, lambda i: client.run_order(i, json_path=path))
+
+    return _dispatch(throttle.order(instances), start_one, "Start All")
+
+
+def cmd_stop_all(args, instances, json_path) -> int:
+    client = WranglerClient()
+    return _dispatch(instances, client.stop_gently, "Stop All")
+
+
+def cmd_resume_all(args, instances, json_path) -> int:
+    client = WranglerClient()
+    throttle = make_throttle(args, client)
+
+    def resume_one(instance: WranglerInstance):
+        status = client.get_status(instance)
+        if not status.reachable:
+            return False, status.error or "Unreachable"
+        if not status.has_incomplete_orders:
+            return None, "No incomplete orders"
+        if status.is_executing:
+            return None, "Already executing"
+        return throttle.start(instance, client.resume_orders)
+
+    return _dispatch(throttle.order(instances), resume_one, "Resume All")
+
+
+# =============================================================================
+# Sharding
+# =============================================================================
+
+def cmd_shard(args, instances, json_path) -> int:
+    path = args.json_path or json_path
+    if not path:
+        print("No JSON file: pass --json-path or set one in the GUI", file=sys.stderr)
+        return 2
+    try:
+        orders = load_order(path)
+    except (OSError, ValueError) as e:
+        print(f"Invalid order file {path}: {e}", file=sys.stderr)
+        return 2
+
+    participants = [i for i in instances if i.enabled]
+    if not participants:
+        print("No enabled instances", file=sys.stderr)
+        return 2
+
+    recipes = load_recipe_data()
+    estimator = WorkEstimator(recipes)
+    placement = make_placement(args, recipes)
+    client = WranglerClient()
+
+    count = len(participants) * args.per_instance
+    if placement:
+        characters = placement.characters_for(fetch_statuses(client, participants))
+        shards, unplaceable = plan_placed_shards(orders, count, estimator, placement, characters)
+    else:
+        shards, unplaceable = plan_shards(orders, count, estimator), []
+    print(describe_plan(shards, len(participants)))
+    if unplaceable:
+        names = [recipes[line["Item"]].item_name if line["Item"] in recipes else str(line["Item"])
+                 for line in unplaceable]
+        print(f"  left out - no character's gear can craft: {', '.join(names)}")
+    for shard in shards:
+        only = f", only {', '.join(sorted(shard.eligible))}" if shard.eligible is not None else ""
+        print(f"  shard {shard.index:>3}: {len(shard.orders):>3} lines, {shard.items:>6} items, "
+              f"~{shard.work / 60:.0f} min{only}")
+    if args.dry_run or not shards:
+        client.close()
+        return 0
+
+    poller = FleetPoller(client.get_status)
+    scheduler = PollScheduler()
+    stop_event = threading.Event()
+    run = ShardRun(client, shards, participants, on_message=logger.info,
+                   throttle=make_throttle(args, client), poll_soon=scheduler.poll_soon)
+
+    def request_stop(signum, frame):
+        logger.info("Cancelling - shards already running will finish")
+        run.cancel()
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    def on_status(instance: WranglerInstance, status: InstanceStatus):
+        scheduler.record(instance.key, status)
+        run.on_status(instance, status)
+
+    run.start()
+    while not run.finished:
+        due = scheduler.due(participants)
+        if due:
+            poller.submit(due, on_status)
+        if stop_event.is_set() and not run.active:
+            break
+        wait = scheduler.seconds_until_next(participants)
+        time.sleep(min(max(wait, 0.1), 1.0))
+
+    print(run.progress())
+    poller.shutdown()
+    client.close()
+    return 1 if run.held or run.failed or run.pending else 0
+
+
+def cmd_place(args, instances, json_path) -> int:
+    path = args.json_path or json_path
+    if not path:
+        print("No JSON file: pass --json-path or set one in the GUI", file=sys.stderr)
+        return 2
+    try:
+        orders = load_order(path)
+    except (OSError, ValueError) as e:
+        print(f"Invalid order file {path}: {e}", file=sys.stderr)
+        return 2
+
+    placement = make_placement(args, load_recipe_data())
+    if placement is None:
+        print("No gearsets found - pass --gearsets DIR (the Lisbeth Debug folder)", file=sys.stderr)
+        return 2
+
+    client = WranglerClient()
+    candidates = [i for i in instances if i.enabled]
+    statuses = fetch_statuses(client, candidates)
+    characters = placement.characters_for(statuses)
+    ranked = placement.rank(orders, characters)
+    by_key = {i.key: i for i in candidates}
+
+    for key, margin in ranked:
+        status = statuses.get(key)
+        gear = characters.get(key)
+        who = gear.key if gear else "no gearset data"
+        state = status.state if status and status.reachable else "unreachable"
+        print(f"{by_key[key].name:<20}  {who:<30}  x{margin:.2f} headroom  {state}")
+    for key, reason in placement.blocked(orders, characters).items():
+        print(f"{by_key[key].name:<20}  cannot craft: {reason}")
+
+    if not args.run:
+        client.close()
+        return 0 if ranked else 1
+
+    for key, _ in ranked:
+        status = statuses.get(key)
+        if (status and status.reachable and status.state == "idle"
+                and not status.has_pending_order and not status.has_incomplete_orders):
+            success, message = client.run_order(by_key[key], json_path=path)
+            print(f"Started on {by_key[key].name}: {message}" if success else f"Failed on {by_key[key].name}: {message}")
+            client.close()
+            return 0 if success else 1
+
+    print("No idle instance can craft this order", file=sys.stderr)
+    client.close()
+    return 1
+
+
+# =============================================================================
+# Daemon
+# =============================================================================
+
+def cmd_daemon(args, instances, json_path) -> int:
+    client = WranglerClient()
+    poller = FleetPoller(lambda i: client.get_status(i, conditional=True))
+    scheduler = PollScheduler()
+    last_state = {}
+    stop_event = threading.Event()
+    throttle = make_throttle(args, client)
+    config_writer = ConfigWriter(args.config, on_error=lambda error: logger.error(f"Failed to save config: {error}"))
+    telemetry = TelemetryStore(args.config.parent / TELEMETRY_FILENAME, on_error=logger.error)
+    client.on_command = lambda i, *outcome: telemetry.record_command(i.key, *outcome)
+
+    def save_queues(instance: WranglerInstance):
+        config_writer.save(instances, json_path)
+
+    queue = OrderQueueManager(client, on_message=logger.info, on_change=save_queues,
+                              throttle=throttle, poll_soon=scheduler.poll_soon)
+
+    def apply_status(instance: WranglerInstance, status: InstanceStatus, pushed: bool = False):
+        telemetry.record_status(instance.key, status, pushed)
+        scheduler.record(instance.key, status, pushed)
+        queue.on_status(instance, status)
+        if status.not_modified:
+            return
+        state = status.state if status.reachable else f"unreachable ({status.error})"
+        previous = last_state.get(instance.key)
+        if state != previous:
+            last_state[instance.key] = state
+            logger.info(f"{instance.name}: {previous or 'unknown'} -> {state}")
+
+    streams = StatusStreamManager(
+        client,
+        on_status=lambda i, s: apply_status(i, s, pushed=True),
+        on_disconnect=lambda i: scheduler.poll_soon(i.key)
+    )
+    runs = AdvancedRunManager(
+        client,
+        get_json_path=lambda: json_path,
+        on_message=logger.info,
+        on_status=apply_status,
+        journal=RunJournal(args.config.parent / JOURNAL_FILENAME),
+        throttle=throttle,
+        on_transition=telemetry.record_transition
+    )
+
+    # Restore journaled runs first, then re-activate saved advanced run modes
+    restored = set(runs.recover(instances))
+    for instance in instances:
+        if not instance.enabled or instance.key in restored:
+            continue
+        config = instance.get_advanced_config()
+        if config.mode == "schedule":
+            runs.start_schedule(instance, config)
+        elif config.mode == "timer" and args.start_timers:
+            runs.start_timer(instance, config)
+
+    def request_stop(signum, frame):
+        logger.info("Shutting down...")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    streams.sync(instances)
+    logger.info(f"Daemon running for {sum(1 for i in instances if i.enabled)} instance(s)")
+
+    while not stop_event.is_set():
+        due = scheduler.due(instances)
+        if due:
+            poller.submit(due, apply_status)
+
+        wait = scheduler.seconds_until_next(instances)
+        stop_event.wait(min(max(wait, 0.1), 1.0))
+
+    runs.shutdown()
+    streams.stop_all()
+    poller.shutdown()
+    client.close()
+    config_writer.flush()
+    telemetry.close()
+    return 0
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+def format_hours(seconds: float) -> str:
+    return f"{seconds / 3600:.1f}h"
+
+
+def cmd_report(args, instances, json_path) -> int:
+    path = args.config.parent / TELEMETRY_FILENAME
+    if not path.exists():
+        print(f"No telemetry recorded yet: {path}", file=sys.stderr)
+        return 2
+
+    store = TelemetryStore(path)
+    store.flush(maintain=True)  # Roll up everything up to a few minutes ago
+    since = time.time() - args.days * 86400
+    uptime = store.uptime(since)
+    outages = store.outages(since, character=args.character)
+    commands = store.command_stats(since)
+    store.close()
+
+    wanted = args.character.lower() if args.character else None
+    uptime = [row for row in uptime if wanted is None or (row["character"] or "").lower() == wanted]
+    names = [f"{row['character']} ({row['world']})" if row["character"] else "(no character)" for row in uptime]
+    name_width = max([len("Character")] + [len(name) for name in names])
+
+    print(f"Last {args.days:g} day(s)")
+    print(f"{'Character':<{name_width}}  {'Observed':>8}  {'Reachable':>9}  {'Executing':>9}  {'Busy':>5}  Latency")
+    for name, row in zip(names, uptime):
+        busy = row["executing"] / row["observed"] if row["observed"] else 0.0
+        reachable = row["reachable"] / row["observed"] if row["observed"] else 0.0
+        latency = f"{row['latency'] * 1000:.0f} ms" if row["latency"] is not None else "-"
+        print(f"{name:<{name_width}}  {format_hours(row['observed']):>8}  {reachable:>9.1%}  "
+              f"{format_hours(row['executing']):>9}  {busy:>5.0%}  {latency}")
+
+    print()
+    print("Went unreachable:")
+    for row in outages:
+        name = f"{row['character']} ({row['world']})" if row["character"] else "(no character)"
+        print(f"  {name}: {row['count']}x, last {time.strftime('%Y-%m-%d %H:%M', time.localtime(row['last']))}")
+    if not outages:
+        print("  never")
+
+    if commands and wanted is None:
+        print()
+        print("Commands:")
+        for row in commands:
+            print(f"  {row['command']:<7} {row['count']:>6} sent, {row['failures']} failed, "
+                  f"avg {row['latency'] * 1000:.0f} ms")
+    return 0
+
+
+# =============================================================================
+# Entry Point
+# =============================================================================
+
+COMMANDS = {
+    "status": cmd_status,
+    "start-all": cmd_start_all,
+    "stop-all": cmd_stop_all,
+    "resume-all": cmd_resume_all,
+    "shard": cmd_shard,
+    "place": cmd_place,
+    "daemon": cmd_daemon,
+    "report": cmd_report,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="wrangler_cli",
+        description="Headless control of Wrangler instances"
+    )
+    parser.add_argument("--config", type=Path, default=get_config_dir() / CONFIG_FILENAME,
+                        help=f"path to {CONFIG_FILENAME} (default: next to this script)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rollout = argparse.ArgumentParser(add_help=False)
+    rollout.add_argument("--per-host", type=int, default=ROLLOUT_MAX_PER_HOST, metavar="N",
+                         help=f"instances starting at once per host (default: {ROLLOUT_MAX_PER_HOST})")
+    rollout.add_argument("--spacing", type=float, default=ROLLOUT_MIN_SPACING, metavar="SECONDS",
+                         help=f"seconds between starts on one host (default: {ROLLOUT_MIN_SPACING:g})")
+    rollout.add_argument("--no-ramp", action="store_true",
+                         help="do not wait for each start to reach executing before the next")
+
+    status = sub.add_parser("status", help="show the status of every enabled instance")
+    status.add_argument("--json", action="store_true", help="print machine-readable JSON")
+
+    gearsets = argparse.ArgumentParser(add_help=False)
+    gearsets.add_argument("--gearsets", type=Path, metavar="DIR",
+                          help="Lisbeth Debug folder with <Character>_<World>/Gearsets (default: Lisbeth/Debug)")
+
+    start = sub.add_parser("start-all", parents=[rollout, gearsets],
+                           help="run an order JSON on every enabled instance whose gear can craft it")
+    start.add_argument("--json-path", help="order file (default: the GUI's default JSON)")
+
+    sub.add_parser("stop-all", help="stop every enabled instance gently")
+    sub.add_parser("resume-all", parents=[rollout], help="resume incomplete orders on every enabled instance")
+
+    shard = sub.add_parser("shard", parents=[rollout, gearsets],
+                           help="split one order across the enabled instances by estimated work")
+    shard.add_argument("--json-path", help="order file (default: the GUI's default JSON)")
+    shard.add_argument("--per-instance", type=int, default=SHARDS_PER_INSTANCE, metavar="N",
+                       help=f"shards per instance; extras go to whoever finishes first (default: {SHARDS_PER_INSTANCE})")
+    shard.add_argument("--dry-run", action="store_true", help="print the plan without starting anything")
+
+    place = sub.add_parser("place", parents=[gearsets],
+                           help="rank instances by how well their gear fits an order")
+    place.add_argument("--json-path", help="order file (default: the GUI's default JSON)")
+    place.add_argument("--run", action="store_true", help="start the order on the best idle instance")
+
+    daemon = sub.add_parser("daemon", parents=[rollout],
+                            help="poll the fleet and run saved schedules until interrupted")
+    daemon.add_argument("--start-timers", action="store_true",
+                        help="also start instances whose saved mode is timer")
+
+    report = sub.add_parser("report", help="summarize the recorded telemetry: uptime, outages, commands")
+    report.add_argument("--days", type=float, default=7, metavar="N", help="days to look back (default: 7)")
+    report.add_argument("--character", metavar="NAME", help="only this character (case-insensitive)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    try:
+        instances, json_path = load_config(args.config)
+    except FileNotFoundError:
+        print(f"Config not found: {args.config}", file=sys.stderr)
+        return 2
+    except (ValueError, TypeError) as e:
+        print(f"Invalid config {args.config}: {e}", file=sys.stderr)
+        return 2
+
+    return COMMANDS[args.command](args, instances, json_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1204 @@
+#!/usr/bin/env python3
+"""
+Wrangler Master Core
+====================
+
+GUI-free building blocks shared by the Wrangler Master frontends
+(wrangler_master.py and wrangler_master_flet.py).
+
+Contents:
+- Instance / status data classes
+- WranglerClient HTTP API client
+- FleetPoller for concurrent status polling
+- PollScheduler for adaptive per-instance poll intervals
+- CircuitBreaker for fast-failing unreachable instances
+- BulkDispatcher for concurrent Start/Stop/Resume All
+- StartThrottle for staggered, per-host rate-limited starts
+- StatusStreamManager for server-pushed status (/events)
+- DeadlineScheduler for timer/schedule deadlines on a single thread
+- load_config / save_config for wrangler_config.json, and ConfigWriter
+  for debounced background saves
+
+Nothing in this module may import a GUI toolkit. `requests` is imported
+when the first WranglerClient is created, so importing this module stays
+cheap for the headless CLI.
+"""
+
+import functools
+import heapq
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field, asdict, replace
+from typing import Optional, List, Dict, Callable, Iterable, Tuple
+
+# Loaded by _load_requests() - importing requests costs more than the rest of
+# this module combined
+requests = None
+HTTPAdapter = None
+
+
+def _load_requests():
+    """Imports requests on first use, exiting with a hint if it is missing."""
+    global requests, HTTPAdapter
+    if requests is None:
+        try:
+            import requests as requests_module
+            from requests.adapters import HTTPAdapter as adapter_class
+        except ImportError:
+            print("ERROR: 'requests' library is required.")
+            print("Install it with: pip install requests")
+            sys.exit(1)
+        requests, HTTPAdapter = requests_module, adapter_class
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+REQUEST_TIMEOUT = 5  # seconds
+MAX_PARALLEL_REQUESTS = 32  # Upper bound on simultaneous status requests
+MAX_PARALLEL_COMMANDS = 16  # Upper bound on simultaneous bulk commands
+CONNECTIONS_PER_HOST = 4  # Keep-alive connections pooled per instance
+
+# Adaptive polling (seconds)
+POLL_INTERVAL_ACTIVE = 2.0  # pending / executing - catch transitions quickly
+POLL_INTERVAL_DEFAULT = 10.0  # unknown states
+POLL_INTERVAL_IDLE = 30.0  # idle / stopped
+POLL_BACKOFF_BASE = 5.0  # first retry delay while unreachable
+POLL_BACKOFF_MAX = 120.0  # cap for the unreachable backoff
+POLL_JITTER = 0.2  # +/- fraction applied to backoff delays
+
+# Circuit breaker
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive connection failures before tripping
+BREAKER_RESET_TIMEOUT = 30.0  # seconds to stay open before a /health probe
+BREAKER_PROBE_TIMEOUT = 1.5  # seconds allowed for the half-open /health probe
+
+# Server-pushed status (/events)
+STREAM_READ_TIMEOUT = 15.0  # seconds without an event before the stream counts as dead
+STREAM_RECONNECT_DELAY = 10.0  # seconds before re-subscribing after a dropped stream
+STREAM_POLL_FALLBACK = 60.0  # safety poll interval while a stream is live
+
+# Deadline scheduler
+DEADLINE_MAX_SLEEP = 60.0  # re-check the wall clock at least this often (clock changes, sleep)
+
+# Staggered rollout
+ROLLOUT_MAX_PER_HOST = 2  # instances starting at once on one host
+ROLLOUT_MIN_SPACING = 5.0  # seconds between starts on the same host
+ROLLOUT_RAMP_TIMEOUT = 90.0  # longest a start holds its host slot waiting for "executing"
+ROLLOUT_RAMP_POLL = 1.0  # seconds between /status checks while ramping
+
+# Config saving
+CONFIG_SAVE_DELAY = 0.5  # seconds a change waits for more changes before the config is written
+CONFIG_SAVE_MAX_DELAY = 2.0  # longest a change waits while changes keep coming
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+@dataclass
+class AdvancedRunConfig:
+    """Configuration for advanced run modes."""
+    mode: str = "none"  # "none", "timer", or "schedule"
+    timer_hours: int = 0
+    timer_minutes: int = 30
+    schedule_start_hour: int = 8
+    schedule_start_minute: int = 0
+    schedule_end_hour: int = 22
+    schedule_end_minute: int = 0
+    schedule_days: int = 0x7F  # Days the window starts on: bit 0 = Monday ... bit 6 = Sunday
+    schedule_extra_windows: str = ""  # More windows, e.g. "Sat,Sun 10:00-02:00; 18:00-20:00"
+    schedule_timezone: str = ""  # IANA time zone name; empty = local time
+    schedule_eorzea: bool = False  # Window times are Eorzea time (days and time zone ignored)
+    use_resume: bool = False  # If True, resume orders; if False, run new orders
+
+
+@dataclass
+class WranglerInstance:
+    """Represents a Wrangler instance configuration."""
+    name: str
+    host: str
+    port: int
+    enabled: bool = True
+    go_home_after_session: bool = False  # Go to Lisbeth home after timer/schedule ends
+    advanced_config: Optional[dict] = None  # Persisted AdvancedRunConfig as dict
+    order_queue: List[str] = field(default_factory=list)  # Order files to run next (see wrangler_queue)
+    queue_paused: bool = False  # Stop dispatching from order_queue
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def key(self) -> str:
+        """Unique key used to index panels, timers and schedules."""
+        return f"{self.host}:{self.port}"
+
+    def get_advanced_config(self) -> AdvancedRunConfig:
+        """Returns the advanced config, creating default if none exists."""
+        if self.advanced_config is None:
+            return AdvancedRunConfig()
+        return AdvancedRunConfig(**self.advanced_config)
+
+    def set_advanced_config(self, config: AdvancedRunConfig):
+        """Saves the advanced config."""
+        self.advanced_config = asdict(config)
+
+
+@dataclass
+class InstanceStatus:
+    """Current status of a Wrangler instance."""
+    state: str = "unknown"
+    is_executing: bool = False
+    has_pending_order: bool = False
+    has_incomplete_orders: bool = False
+    current_file: str = "None"
+    api_status: str = "Unknown"
+    bot_running: bool = False
+    reachable: bool = False
+    error: Optional[str] = None
+    character_name: str = "Unknown"
+    world_name: str = "Unknown"
+    runtime_seconds: int = 0
+    breaker_state: str = "closed"  # "closed", "open" or "half_open"
+    version: int = 0  # RemoteServer's status version (0 if not reported)
+    not_modified: bool = False  # True when /status answered 304 - nothing to redraw
+    fetched_at: float = 0.0  # time.monotonic() when the request was sent (or the push arrived)
+    latency: float = 0.0  # seconds the /status request took (0 for pushed statuses)
+
+
+def load_config(path) -> Tuple[List[WranglerInstance], str]:
+    """Reads wrangler_config.json; returns (instances, default_json_path)."""
+    with open(path, "r") as f:
+        config = json.load(f)
+    instances = [WranglerInstance(**data) for data in config.get("instances", [])]
+    return instances, config.get("default_json_path", "")
+
+
+def write_json_atomic(path, data):
+    """Writes a JSON file via a temporary file renamed over it, so a crash never leaves it truncated."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def save_config(path, instances: Iterable[WranglerInstance], default_json_path: str):
+    """Writes wrangler_config.json (atomically)."""
+    config = {
+        "instances": [asdict(i) for i in instances],
+        "default_json_path": default_json_path
+    }
+    write_json_atomic(path, config)
+
+
+class ConfigWriter:
+    """Saves wrangler_config.json from a background thread, one write per burst of changes.
+
+    save() only notes the latest instances and returns at once. The writer
+    thread waits until no change has come for CONFIG_SAVE_DELAY (at most
+    CONFIG_SAVE_MAX_DELAY after the first one) and writes the newest
+    state, so toggling a checkbox a hundred times costs a write or two.
+    Call flush() before exiting so nothing pending is lost.
+    """
+
+    def __init__(self, path, on_error: Optional[Callable[[Exception], None]] = None,
+                 delay: float = CONFIG_SAVE_DELAY, max_delay: float = CONFIG_SAVE_MAX_DELAY):
+        self.path = path
+        self.on_error = on_error
+        self.delay = delay
+        self.max_delay = max_delay
+        self.writes = 0  # config files written
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[List[WranglerInstance], str]] = None
+        self._first = 0.0  # when the oldest unwritten change came in
+        self._due = 0.0
+        self._writing = False
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def save(self, instances: Iterable[WranglerInstance], default_json_path: str):
+        """Schedules a write of this configuration (replacing any write not started yet)."""
+        now = time.monotonic()
+        with self._cond:
+            if self._pending is None:
+                self._first = now
+            self._pending = (list(instances), default_json_path)
+            self._due = min(now + self.delay, self._first + self.max_delay)
+            self._cond.notify()
+
+    def flush(self, timeout: float = 10.0):
+        """Writes any pending change now and waits until it is on disk."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._due = 0.0
+            self._cond.notify_all()
+            while self._pending is not None or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None or time.monotonic() < self._due:
+                    self._cond.wait(None if self._pending is None else self._due - time.monotonic())
+                (instances, default_json_path), self._pending = self._pending, None
+                self._writing = True
+            try:
+                save_config(self.path, instances, default_json_path)
+                self.writes += 1
+            except Exception as e:
+                if self.on_error:
+                    self.on_error(e)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+
+# =============================================================================
+# Circuit Breaker
+# =============================================================================
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to an instance whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker.
+
+    closed    - requests flow normally; connection failures are counted
+    open      - requests fail immediately until reset_timeout has passed
+    half_open - one caller probes /health; success closes the circuit,
+                failure re-opens it for another reset_timeout
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Returns True if a normal request may be sent."""
+        with self._lock:
+            return self.state == self.CLOSED
+
+    def acquire_probe(self) -> bool:
+        """Moves an expired open circuit to half-open; True if the caller should probe."""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+# =============================================================================
+# API Client
+# =============================================================================
+
+def _reports_command(command: str):
+    """Decorates a WranglerClient command method to pass its outcome to on_command."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, instance: WranglerInstance, *args, **kwargs) -> Tuple[bool, str]:
+            start = time.perf_counter()
+            success, message = method(self, instance, *args, **kwargs)
+            if self.on_command is not None:
+                self.on_command(instance, command, success, message, time.perf_counter() - start)
+            return success, message
+        return wrapper
+    return decorate
+
+
+class WranglerClient:
+    """HTTP client for communicating with Wrangler instances.
+
+    Each instance (host:port) gets its own requests.Session with a small
+    keep-alive connection pool, so repeated polls reuse an open TCP
+    connection instead of paying for a new handshake on every call.
+
+    Every request goes through the instance's CircuitBreaker: after repeated
+    connection failures or timeouts, calls fail immediately with
+    CircuitOpenError until a /health probe succeeds.
+
+    get_status(conditional=True) sends the ETag of the last conditional
+    fetch as If-None-Match; a 304 returns a copy of that status flagged
+    not_modified so callers can skip redrawing. Only the poll loop feeding
+    the UI fetches conditionally: a 304 means "unchanged since you last
+    saw it", which is only true for the caller that saw it.
+
+    on_command, if set, is called after every command (run, stop, resume,
+    home) with (instance, command, success, message, seconds taken), on the
+    thread that sent it.
+    """
+
+    def __init__(self, pool_size: int = CONNECTIONS_PER_HOST):
+        _load_requests()
+        self.pool_size = pool_size
+        self.on_command: Optional[Callable[[WranglerInstance, str, bool, str, float], None]] = None
+        self._sessions: Dict[str, "requests.Session"] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._etags: Dict[str, Tuple[str, InstanceStatus]] = {}
+        self._lock = threading.Lock()
+
+    def _session(self, instance: WranglerInstance) -> "requests.Session":
+        """Returns the pooled session for an instance, creating it on first use."""
+        key = instance.key
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                # Instances live on the LAN; skip per-request proxy lookups
+                session.trust_env = False
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def _breaker(self, instance: WranglerInstance) -> CircuitBreaker:
+        """Returns the circuit breaker for an instance, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(instance.key)
+            if breaker is None:
+                breaker = self._breakers[instance.key] = CircuitBreaker()
+            return breaker
+
+    def breaker_state(self, instance: WranglerInstance) -> str:
+        """Returns "closed", "open" or "half_open" for an instance."""
+        return self._breaker(instance).state
+
+    def _probe(self, instance: WranglerInstance, breaker: CircuitBreaker) -> bool:
+        """Half-open probe: one cheap /health request decides whether to re-admit."""
+        try:
+            response = self._session(instance).get(
+                f"{instance.base_url}/health",
+                timeout=BREAKER_PROBE_TIMEOUT
+            )
+            healthy = response.status_code == 200 and response.text.strip() == "ok"
+        except Exception:
+            healthy = False
+
+        if healthy:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return healthy
+
+    def _request(self, instance: WranglerInstance, method: str, path: str,
+                 **kwargs) -> "requests.Response":
+        """Sends a request through the instance's session and circuit breaker."""
+        breaker = self._breaker(instance)
+        if not breaker.allow_request():
+            if not breaker.acquire_probe():
+                raise CircuitOpenError(f"Circuit open (retry in {breaker.retry_in():.0f}s)")
+            if not self._probe(instance, breaker):
+                raise CircuitOpenError("Circuit open (health probe failed)")
+
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        try:
+            response = self._session(instance).request(
+                method,
+                f"{instance.base_url}{path}",
+                **kwargs
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            breaker.record_failure()
+            raise
+
+        breaker.record_success()
+        return response
+
+    def forget(self, instance: WranglerInstance):
+        """Closes and drops the pooled session for a removed instance."""
+        with self._lock:
+            session = self._sessions.pop(instance.key, None)
+            self._breakers.pop(instance.key, None)
+            self._etags.pop(instance.key, None)
+        if session:
+            session.close()
+
+    def invalidate(self):
+        """Drops cached ETags so the next get_status returns a full status."""
+        with self._lock:
+            self._etags.clear()
+
+    def close(self):
+        """Closes every pooled session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def get_status(self, instance: WranglerInstance, conditional: bool = False) -> InstanceStatus:
+        """Fetches the current status from a Wrangler instance.
+
+        With conditional=True the request may come back as a 304 (see the
+        class docstring); otherwise the status is always complete and the
+        ETag cache is left alone.
+        """
+        status = InstanceStatus(fetched_at=time.monotonic())
+        cached = self._etags.pop(instance.key, None) if conditional else None
+
+        try:
+            headers = {"If-None-Match": cached[0]} if cached else None
+            response = self._request(instance, "GET", "/status", headers=headers)
+
+            if response.status_code == 304 and cached:
+                status = replace(cached[1], not_modified=True, fetched_at=status.fetched_at)
+                self._etags[instance.key] = cached
+            elif response.status_code == 200:
+                self._parse_status(response.json(), status)
+                etag = response.headers.get("ETag")
+                if etag and conditional:
+                    self._etags[instance.key] = (etag, status)
+            else:
+                status.error = f"HTTP {response.status_code}"
+                status.reachable = False
+
+        except requests.exceptions.ConnectionError:
+            status.error = "Connection refused"
+            status.reachable = False
+        except requests.exceptions.Timeout:
+            status.error = "Timeout"
+            status.reachable = False
+        except Exception as e:
+            status.error = str(e)
+            status.reachable = False
+
+        status.breaker_state = self.breaker_state(instance)
+        status.latency = time.monotonic() - status.fetched_at
+        return status
+
+    @staticmethod
+    def _parse_status(data: dict, status: InstanceStatus) -> InstanceStatus:
+        """Fills a status from a /status (or /events) JSON payload."""
+        status.state = data.get("state", "unknown")
+        status.is_executing = data.get("isExecuting", False)
+        status.has_pending_order = data.get("hasPendingOrder", False)
+        status.has_incomplete_orders = data.get("hasIncompleteOrders", False)
+        status.current_file = data.get("currentFile", "None")
+        status.api_status = data.get("apiStatus", "Unknown")
+        status.bot_running = data.get("botRunning", False)
+        status.character_name = data.get("characterName", "Unknown")
+        status.world_name = data.get("worldName", "Unknown")
+        status.runtime_seconds = data.get("runtimeSeconds", 0)
+        status.version = data.get("version", 0)
+        status.reachable = True
+        return status
+
+    def stream_status(self, instance: WranglerInstance,
+                      on_status: Callable[[InstanceStatus], None],
+                      stop_event: threading.Event) -> bool:
+        """Subscribes to /events and calls on_status for every pushed status.
+
+        Blocks until the stream ends, stop_event is set or the connection
+        fails. Returns False if the instance does not serve /events (an older
+        RemoteServer), True otherwise. Connection errors are raised.
+        """
+        response = self._request(
+            instance, "GET", "/events",
+            stream=True,
+            timeout=(REQUEST_TIMEOUT, STREAM_READ_TIMEOUT),
+            headers={"Accept": "text/event-stream"}
+        )
+        with response:
+            if response.status_code == 404:
+                return False
+            if response.status_code != 200:
+                raise requests.exceptions.ConnectionError(f"HTTP {response.status_code}")
+
+            data_lines: List[str] = []
+            # chunk_size=None yields each chunk as it arrives instead of
+            # waiting for a full buffer; every event is sent as one chunk
+            for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                if stop_event.is_set():
+                    break
+                if line.startswith("data:"):
+                    data_lines.append(line[5:].strip())
+                elif not line and data_lines:
+                    payload, data_lines = "\n".join(data_lines), []
+                    status = self._parse_status(json.loads(payload), InstanceStatus(fetched_at=time.monotonic()))
+                    status.breaker_state = self.breaker_state(instance)
+                    on_status(status)
+        return True
+
+    def health_check(self, instance: WranglerInstance) -> bool:
+        """Quick health check to see if instance is reachable."""
+        try:
+            response = self._request(instance, "GET", "/health")
+            return response.status_code == 200 and response.text.strip() == "ok"
+        except:
+            return False
+
+    @_reports_command("run")
+    def run_order(self, instance: WranglerInstance, json_path: Optional[str] = None,
+                  json_content: Optional[str] = None) -> tuple[bool, str]:
+        """Sends a run command to a Wrangler instance."""
+        try:
+            if json_path:
+                payload = {"jsonPath": json_path}
+            elif json_content:
+                payload = {"json": json_content}
+            else:
+                return False, "Must provide jsonPath or json content"
+
+            response = self._request(instance, "POST", "/run", json=payload)
+
+            data = response.json()
+            success = data.get("success", False)
+            message = data.get("message", data.get("error", "Unknown response"))
+            return success, message
+
+        except requests.exceptions.ConnectionError:
+            return False, "Connection refused"
+        except requests.exceptions.Timeout:
+            return False, "Request timeout"
+        except Exception as e:
+            return False, str(e)
+
+    @_reports_command("stop")
+    def stop_gently(self, instance: WranglerInstance) -> tuple[bool, str]:
+        """Sends a stop gently command to a Wrangler instance."""
+        try:
+            response = self._request(instance, "POST", "/stop")
+
+            data = response.json()
+            success = data.get("success", False)
+            message = data.get("message", data.get("error", "Unknown response"))
+            return success, message
+
+        except requests.exceptions.ConnectionError:
+            return False, "Connection refused"
+        except requests.exceptions.Timeout:
+            return False, "Request timeout"
+        except Exception as e:
+            return False, str(e)
+
+    @_reports_command("resume")
+    def resume_orders(self, instance: WranglerInstance) -> tuple[bool, str]:
+        """Sends a resume command to resume incomplete orders."""
+        try:
+            response = self._request(instance, "POST", "/resume")
+
+            data = response.json()
+            success = data.get("success", False)
+            message = data.get("message", data.get("error", "Unknown response"))
+            return success, message
+
+        except requests.exceptions.ConnectionError:
+            return False, "Connection refused"
+        except requests.exceptions.Timeout:
+            return False, "Request timeout"
+        except Exception as e:
+            return False, str(e)
+
+    @_reports_command("home")
+    def go_home(self, instance: WranglerInstance) -> tuple[bool, str]:
+        """Sends a go home command to navigate to Lisbeth's configured home location."""
+        try:
+            response = self._request(instance, "POST", "/gohome")
+
+            data = response.json()
+            success = data.get("success", False)
+            message = data.get("message", data.get("error", "Unknown response"))
+            return success, message
+
+        except requests.exceptions.ConnectionError:
+            return False, "Connection refused"
+        except requests.exceptions.Timeout:
+            return False, "Request timeout"
+        except Exception as e:
+            return False, str(e)
+
+
+# =============================================================================
+# Fleet Poller
+# =============================================================================
+
+class FleetPoller:
+    """Fetches the status of many instances concurrently.
+
+    Requests are fanned out over a bounded thread pool, so a sweep takes
+    roughly one REQUEST_TIMEOUT no matter how many instances are offline.
+    Instances that have not answered by the deadline are reported as timed
+    out instead of holding up the rest of the snapshot.
+    """
+
+    # Extra time allowed on top of the request timeout before giving up
+    DEADLINE_GRACE = 1.0
+
+    def __init__(self, fetch: Callable[[WranglerInstance], InstanceStatus] = None,
+                 max_workers: int = MAX_PARALLEL_REQUESTS,
+                 timeout: float = REQUEST_TIMEOUT):
+        self._fetch = fetch or WranglerClient().get_status
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="wrangler-poll"
+        )
+        self._in_flight: set = set()  # Keys with a submit() poll outstanding
+        self._lock = threading.Lock()
+
+    def poll(self, instances: Iterable[WranglerInstance]) -> Dict[str, InstanceStatus]:
+        """Polls every enabled instance and returns a snapshot keyed by host:port."""
+        targets = [i for i in instances if i.enabled]
+        if not targets:
+            return {}
+
+        futures = {
+            self._executor.submit(self._fetch, instance): instance
+            for instance in targets
+        }
+
+        done, not_done = wait(futures, timeout=self.timeout + self.DEADLINE_GRACE)
+
+        snapshot: Dict[str, InstanceStatus] = {}
+        for future, instance in futures.items():
+            if future in done:
+                try:
+                    snapshot[instance.key] = future.result()
+                except Exception as e:
+                    snapshot[instance.key] = InstanceStatus(error=str(e))
+            else:
+                # Drop requests still waiting for a worker; running ones finish on their own
+                future.cancel()
+                snapshot[instance.key] = InstanceStatus(error="Timeout")
+
+        return snapshot
+
+    def submit(self, instances: Iterable[WranglerInstance],
+               on_status: Callable[[WranglerInstance, InstanceStatus], None]) -> int:
+        """Starts polling every enabled instance and returns without waiting.
+
+        on_status(instance, status) is called from a pool thread as each answer
+        arrives, so one slow instance never holds back the others. Instances
+        whose previous request is still in flight are skipped. Returns the
+        number of polls started.
+        """
+        started = 0
+        for instance in instances:
+            if not instance.enabled:
+                continue
+            with self._lock:
+                if instance.key in self._in_flight:
+                    continue
+                self._in_flight.add(instance.key)
+            try:
+                future = self._executor.submit(self._fetch, instance)
+            except RuntimeError:
+                # The pool was shut down under us
+                with self._lock:
+                    self._in_flight.discard(instance.key)
+                break
+            future.add_done_callback(functools.partial(self._finish, instance, on_status))
+            started += 1
+        return started
+
+    def _finish(self, instance: WranglerInstance,
+                on_status: Callable[[WranglerInstance, InstanceStatus], None], future):
+        """Hands a submitted poll's result (or error) to its callback."""
+        with self._lock:
+            self._in_flight.discard(instance.key)
+        if future.cancelled():
+            return
+        try:
+            status = future.result()
+        except Exception as e:
+            status = InstanceStatus(error=str(e))
+        on_status(instance, status)
+
+    def shutdown(self):
+        """Stops the worker pool without waiting for in-flight requests."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# =============================================================================
+# Poll Scheduler
+# =============================================================================
+
+class PollScheduler:
+    """Tracks when each instance is next due for a status poll.
+
+    The interval is picked from the last status seen for the instance:
+    fast while pending or executing, slow while idle or stopped, and an
+    exponential backoff with jitter while it is unreachable.
+    """
+
+    def __init__(self):
+        self._next_due: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def interval_for(self, key: str, status: InstanceStatus) -> float:
+        """Returns the delay before the next poll, given the latest status."""
+        if not status.reachable:
+            failures = self._failures.get(key, 0)
+            delay = min(POLL_BACKOFF_MAX, POLL_BACKOFF_BASE * (2 ** max(0, failures - 1)))
+            return delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+        if status.state in ("pending", "executing"):
+            return POLL_INTERVAL_ACTIVE
+        if status.state in ("idle", "stopped"):
+            return POLL_INTERVAL_IDLE
+        return POLL_INTERVAL_DEFAULT
+
+    def record(self, key: str, status: InstanceStatus, pushed: bool = False):
+        """Records a fresh status and schedules the instance's next poll.
+
+        Pushed statuses come from a live /events stream, so polling backs off
+        to a slow safety interval until the stream drops.
+        """
+        with self._lock:
+            if status.reachable:
+                self._failures.pop(key, None)
+            else:
+                self._failures[key] = self._failures.get(key, 0) + 1
+            interval = STREAM_POLL_FALLBACK if pushed else self.interval_for(key, status)
+            self._next_due[key] = time.monotonic() + interval
+
+    def due(self, instances: Iterable[WranglerInstance]) -> List[WranglerInstance]:
+        """Returns the enabled instances whose poll is due and reserves them.
+
+        Reserved instances are not handed out again until their status is
+        recorded (or the request timeout passes), so slow polls never overlap.
+        """
+        now = time.monotonic()
+        result = []
+        with self._lock:
+            for instance in instances:
+                if not instance.enabled:
+                    continue
+                if self._next_due.get(instance.key, 0.0) <= now:
+                    self._next_due[instance.key] = now + REQUEST_TIMEOUT * 2
+                    result.append(instance)
+        return result
+
+    def seconds_until_next(self, instances: Iterable[WranglerInstance]) -> float:
+        """Returns how long until the earliest enabled instance is due."""
+        now = time.monotonic()
+        with self._lock:
+            due_times = [
+                self._next_due.get(instance.key, 0.0)
+                for instance in instances if instance.enabled
+            ]
+        if not due_times:
+            return POLL_INTERVAL_DEFAULT
+        return max(0.0, min(due_times) - now)
+
+    def poll_soon(self, key: str):
+        """Makes an instance due immediately (e.g. after sending it a command)."""
+        with self._lock:
+            self._next_due[key] = 0.0
+
+    def forget(self, key: str):
+        """Drops all scheduling state for a removed instance."""
+        with self._lock:
+            self._next_due.pop(key, None)
+            self._failures.pop(key, None)
+
+
+# =============================================================================
+# Bulk Dispatcher
+# =============================================================================
+
+@dataclass
+class DispatchResult:
+    """Outcome of one command sent as part of a bulk action."""
+    instance: WranglerInstance
+    success: bool
+    message: str
+    latency: float  # seconds
+    skipped: bool = False
+
+
+class BulkDispatcher:
+    """Sends one command to many instances concurrently.
+
+    The action is called once per enabled instance on a bounded worker pool
+    and returns (success, message); returning None for success marks the
+    instance as skipped. on_result is called from the worker thread as each
+    result arrives, so callers can stream progress.
+    """
+
+    def __init__(self, max_workers: int = MAX_PARALLEL_COMMANDS):
+        self.max_workers = max(1, max_workers)
+
+    def dispatch(self, instances: Iterable[WranglerInstance],
+                 action: Callable[[WranglerInstance], Tuple[Optional[bool], str]],
+                 on_result: Callable[[DispatchResult, List[DispatchResult], int], None] = None
+                 ) -> List[DispatchResult]:
+        """Runs action on every enabled instance; returns results in instance order."""
+        targets = [i for i in instances if i.enabled]
+        if not targets:
+            return []
+
+        def run(instance: WranglerInstance) -> DispatchResult:
+            start = time.perf_counter()
+            try:
+                success, message = action(instance)
+            except Exception as e:
+                success, message = False, str(e)
+            latency = time.perf_counter() - start
+            if success is None:
+                return DispatchResult(instance, False, message, latency, skipped=True)
+            return DispatchResult(instance, bool(success), message, latency)
+
+        completed: List[DispatchResult] = []
+        workers = min(self.max_workers, len(targets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wrangler-bulk") as pool:
+            futures = {pool.submit(run, instance): instance for instance in targets}
+            for future in as_completed(futures):
+                result = future.result()
+                completed.append(result)
+                if on_result:
+                    try:
+                        on_result(result, list(completed), len(targets))
+                    except Exception:
+                        pass
+
+        order = {id(instance): index for index, instance in enumerate(targets)}
+        return sorted(completed, key=lambda r: order[id(r.instance)])
+
+
+def summarize_results(results: List[DispatchResult]) -> Tuple[int, int, int]:
+    """Returns (successes, failures, skipped) for a list of dispatch results."""
+    skipped = sum(1 for r in results if r.skipped)
+    successes = sum(1 for r in results if r.success)
+    return successes, len(results) - successes - skipped, skipped
+
+
+def format_results_table(results: List[DispatchResult]) -> str:
+    """Formats dispatch results as a fixed-width text table."""
+    name_width = max([len("Instance")] + [len(r.instance.name) for r in results])
+    lines = [
+        f"{'Instance':<{name_width}}  {'Result':<7}  {'Latency':>8}  Message",
+        f"{'-' * name_width}  {'-' * 7}  {'-' * 8}  {'-' * 7}",
+    ]
+    for r in results:
+        outcome = "skipped" if r.skipped else ("ok" if r.success else "FAILED")
+        lines.append(
+            f"{r.instance.name:<{name_width}}  {outcome:<7}  {r.latency * 1000:>6.0f}ms  {r.message}"
+        )
+    return "\n".join(lines)
+
+
+# =============================================================================
+# Staggered Rollout
+# =============================================================================
+
+class StartThrottle:
+    """Staggers run/resume commands so a host never starts too many clients at once.
+
+    Every RebornBuddy client on a host loads Lisbeth and builds routes when
+    it starts, so simultaneous starts spike that host's CPU. A start must
+    get one of the host's max_per_host slots and wait min_spacing seconds
+    after the host's previous start. With ramp enabled the slot is held
+    until the instance reports "executing" (or ramp_timeout passes), so the
+    next client only loads once the previous one is up.
+
+    Thread-safe; start() blocks the calling worker until it is admitted.
+    """
+
+    def __init__(self, client: "WranglerClient",
+                 max_per_host: int = ROLLOUT_MAX_PER_HOST,
+                 min_spacing: float = ROLLOUT_MIN_SPACING,
+                 ramp: bool = True,
+                 ramp_timeout: float = ROLLOUT_RAMP_TIMEOUT):
+        self.client = client
+        self.ramp_timeout = ramp_timeout
+        self._cond = threading.Condition()
+        self._hosts: Dict[str, dict] = {}  # host -> in-flight count, next allowed start, waiting queue
+        self.configure(max_per_host, min_spacing, ramp)
+
+    def configure(self, max_per_host: int, min_spacing: float, ramp: bool):
+        """Changes the limits; starts already waiting pick them up."""
+        self.max_per_host = max(1, int(max_per_host))
+        self.min_spacing = max(0.0, float(min_spacing))
+        self.ramp = ramp
+        with self._cond:
+            self._cond.notify_all()
+
+    @staticmethod
+    def order(instances: Iterable[WranglerInstance]) -> List[WranglerInstance]:
+        """Interleaves instances round-robin by host.
+
+        Dispatch workers pick instances in order, so this keeps them spread
+        over every host instead of all queueing behind the first one.
+        """
+        by_host: Dict[str, List[WranglerInstance]] = {}
+        for instance in instances:
+            by_host.setdefault(instance.host, []).append(instance)
+        queues = list(by_host.values())
+        ordered = []
+        for index in range(max((len(q) for q in queues), default=0)):
+            ordered.extend(q[index] for q in queues if index < len(q))
+        return ordered
+
+    def start(self, instance: WranglerInstance,
+              command: Callable[[WranglerInstance], Tuple[bool, str]]) -> Tuple[bool, str]:
+        """Waits for a slot on the instance's host, then runs command(instance).
+
+        Starts on one host are admitted in the order they arrive.
+        """
+        ticket = object()
+        with self._cond:
+            host = self._hosts.setdefault(instance.host, {"in_flight": 0, "next": 0.0, "queue": deque()})
+            host["queue"].append(ticket)
+            while True:
+                now = time.monotonic()
+                has_slot = host["in_flight"] < self.max_per_host
+                if has_slot and now >= host["next"] and host["queue"][0] is ticket:
+                    break
+                self._cond.wait(host["next"] - now if has_slot and now < host["next"] else None)
+            host["queue"].popleft()
+            host["in_flight"] += 1
+            host["next"] = now + self.min_spacing
+            self._cond.notify_all()  # The next in line may already be admissible
+
+        try:
+            success, message = command(instance)
+            if success and self.ramp and not self._wait_for_executing(instance):
+                message = f"{message} (not executing after {self.ramp_timeout:.0f}s)"
+            return success, message
+        finally:
+            with self._cond:
+                host["in_flight"] -= 1
+                self._cond.notify_all()
+
+    def _wait_for_executing(self, instance: WranglerInstance) -> bool:
+        """Polls until the instance executes or its order ends; False on timeout."""
+        deadline = time.monotonic() + self.ramp_timeout
+        while time.monotonic() < deadline:
+            time.sleep(ROLLOUT_RAMP_POLL)
+            status = self.client.get_status(instance)
+            if status.is_executing:
+                return True
+            if status.reachable and status.state != "pending" and not status.has_pending_order:
+                return True  # Rejected or already finished - nothing to wait for
+        return False
+
+
+# =============================================================================
+# Status Streams
+# =============================================================================
+
+class StatusStreamManager:
+    """Keeps one /events subscription open per enabled instance.
+
+    Pushed statuses are handed to on_status(instance, status). When a stream
+    drops, on_disconnect(instance) is called so the caller can fall back to
+    polling, and the subscriber reconnects after STREAM_RECONNECT_DELAY.
+    Instances that answer /events with 404 (older RemoteServer builds) are
+    left to polling for good.
+    """
+
+    def __init__(self, client: WranglerClient,
+                 on_status: Callable[[WranglerInstance, InstanceStatus], None],
+                 on_disconnect: Callable[[WranglerInstance], None] = None):
+        self.client = client
+        self.on_status = on_status
+        self.on_disconnect = on_disconnect
+        self._streams: Dict[str, Tuple[WranglerInstance, threading.Event]] = {}
+        self._live: set = set()
+        self._unsupported: set = set()
+        self._lock = threading.Lock()
+
+    def is_live(self, key: str) -> bool:
+        """Returns True while an instance's stream is delivering events."""
+        return key in self._live
+
+    def sync(self, instances: Iterable[WranglerInstance]):
+        """Starts streams for new enabled instances and stops the rest."""
+        wanted = {i.key: i for i in instances if i.enabled}
+        with self._lock:
+            for key in list(self._streams):
+                instance, stop_event = self._streams[key]
+                if wanted.get(key) is not instance:
+                    stop_event.set()
+                    del self._streams[key]
+                    self._live.discard(key)
+            for key, instance in wanted.items():
+                if key in self._streams or key in self._unsupported:
+                    continue
+                stop_event = threading.Event()
+                self._streams[key] = (instance, stop_event)
+                threading.Thread(
+                    target=self._run, args=(instance, stop_event),
+                    daemon=True, name=f"wrangler-stream-{key}"
+                ).start()
+
+    def forget(self, key: str):
+        """Stops an instance's stream and clears its unsupported flag."""
+        with self._lock:
+            entry = self._streams.pop(key, None)
+            self._live.discard(key)
+            self._unsupported.discard(key)
+        if entry:
+            entry[1].set()
+
+    def stop_all(self):
+        """Stops every stream."""
+        with self._lock:
+            entries = list(self._streams.values())
+            self._streams.clear()
+            self._live.clear()
+        for _, stop_event in entries:
+            stop_event.set()
+
+    def _run(self, instance: WranglerInstance, stop_event: threading.Event):
+        key = instance.key
+
+        def deliver(status: InstanceStatus):
+            if stop_event.is_set():
+                return
+            self._live.add(key)
+            self.on_status(instance, status)
+
+        while not stop_event.is_set():
+            try:
+                supported = self.client.stream_status(instance, deliver, stop_event)
+            except Exception:
+                supported = True
+
+            was_live = key in self._live
+            self._live.discard(key)
+            if was_live and not stop_event.is_set() and self.on_disconnect:
+                self.on_disconnect(instance)
+
+            if not supported:
+                with self._lock:
+                    self._unsupported.add(key)
+                    if self._streams.get(key, (None, None))[1] is stop_event:
+                        del self._streams[key]
+                return
+
+            stop_event.wait(STREAM_RECONNECT_DELAY)
+
+
+# =============================================================================
+# Deadline Scheduler
+# =============================================================================
+
+class DeadlineScheduler:
+    """Runs callbacks at wall-clock deadlines from one shared thread.
+
+    Deadlines live in a heap and the thread sleeps until the earliest one,
+    so any number of timers and schedules costs a single thread. Each key
+    has at most one pending deadline: scheduling a key again replaces it and
+    cancel(key) drops it (stale heap entries are skipped when popped).
+
+    Callbacks run on the scheduler thread and should hand slow work (HTTP
+    requests) off to another thread.
+    """
+
+    def __init__(self, name: str = "wrangler-deadlines"):
+        self.name = name
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, Tuple[int, float, Callable[[], None]]] = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = True
+
+    def schedule(self, key: str, when: float, callback: Callable[[], None]):
+        """Runs callback at `when` (a time.time() timestamp), replacing key's previous deadline."""
+        with self._condition:
+            seq = next(self._counter)
+            self._entries[key] = (seq, when, callback)
+            heapq.heappush(self._heap, (when, seq, key))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name=self.name)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, key: str) -> bool:
+        """Drops key's pending deadline; returns True if there was one."""
+        with self._condition:
+            return self._entries.pop(key, None) is not None
+
+    def deadline(self, key: str) -> Optional[float]:
+        """Returns key's pending deadline, or None."""
+        with self._condition:
+            entry = self._entries.get(key)
+            return entry[1] if entry else None
+
+    def pending(self) -> int:
+        """Number of live deadlines."""
+        with self._condition:
+            return len(self._entries)
+
+    def stop(self):
+        """Stops the scheduler thread; pending deadlines are discarded."""
+        with self._condition:
+            self._running = False
+            self._entries.clear()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                callback = None
+                while self._running and callback is None:
+                    # Discard entries that were cancelled or rescheduled
+                    while self._heap and self._entries.get(self._heap[0][2], (None,))[0] != self._heap[0][1]:
+                        heapq.heappop(self._heap)
+
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+
+                    when, _, key = self._heap[0]
+                    delay = when - time.time()
+                    if delay > 0:
+                        self._condition.wait(min(delay, DEADLINE_MAX_SLEEP))
+                        continue
+
+                    heapq.heappop(self._heap)
+                    callback = self._entries.pop(key)[2]
+
+                if not self._running:
+                    return
+
+            try:
+                callback()
+            except Exception as e:
+                print(f"Deadline callback failed: {e}")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Wrangler Discovery
+==================
+
+Finds Wrangler instances on the LAN so they can be added in bulk.
+
+A sweep has two stages:
+1. A non-blocking TCP connect scan over every host in a CIDR range and
+   every port in a port range, with up to MAX_OPEN_SOCKETS connects in
+   flight at once.
+2. Open ports are confirmed concurrently with GET /health and GET /status;
+   the reported characterName becomes the instance name.
+
+A /24 with 20 ports (5,080 probes) completes in a few seconds.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import errno
+import ipaddress
+import selectors
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from wrangler_core import WranglerClient, WranglerInstance, MAX_PARALLEL_REQUESTS
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DEFAULT_PORTS = "7800-7819"
+CONNECT_TIMEOUT = 0.5  # seconds to wait for a TCP handshake
+MAX_OPEN_SOCKETS = 512  # connects in flight at once (Windows select() caps at 512)
+MAX_HOSTS = 65536  # refuse ranges larger than a /16
+
+_CONNECT_PENDING = {0, errno.EINPROGRESS, errno.EALREADY, errno.EWOULDBLOCK,
+                    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+
+# =============================================================================
+# Parsing
+# =============================================================================
+
+def parse_hosts(spec: str) -> List[str]:
+    """Expands "192.168.1.0/24", "192.168.1.10" or "hostname" into host strings."""
+    spec = spec.strip()
+    if not spec:
+        raise ValueError("Network range is required")
+
+    try:
+        network = ipaddress.ip_network(spec, strict=False)
+    except ValueError:
+        return [spec]  # Plain hostname
+
+    if network.num_addresses > MAX_HOSTS:
+        raise ValueError(f"Range too large ({network.num_addresses} addresses)")
+    if network.num_addresses == 1:
+        return [str(network.network_address)]
+    return [str(host) for host in network.hosts()]
+
+
+def parse_ports(spec: str) -> List[int]:
+    """Expands "7800-7819,7900" into a sorted list of ports."""
+    ports = set()
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part:
+            low, high = (int(p) for p in part.split("-", 1))
+            ports.update(range(low, high + 1))
+        else:
+            ports.add(int(part))
+
+    if not ports:
+        raise ValueError("At least one port is required")
+    if min(ports) < 1 or max(ports) > 65535:
+        raise ValueError("Ports must be between 1 and 65535")
+    return sorted(ports)
+
+
+def local_network(prefix: int = 24) -> str:
+    """Guesses the local /24 from the address used for outbound traffic."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            # No packets are sent; this only selects the outbound interface
+            s.connect(("10.255.255.255", 1))
+            address = s.getsockname()[0]
+    except OSError:
+        address = "192.168.1.1"
+    return str(ipaddress.ip_network(f"{address}/{prefix}", strict=False))
+
+
+# =============================================================================
+# Connect Scan
+# =============================================================================
+
+def scan_open_ports(targets: Iterable[Tuple[str, int]],
+                    timeout: float = CONNECT_TIMEOUT,
+                    max_open: int = MAX_OPEN_SOCKETS,
+                    on_progress: Callable[[int, int], None] = None
+                    ) -> List[Tuple[str, int]]:
+    """Returns the (host, port) pairs that accept a TCP connection.
+
+    Uses non-blocking sockets and a selector as a sliding window, so the
+    sweep takes roughly (targets / max_open) * timeout in the worst case.
+    """
+    pending = list(targets)
+    pending.reverse()  # pop() from the end keeps the original order
+    total = len(pending)
+    done = 0
+    found: List[Tuple[str, int]] = []
+
+    selector = selectors.DefaultSelector()
+    deadlines = {}  # socket -> (target, deadline)
+
+    def finish(sock):
+        nonlocal done
+        selector.unregister(sock)
+        del deadlines[sock]
+        sock.close()
+        done += 1
+
+    try:
+        while pending or deadlines:
+            # Fill the window
+            while pending and len(deadlines) < max_open:
+                target = pending.pop()
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                except OSError:
+                    pending.append(target)
+                    break  # Out of descriptors - wait for some to free up
+                sock.setblocking(False)
+                try:
+                    code = sock.connect_ex(target)
+                except OSError:
+                    code = -1  # Unresolvable hostname
+
+                if code not in _CONNECT_PENDING:
+                    sock.close()
+                    done += 1
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE)
+                deadlines[sock] = (target, time.monotonic() + timeout)
+
+            if not deadlines:
+                continue
+
+            earliest = min(deadline for _, deadline in deadlines.values())
+            events = selector.select(max(0.0, earliest - time.monotonic()))
+            for key, _ in events:
+                sock = key.fileobj
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    found.append(deadlines[sock][0])
+                finish(sock)
+
+            now = time.monotonic()
+            for sock in [s for s, (_, deadline) in deadlines.items() if deadline <= now]:
+                finish(sock)
+
+            if on_progress:
+                on_progress(done, total)
+    finally:
+        for sock in list(deadlines):
+            sock.close()
+        selector.close()
+
+    return found
+
+
+# =============================================================================
+# Discovery
+# =============================================================================
+
+def _identify(client: WranglerClient, host: str, port: int) -> Optional[WranglerInstance]:
+    """Confirms an open port is a Wrangler instance and names it."""
+    instance = WranglerInstance(name=f"{host}:{port}", host=host, port=port)
+    if not client.health_check(instance):
+        return None
+
+    status = client.get_status(instance)
+    if not status.reachable:
+        return None
+    if status.character_name and status.character_name != "Unknown":
+        instance.name = status.character_name
+    return instance
+
+
+def discover_instances(hosts: str, ports: str = DEFAULT_PORTS,
+                       existing: Iterable[WranglerInstance] = (),
+                       on_progress: Callable[[str], None] = None
+                       ) -> List[WranglerInstance]:
+    """Sweeps a host range and port range and returns new Wrangler instances.
+
+    Instances whose host:port is already in `existing` are not probed.
+    on_progress receives short human-readable progress messages.
+    """
+    host_list = parse_hosts(hosts)
+    port_list = parse_ports(ports)
+    known = {instance.key for instance in existing}
+    targets = [
+        (host, port) for host in host_list for port in port_list
+        if f"{host}:{port}" not in known
+    ]
+
+    def report(message: str):
+        if on_progress:
+            on_progress(message)
+
+    last_report = [0.0]
+
+    def scan_progress(done: int, total: int):
+        now = time.monotonic()
+        if now - last_report[0] >= 0.25 or done == total:
+            last_report[0] = now
+            report(f"Scanning... {done}/{total}")
+
+    report(f"Scanning {len(targets)} address/port pairs...")
+    open_ports = scan_open_ports(targets, on_progress=scan_progress)
+    if not open_ports:
+        report("No open ports found")
+        return []
+
+    report(f"Checking {len(open_ports)} open ports...")
+    client = WranglerClient(pool_size=1)
+    try:
+        workers = min(MAX_PARALLEL_REQUESTS, len(open_ports))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wrangler-discover") as pool:
+            found = list(pool.map(lambda target: _identify(client, *target), open_ports))
+    finally:
+        client.close()
+
+    instances = [instance for instance in found if instance]
+    report(f"Found {len(instances)} new instance(s)")
+    return instances
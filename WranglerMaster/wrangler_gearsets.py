@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Wrangler Gearsets
+=================
+
+Reads the gearset dumps Lisbeth writes for every character and decides
+which characters can craft an order, and how comfortably.
+
+Lisbeth keeps one folder per character under its Debug folder:
+
+    Lisbeth/Debug/<Character>_<World>/Gearsets/<Job>.txt
+
+with one line per equipped item:
+
+    Body | Crested Shirt Of Crafting | Slots: 5 | Craftsmanship: 1496 | Control: 618 | Cp: 7
+
+GearsetIndex sums the stats per job. PlacementEngine compares them with
+req_craftsmanship / req_control from Data/recipes.csv for an item and all
+of its crafted intermediates: a character below any requirement cannot
+craft the line at all, and the smallest stat margin across the tree ranks
+the characters that can (more headroom means fewer steps per craft).
+Gathered materials are not checked. Characters without a gearset dump are
+treated as able to do anything, so missing data never blocks an order.
+
+/status reports the character name but no world (and Lisbeth names the
+folders World<id>, not by world name), so a character is looked up by
+<Character>_<World> first and otherwise by name alone, as long as only
+one folder has that name.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from wrangler_core import InstanceStatus
+from wrangler_recipes import Recipe
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+GEARSETS_FOLDER = "Gearsets"
+MAX_MARGIN = 2.0  # stat headroom beyond twice the requirement no longer speeds crafts up
+
+JOB_ABBREVIATIONS = {
+    "Carpenter": "CRP", "Blacksmith": "BSM", "Armorer": "ARM", "Goldsmith": "GSM",
+    "Leatherworker": "LTW", "Weaver": "WVR", "Alchemist": "ALC", "Culinarian": "CUL",
+    "Miner": "MIN", "Botanist": "BTN", "Fisher": "FSH",
+}
+
+
+# =============================================================================
+# Gearset Files
+# =============================================================================
+
+@dataclass
+class Gearset:
+    """Summed stats of one job's gearset."""
+    job: str  # Short job name, e.g. "CRP"
+    craftsmanship: int = 0
+    control: int = 0
+    cp: int = 0
+    gathering: int = 0
+    perception: int = 0
+    gp: int = 0
+    items: int = 0
+
+
+@dataclass
+class CharacterGear:
+    """All gearsets dumped for one character."""
+    character: str
+    world: str
+    gearsets: Dict[str, Gearset] = field(default_factory=dict)  # short job name -> Gearset
+
+    @property
+    def key(self) -> str:
+        return f"{self.character}_{self.world}"
+
+
+def parse_gearset(path) -> Gearset:
+    """Reads one Gearsets/<Job>.txt file; unknown stats and malformed lines are skipped."""
+    path = Path(path)
+    gearset = Gearset(JOB_ABBREVIATIONS.get(path.stem, path.stem.upper()))
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) < 3:
+                continue
+            gearset.items += 1
+            for part in parts[2:]:
+                name, _, value = part.partition(":")
+                attribute = name.strip().lower()
+                if attribute in ("craftsmanship", "control", "cp", "gathering", "perception", "gp"):
+                    try:
+                        setattr(gearset, attribute, getattr(gearset, attribute) + int(value))
+                    except ValueError:
+                        pass
+    return gearset
+
+
+def find_lisbeth_debug_dir(base_dir: Optional[Path] = None) -> Optional[Path]:
+    """Looks for Lisbeth/Debug next to the master, then in the repository root."""
+    if base_dir is None:
+        base_dir = Path(sys.executable if getattr(sys, 'frozen', False) else __file__).resolve().parent
+    for candidate in (base_dir / "Lisbeth" / "Debug", base_dir.parent / "Lisbeth" / "Debug"):
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+class GearsetIndex:
+    """Gearsets of every character found under a Lisbeth Debug folder."""
+
+    def __init__(self, characters: Iterable[CharacterGear] = ()):
+        self.characters: Dict[str, CharacterGear] = {gear.key: gear for gear in characters}
+        self._by_name: Dict[str, List[CharacterGear]] = {}
+        for gear in self.characters.values():
+            self._by_name.setdefault(gear.character.lower(), []).append(gear)
+
+    @classmethod
+    def load(cls, debug_dir) -> "GearsetIndex":
+        """Scans <debug_dir>/<Character>_<World>/Gearsets/*.txt; unreadable files are skipped."""
+        characters = []
+        root = Path(debug_dir)
+        for folder in sorted(root.iterdir()) if root.is_dir() else []:
+            gearsets_dir = folder / GEARSETS_FOLDER
+            if not gearsets_dir.is_dir():
+                continue
+            character, _, world = folder.name.rpartition("_")
+            gear = CharacterGear(character or folder.name, world)
+            for path in sorted(gearsets_dir.glob("*.txt")):
+                try:
+                    gearset = parse_gearset(path)
+                except OSError:
+                    continue
+                gear.gearsets[gearset.job] = gearset
+            characters.append(gear)
+        return cls(characters)
+
+    def get(self, character: str, world: str = "Unknown") -> Optional[CharacterGear]:
+        """A character's gear by name and world, or by name alone if that is unambiguous."""
+        gear = self.characters.get(f"{character}_{world}")
+        if gear is None:
+            matches = self._by_name.get(character.lower(), [])
+            gear = matches[0] if len(matches) == 1 else None
+        return gear
+
+    def __len__(self) -> int:
+        return len(self.characters)
+
+
+# =============================================================================
+# Placement
+# =============================================================================
+
+class PlacementEngine:
+    """Matches order lines against character gearsets (results cached per character and item)."""
+
+    def __init__(self, gear: GearsetIndex, recipes: Dict[int, Recipe]):
+        self.gear = gear
+        self.recipes = recipes
+        self._cache: Dict[Tuple[str, int], Optional[float]] = {}
+
+    def margin(self, gear: CharacterGear, item_id: int) -> Optional[float]:
+        """Smallest stat headroom over an item's crafting tree; None if it cannot be crafted."""
+        cache_key = (gear.key, item_id)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = self._margin(gear, item_id, set())
+        return self._cache[cache_key]
+
+    def _margin(self, gear: CharacterGear, item_id: int, visiting: set) -> Optional[float]:
+        recipe = self.recipes.get(item_id)
+        if recipe is None or item_id in visiting:
+            return MAX_MARGIN  # Gathered or bought
+
+        gearset = gear.gearsets.get(recipe.job)
+        if gearset is None:
+            return None
+        margin = MAX_MARGIN
+        for have, need in ((gearset.craftsmanship, recipe.req_craftsmanship),
+                           (gearset.control, recipe.req_control)):
+            if need > 0:
+                if have < need:
+                    return None
+                margin = min(margin, have / need)
+
+        visiting.add(item_id)
+        for ingredient, _ in recipe.ingredients:
+            sub = self._margin(gear, ingredient, visiting)
+            if sub is None:
+                margin = None
+                break
+            margin = min(margin, sub)
+        visiting.discard(item_id)
+        return margin
+
+    def line_margin(self, gear: Optional[CharacterGear], line: dict) -> Optional[float]:
+        """Headroom for one order line; characters without gear data get MAX_MARGIN."""
+        if gear is None:
+            return MAX_MARGIN
+        return self.margin(gear, int(line.get("Item", 0)))
+
+    def problems(self, gear: Optional[CharacterGear], orders: Iterable[dict]) -> List[str]:
+        """Names of the items in an order the character cannot craft."""
+        names = []
+        for line in orders:
+            if line.get("Enabled", True) and self.line_margin(gear, line) is None:
+                recipe = self.recipes.get(int(line.get("Item", 0)))
+                names.append(recipe.item_name if recipe else str(line.get("Item")))
+        return names
+
+    def eligible(self, line: dict, characters: Dict[str, Optional[CharacterGear]]) -> Optional[frozenset]:
+        """Instance keys that can craft a line; None when every instance can."""
+        keys = frozenset(key for key, gear in characters.items() if self.line_margin(gear, line) is not None)
+        return None if len(keys) == len(characters) else keys
+
+    def rank(self, orders: List[dict],
+             characters: Dict[str, Optional[CharacterGear]]) -> List[Tuple[str, float]]:
+        """Instances that can craft a whole order, best headroom first: [(key, margin)]."""
+        ranked = []
+        for key, gear in characters.items():
+            margins = [self.line_margin(gear, line) for line in orders if line.get("Enabled", True)]
+            if all(m is not None for m in margins):
+                ranked.append((key, min(margins, default=MAX_MARGIN)))
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
+
+    def blocked(self, orders: List[dict],
+                characters: Dict[str, Optional[CharacterGear]]) -> Dict[str, str]:
+        """Instances that cannot craft an order, with a reason: {key: message}."""
+        blocked = {}
+        for key, gear in characters.items():
+            names = self.problems(gear, orders)
+            if names:
+                more = f" and {len(names) - 3} more" if len(names) > 3 else ""
+                blocked[key] = f"Gear below recipe stats for {', '.join(names[:3])}{more}"
+        return blocked
+
+    def characters_for(self, statuses: Dict[str, Optional[InstanceStatus]]) -> Dict[str, Optional[CharacterGear]]:
+        """Maps instance keys to gear using each instance's last reported character (and world)."""
+        return {
+            key: self.gear.get(status.character_name, status.world_name) if status else None
+            for key, status in statuses.items()
+        }
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Wrangler Status History
+=======================
+
+Remembers what the polls saw over the last few hours, in fixed memory,
+for the sparklines on the instance panels and the fleet graph in the
+status bar.
+
+StatusRing is a circular buffer over one typed array per field rather
+than a list of objects. A poll sample (time, state, latency, runtime)
+costs 11 bytes, and once a ring holds HISTORY_SAMPLES samples each new
+one overwrites the oldest, so an instance never costs more than
+HISTORY_SAMPLES * 11 bytes however long the master runs. A 304 is
+recorded as a repeat of the previous sample with its own latency.
+
+Series are read as the value at the end of each time bucket (a binary
+search per bucket), with bucket edges on whole multiples of the bucket
+width, so a sparkline only changes when one of its buckets does - not on
+every poll.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from wrangler_core import InstanceStatus
+from wrangler_model import describe_state
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+HISTORY_SAMPLES = 6000  # per instance: 3h20m at the 2 s active poll interval, ~66 KB
+SPARKLINE_WINDOW = 3 * 3600  # seconds shown by the panel sparklines and the fleet graph
+SPARKLINE_BUCKETS = 48  # bars per panel sparkline (~4 minutes each)
+FLEET_BUCKETS = 60  # bars in the fleet graph (3 minutes each)
+FLEET_SAMPLE_INTERVAL = 10.0  # seconds between fleet-wide samples
+FLEET_SAMPLES = int(SPARKLINE_WINDOW / FLEET_SAMPLE_INTERVAL)
+
+# State codes; the categories are describe_state()'s
+STATES = ("unreachable", "stopped", "idle", "pending", "executing", "tripped")
+REACHABLE = 0x80  # OR-ed into the state code
+NO_LATENCY = 0xFFFF  # latency of pushed statuses (no request was made)
+
+TICKS = 10  # time resolution: ticks per second
+
+
+# =============================================================================
+# Ring Buffer
+# =============================================================================
+
+class StatusRing:
+    """Fixed-capacity circular buffer of samples, stored as one array per field.
+
+    typecodes gives the array type of each field, time (in ticks) first.
+    Index 0 is the oldest sample and -1 the newest.
+    """
+
+    def __init__(self, capacity: int, typecodes: str):
+        self.capacity = capacity
+        self.total = 0  # samples ever appended, including overwritten ones
+        self._columns = [array(code) for code in typecodes]
+        self._start = 0  # slot of the oldest sample once the ring is full
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def append(self, *values: int):
+        if len(self) < self.capacity:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+        else:
+            for column, value in zip(self._columns, values):
+                column[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+        self.total += 1
+
+    def __getitem__(self, index: int) -> Tuple[int, ...]:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("StatusRing index out of range")
+        slot = (self._start + index) % self.capacity
+        return tuple(column[slot] for column in self._columns)
+
+    def count_until(self, tick: int) -> int:
+        """Number of samples taken at or before tick (binary search over the time column)."""
+        times, start, capacity = self._columns[0], self._start, self.capacity
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if times[(start + middle) % capacity] <= tick:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the samples (not counting array over-allocation)."""
+        return sum(len(column) * column.itemsize for column in self._columns)
+
+
+# =============================================================================
+# Fleet History
+# =============================================================================
+
+class StatusHistory:
+    """A StatusRing per instance plus one for fleet-wide counts (thread-safe)."""
+
+    def __init__(self, capacity: int = HISTORY_SAMPLES, fleet_capacity: int = FLEET_SAMPLES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self._clock = clock
+        self._epoch = clock()
+        self._lock = threading.Lock()
+        self._rings: Dict[str, StatusRing] = {}  # key -> time, state, latency ms, runtime s
+        self.fleet = StatusRing(fleet_capacity, "IHH")  # time, executing, reachable
+        self._next_fleet_sample = 0.0
+
+    def _tick(self, now: Optional[float] = None) -> int:
+        return int(((self._clock() if now is None else now) - self._epoch) * TICKS)
+
+    def record(self, key: str, status: InstanceStatus, pushed: bool = False, now: Optional[float] = None):
+        """Adds one polled (or pushed) status to an instance's ring."""
+        tick = self._tick(now)
+        latency = NO_LATENCY if pushed else min(NO_LATENCY - 1, int(status.latency * 1000))
+        with self._lock:
+            ring = self._rings.get(key)
+            if ring is None:
+                ring = self._rings[key] = StatusRing(self.capacity, "IBHI")
+            if status.not_modified:
+                if not len(ring):
+                    return
+                _, state, _, runtime = ring[-1]
+            else:
+                state = STATES.index(describe_state(status)[0]) | (REACHABLE if status.reachable else 0)
+                runtime = min(0xFFFFFFFF, max(0, status.runtime_seconds))
+            ring.append(tick, state, latency, runtime)
+
+    def retain(self, keys: Iterable[str]):
+        """Forgets the history of instances that are no longer listed."""
+        keys = set(keys)
+        with self._lock:
+            for key in [key for key in self._rings if key not in keys]:
+                del self._rings[key]
+
+    def sample_fleet(self, statuses: Iterable[InstanceStatus], now: Optional[float] = None) -> bool:
+        """Records how many instances are executing, once per FLEET_SAMPLE_INTERVAL.
+
+        Returns True if a sample was taken (the fleet graph has to be redrawn).
+        """
+        now = self._clock() if now is None else now
+        if now < self._next_fleet_sample:
+            return False
+        self._next_fleet_sample = now + FLEET_SAMPLE_INTERVAL
+        executing = reachable = 0
+        for status in statuses:
+            if status.reachable:
+                reachable += 1
+                executing += status.is_executing
+        with self._lock:
+            self.fleet.append(self._tick(now), min(executing, 0xFFFF), min(reachable, 0xFFFF))
+        return True
+
+    def _bucket_ends(self, buckets: int, window: float, now: Optional[float]) -> List[int]:
+        width = max(1, int(window * TICKS / buckets))
+        last = -(-self._tick(now) // width) * width
+        return [last - (buckets - 1 - n) * width for n in range(buckets)]
+
+    def sparkline(self, key: str, buckets: int = SPARKLINE_BUCKETS, window: float = SPARKLINE_WINDOW,
+                  now: Optional[float] = None) -> Tuple[Optional[str], ...]:
+        """An instance's state category at the end of each bucket, oldest first (None before its first poll)."""
+        ends = self._bucket_ends(buckets, window, now)
+        with self._lock:
+            ring = self._rings.get(key)
+            if ring is None:
+                return (None,) * buckets
+            line = []
+            for end in ends:
+                count = ring.count_until(end)
+                line.append(STATES[ring[count - 1][1] & ~REACHABLE] if count else None)
+        return tuple(line)
+
+    def fleet_series(self, buckets: int = FLEET_BUCKETS, window: float = SPARKLINE_WINDOW,
+                     now: Optional[float] = None) -> Tuple[int, ...]:
+        """Executing instances at the end of each bucket, oldest first (0 before the first sample)."""
+        ends = self._bucket_ends(buckets, window, now)
+        with self._lock:
+            series = []
+            for end in ends:
+                count = self.fleet.count_until(end)
+                series.append(self.fleet[count - 1][1] if count else 0)
+        return tuple(series)
+
+    def samples(self, key: str) -> List[Tuple[float, str, bool, Optional[float], int]]:
+        """An instance's recorded polls, oldest first: (seconds ago, state, reachable, latency, runtime)."""
+        tick = self._tick()
+        with self._lock:
+            ring = self._rings.get(key)
+            rows = [ring[n] for n in range(len(ring))] if ring is not None else []
+        return [
+            ((tick - t) / TICKS, STATES[state & ~REACHABLE], bool(state & REACHABLE),
+             None if latency == NO_LATENCY else latency / 1000, runtime)
+            for t, state, latency, runtime in rows
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by all samples."""
+        with self._lock:
+            return self.fleet.nbytes + sum(ring.nbytes for ring in self._rings.values())
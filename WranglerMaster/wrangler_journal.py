@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Wrangler Run Journal
+====================
+
+Append-only record of timer and schedule activity, kept next to
+wrangler_config.json so active runs survive a restart or crash of the
+master.
+
+Each line is one JSON record:
+    {"op": "start",  "id": "timer:host:port", "key": "host:port", "end": 1700000000.0}
+    {"op": "start",  "id": "schedule:host:port", "key": "host:port", "config": {...}}
+    {"op": "action", "id": "schedule:host:port", "action": "started"}
+    {"op": "done",   "id": "timer:host:port"}
+
+Records are a single write followed by an fdatasync, which is cheap
+because they are small and only written on activations and transitions.
+Replaying keeps the last state of each id; a torn final line from a crash
+is ignored. The file is rewritten with only the live entries on open and
+whenever dead records pile up, so replay stays proportional to the number
+of active runs.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+JOURNAL_FILENAME = "wrangler_journal.jsonl"
+COMPACT_THRESHOLD = 200  # records appended before dead records are dropped
+
+_sync = getattr(os, "fdatasync", os.fsync)  # fdatasync skips metadata where available
+
+
+class RunJournal:
+    """Durable, thread-safe journal of active timers and schedules."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self._appended = 0
+        self._file = None
+
+        self._replay()
+        self.compact()
+
+    # =========================================================================
+    # Reading
+    # =========================================================================
+
+    def _replay(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn or foreign line
+        except FileNotFoundError:
+            pass
+
+    def _apply(self, record: dict):
+        op = record["op"]
+        entry_id = record["id"]
+        if op == "start":
+            self._entries[entry_id] = record
+        elif op == "action":
+            if entry_id in self._entries:
+                self._entries[entry_id]["last_action"] = record["action"]
+        elif op == "done":
+            self._entries.pop(entry_id, None)
+
+    def entries(self) -> Dict[str, dict]:
+        """Returns a copy of the live entries by id ("timer:<key>" / "schedule:<key>")."""
+        with self._lock:
+            return {entry_id: dict(record) for entry_id, record in self._entries.items()}
+
+    # =========================================================================
+    # Writing
+    # =========================================================================
+
+    def start(self, entry_id: str, key: str, **fields):
+        """Records a timer or schedule activation, replacing any previous one for the id."""
+        self._append({"op": "start", "id": entry_id, "key": key, "at": time.time(), **fields})
+
+    def action(self, entry_id: str, action: str):
+        """Records the last command sent for an entry ("started" / "stopped")."""
+        self._append({"op": "action", "id": entry_id, "action": action, "at": time.time()})
+
+    def done(self, entry_id: str):
+        """Records that an entry completed or was cancelled."""
+        with self._lock:
+            if entry_id not in self._entries:
+                return
+        self._append({"op": "done", "id": entry_id, "at": time.time()})
+
+    def _append(self, record: dict):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            self._apply(record)
+            if self._file is None:
+                self._file = open(self.path, "ab", buffering=0)
+            self._file.write(line)
+            _sync(self._file.fileno())
+            self._appended += 1
+
+            if self._appended >= COMPACT_THRESHOLD and self._appended > 4 * len(self._entries):
+                self._compact_locked()
+
+    def compact(self):
+        """Rewrites the journal with only the live entries."""
+        with self._lock:
+            self._compact_locked()
+
+    def _compact_locked(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as f:
+            for record in self._entries.values():
+                f.write((json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._appended = 0
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
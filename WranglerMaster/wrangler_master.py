@@ -10,7 +10,14 @@ Features:
 - Display Wrangler instances as status panels
 - Start/Stop individual instances
 - Master Start All / Stop All controls
-- Auto-refresh status every 10 seconds
+- Adaptive status polling (fast while executing, slow when idle, backoff when unreachable)
+- Live status push over /events, falling back to polling for older instances
+- LAN discovery of instances across a network and port range
+- Per-instance order queues that start the next file as soon as an instance is idle
+- Shard one large order across instances, balanced by estimated work
+- Gearset-aware placement: orders only go to characters that meet the recipe stats
+- Timers and schedules survive restarts (wrangler_journal.jsonl)
+- Multi-window weekly schedules in local, any time zone, or Eorzea time
 - Save/Load instance configuration
 - Custom background image support
 - Theme customization (blue, dark-blue, green, wrangler)
@@ -30,17 +37,9 @@ import os
 import sys
 import threading
 import time
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Callable
-
-try:
-    import requests
-except ImportError:
-    print("ERROR: 'requests' library is required.")
-    print("Install it with: pip install requests")
-    sys.exit(1)
+from typing import Optional, List, Dict, Callable, Tuple
 
 try:
     import customtkinter as ctk
@@ -50,7 +49,32 @@ except ImportError:
     print("Install them with: pip install customtkinter Pillow")
     sys.exit(1)
 
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, Listbox, ttk
+
+from wrangler_core import (
+    AdvancedRunConfig, WranglerInstance, InstanceStatus,
+    WranglerClient, FleetPoller, PollScheduler, BulkDispatcher, DispatchResult,
+    StatusStreamManager, StartThrottle, ConfigWriter, load_config, write_json_atomic,
+    ROLLOUT_MAX_PER_HOST, ROLLOUT_MIN_SPACING,
+    summarize_results, format_results_table,
+)
+from wrangler_runs import AdvancedRunManager
+from wrangler_queue import OrderQueueManager
+from wrangler_model import (
+    FleetModel, UpdateBatch, FRAME_INTERVAL, TABLE_COLUMNS, describe_state, format_runtime,
+)
+from wrangler_background import BackgroundRenderer, SETTLE_DELAY
+from wrangler_history import StatusHistory
+from wrangler_telemetry import TelemetryStore, TELEMETRY_FILENAME
+from wrangler_recipes import RECIPES_FILENAME, find_data_file, load_recipes
+from wrangler_shard import (
+    ShardRun, WorkEstimator, SHARDS_PER_INSTANCE,
+    load_order, plan_shards, plan_placed_shards, describe_plan,
+)
+from wrangler_gearsets import GearsetIndex, PlacementEngine, find_lisbeth_debug_dir
+from wrangler_journal import RunJournal, JOURNAL_FILENAME
+from wrangler_schedule import Schedule, parse_days, format_days
+from wrangler_discovery import discover_instances, local_network, DEFAULT_PORTS
 
 
 # =============================================================================
@@ -58,8 +82,23 @@ from tkinter import messagebox, filedialog
 # =============================================================================
 
 CONFIG_FILENAME = "wrangler_config.json"
-POLL_INTERVAL_MS = 10000  # 10 seconds
-REQUEST_TIMEOUT = 5  # seconds
+PANEL_COLUMNS = 3  # Instance panels per grid row
+PANEL_ROW_HEIGHT = 290  # Pixels per grid row, gap included (panels are recycled, so rows are fixed-height)
+PANEL_GAP = 10  # Pixels between panels
+SPARKLINE_HEIGHT = 14  # Pixels of the status history strip on each panel
+FLEET_GRAPH_SIZE = (180, 20)  # Pixels of the executing-count graph in the status bar
+TABLE_COLUMN_WIDTHS = {  # Initial widths of the table view's columns, pixels
+    "name": 150, "address": 140, "state": 100, "character": 150,
+    "world": 100, "runtime": 90, "file": 220, "latency": 70,
+}
+
+
+def canvas_background(widget) -> str:
+    """The color a plain tk Canvas needs to blend into a CTk widget."""
+    color = widget.cget("fg_color")
+    if color == "transparent":
+        color = widget._detect_color_of_master()
+    return widget._apply_appearance_mode(color)
 
 
 def get_base_path() -> Path:
@@ -100,70 +139,6 @@ if DISCORD_THEME_PATH.exists():
     AVAILABLE_THEMES.append("discord")
 
 
-@dataclass
-class AdvancedRunConfig:
-    """Configuration for advanced run modes."""
-    mode: str = "none"  # "none", "timer", or "schedule"
-    timer_hours: int = 0
-    timer_minutes: int = 30
-    schedule_start_hour: int = 8
-    schedule_start_minute: int = 0
-    schedule_end_hour: int = 22
-    schedule_end_minute: int = 0
-    use_resume: bool = False  # If True, resume orders; if False, run new orders
-
-
-@dataclass
-class WranglerInstance:
-    """Represents a Wrangler instance configuration."""
-    name: str
-    host: str
-    port: int
-    enabled: bool = True
-    go_home_after_session: bool = False  # Go to Lisbeth home after timer/schedule ends
-    advanced_config: Optional[dict] = None  # Persisted AdvancedRunConfig as dict
-
-    @property
-    def base_url(self) -> str:
-        return f"http://{self.host}:{self.port}"
-
-    def get_advanced_config(self) -> AdvancedRunConfig:
-        """Returns the advanced config, creating default if none exists."""
-        if self.advanced_config is None:
-            return AdvancedRunConfig()
-        return AdvancedRunConfig(**self.advanced_config)
-
-    def set_advanced_config(self, config: AdvancedRunConfig):
-        """Saves the advanced config."""
-        self.advanced_config = {
-            "mode": config.mode,
-            "timer_hours": config.timer_hours,
-            "timer_minutes": config.timer_minutes,
-            "schedule_start_hour": config.schedule_start_hour,
-            "schedule_start_minute": config.schedule_start_minute,
-            "schedule_end_hour": config.schedule_end_hour,
-            "schedule_end_minute": config.schedule_end_minute,
-            "use_resume": config.use_resume
-        }
-
-
-@dataclass
-class InstanceStatus:
-    """Current status of a Wrangler instance."""
-    state: str = "unknown"
-    is_executing: bool = False
-    has_pending_order: bool = False
-    has_incomplete_orders: bool = False
-    current_file: str = "None"
-    api_status: str = "Unknown"
-    bot_running: bool = False
-    reachable: bool = False
-    error: Optional[str] = None
-    character_name: str = "Unknown"
-    world_name: str = "Unknown"
-    runtime_seconds: int = 0
-
-
 # Available fonts for the font selector
 AVAILABLE_FONTS = [
     "Segoe UI",
@@ -192,159 +167,11 @@ class AppSettings:
     background_opacity: float = 0.3  # 0.0 (invisible) to 1.0 (fully visible)
     font_family: str = "Segoe UI"  # Font family for the UI
     font_size: int = 13  # Base font size
-
-
-# =============================================================================
-# API Client
-# =============================================================================
-
-class WranglerClient:
-    """HTTP client for communicating with Wrangler instances."""
-
-    @staticmethod
-    def get_status(instance: WranglerInstance) -> InstanceStatus:
-        """Fetches the current status from a Wrangler instance."""
-        status = InstanceStatus()
-
-        try:
-            response = requests.get(
-                f"{instance.base_url}/status",
-                timeout=REQUEST_TIMEOUT
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                status.state = data.get("state", "unknown")
-                status.is_executing = data.get("isExecuting", False)
-                status.has_pending_order = data.get("hasPendingOrder", False)
-                status.has_incomplete_orders = data.get("hasIncompleteOrders", False)
-                status.current_file = data.get("currentFile", "None")
-                status.api_status = data.get("apiStatus", "Unknown")
-                status.bot_running = data.get("botRunning", False)
-                status.character_name = data.get("characterName", "Unknown")
-                status.world_name = data.get("worldName", "Unknown")
-                status.runtime_seconds = data.get("runtimeSeconds", 0)
-                status.reachable = True
-            else:
-                status.error = f"HTTP {response.status_code}"
-                status.reachable = False
-
-        except requests.exceptions.ConnectionError:
-            status.error = "Connection refused"
-            status.reachable = False
-        except requests.exceptions.Timeout:
-            status.error = "Timeout"
-            status.reachable = False
-        except Exception as e:
-            status.error = str(e)
-            status.reachable = False
-
-        return status
-
-    @staticmethod
-    def health_check(instance: WranglerInstance) -> bool:
-        """Quick health check to see if instance is reachable."""
-        try:
-            response = requests.get(
-                f"{instance.base_url}/health",
-                timeout=REQUEST_TIMEOUT
-            )
-            return response.status_code == 200 and response.text.strip() == "ok"
-        except:
-            return False
-
-    @staticmethod
-    def run_order(instance: WranglerInstance, json_path: Optional[str] = None,
-                  json_content: Optional[str] = None) -> tuple[bool, str]:
-        """Sends a run command to a Wrangler instance."""
-        try:
-            if json_path:
-                payload = {"jsonPath": json_path}
-            elif json_content:
-                payload = {"json": json_content}
-            else:
-                return False, "Must provide jsonPath or json content"
-
-            response = requests.post(
-                f"{instance.base_url}/run",
-                json=payload,
-                timeout=REQUEST_TIMEOUT
-            )
-
-            data = response.json()
-            success = data.get("success", False)
-            message = data.get("message", data.get("error", "Unknown response"))
-            return success, message
-
-        except requests.exceptions.ConnectionError:
-            return False, "Connection refused"
-        except requests.exceptions.Timeout:
-            return False, "Request timeout"
-        except Exception as e:
-            return False, str(e)
-
-    @staticmethod
-    def stop_gently(instance: WranglerInstance) -> tuple[bool, str]:
-        """Sends a stop gently command to a Wrangler instance."""
-        try:
-            response = requests.post(
-                f"{instance.base_url}/stop",
-                timeout=REQUEST_TIMEOUT
-            )
-
-            data = response.json()
-            success = data.get("success", False)
-            message = data.get("message", data.get("error", "Unknown response"))
-            return success, message
-
-        except requests.exceptions.ConnectionError:
-            return False, "Connection refused"
-        except requests.exceptions.Timeout:
-            return False, "Request timeout"
-        except Exception as e:
-            return False, str(e)
-
-    @staticmethod
-    def resume_orders(instance: WranglerInstance) -> tuple[bool, str]:
-        """Sends a resume command to resume incomplete orders."""
-        try:
-            response = requests.post(
-                f"{instance.base_url}/resume",
-                timeout=REQUEST_TIMEOUT
-            )
-
-            data = response.json()
-            success = data.get("success", False)
-            message = data.get("message", data.get("error", "Unknown response"))
-            return success, message
-
-        except requests.exceptions.ConnectionError:
-            return False, "Connection refused"
-        except requests.exceptions.Timeout:
-            return False, "Request timeout"
-        except Exception as e:
-            return False, str(e)
-
-    @staticmethod
-    def go_home(instance: WranglerInstance) -> tuple[bool, str]:
-        """Sends a go home command to navigate to Lisbeth's configured home location."""
-        try:
-            response = requests.post(
-                f"{instance.base_url}/gohome",
-                timeout=REQUEST_TIMEOUT
-            )
-
-            data = response.json()
-            success = data.get("success", False)
-            message = data.get("message", data.get("error", "Unknown response"))
-            return success, message
-
-        except requests.exceptions.ConnectionError:
-            return False, "Connection refused"
-        except requests.exceptions.Timeout:
-            return False, "Request timeout"
-        except Exception as e:
-            return False, str(e)
+    rollout_max_per_host: int = ROLLOUT_MAX_PER_HOST  # Instances starting at once per host
+    rollout_spacing: float = ROLLOUT_MIN_SPACING  # Seconds between starts on one host
+    rollout_ramp: bool = True  # Wait for "executing" before starting the next instance
+    lisbeth_debug_dir: str = ""  # Lisbeth/Debug folder with gearset dumps; empty = look next to the master
+    view_mode: str = "cards"  # "cards" or "table"
 
 
 # =============================================================================
@@ -361,6 +188,17 @@ class InstancePanel(ctk.CTkFrame):
         "idle": "#5865f2",  # Discord blurple
         "pending": "#fee75c",  # Discord yellow
         "executing": "#57f287",  # Discord green
+        "tripped": "#ed4245",  # Discord red - circuit breaker open
+    }
+
+    # Status history bar heights (fraction of the strip) per state
+    HISTORY_LEVELS = {
+        "unreachable": 0.25,
+        "stopped": 0.25,
+        "idle": 0.45,
+        "pending": 0.7,
+        "executing": 1.0,
+        "tripped": 1.0,
     }
 
     # Discord-style button colors
@@ -373,20 +211,28 @@ class InstancePanel(ctk.CTkFrame):
         "danger_hover": "#c93b3e",
     }
 
+    # Widget configure() calls made by status updates, across all panels.
+    # A poll of an unchanged fleet must leave it where it was.
+    reconfigurations = 0
+
     def __init__(self, parent, instance: WranglerInstance,
                  on_run: Callable, on_stop: Callable, on_resume: Callable,
                  on_advanced_run: Callable, on_remove: Callable,
-                 on_settings_changed: Callable = None):
+                 on_settings_changed: Callable = None, on_queue: Callable = None):
         super().__init__(parent, corner_radius=10)
 
         self.instance = instance
         self.status = InstanceStatus()
+        self._shown: Dict[str, dict] = {}  # widget name -> options last passed to configure()
+        self._history: Tuple[Optional[str], ...] = ()  # Sparkline on screen (StatusHistory.sparkline)
+        self._bars: List[int] = []  # Canvas items, one per sparkline bucket
         self.on_run = on_run
         self.on_stop = on_stop
         self.on_resume = on_resume
         self.on_advanced_run = on_advanced_run
         self.on_remove = on_remove
         self.on_settings_changed = on_settings_changed
+        self.on_queue = on_queue
 
         self._create_widgets()
         self._layout_widgets()
@@ -454,6 +300,24 @@ class InstancePanel(ctk.CTkFrame):
             anchor="w"
         )
 
+        # Order queue label
+        self.queue_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color="gray",
+            anchor="w"
+        )
+
+        # Status history of the last few hours, one bar per time bucket
+        self.history_canvas = ctk.CTkCanvas(
+            self,
+            height=SPARKLINE_HEIGHT,
+            highlightthickness=0,
+            borderwidth=0
+        )
+        self.history_canvas.bind("<Configure>", lambda event: self._draw_history())
+
         # Button frame
         self.button_frame = ctk.CTkFrame(self, fg_color="transparent")
 
@@ -558,6 +422,12 @@ class InstancePanel(ctk.CTkFrame):
         # File
         self.file_label.pack(fill="x", padx=12, pady=2)
 
+        # Queue
+        self.queue_label.pack(fill="x", padx=12, pady=1)
+
+        # History
+        self.history_canvas.pack(fill="x", padx=12, pady=2)
+
         # Go home checkbox
         self.go_home_check.pack(fill="x", padx=12, pady=4)
 
@@ -575,55 +445,31 @@ class InstancePanel(ctk.CTkFrame):
         self.status = status
 
         # Determine color based on state
-        if not status.reachable:
-            color = self.COLORS["unreachable"]
-            state_text = "Unreachable"
-        elif status.state == "executing":
-            color = self.COLORS["executing"]
-            state_text = "Executing"
-        elif status.state == "pending":
-            color = self.COLORS["pending"]
-            state_text = "Pending"
-        elif status.state == "idle":
-            color = self.COLORS["idle"]
-            state_text = "Idle"
-        elif status.state == "stopped":
-            color = self.COLORS["stopped"]
-            state_text = "Bot Stopped"
-        else:
-            color = self.COLORS["unreachable"]
-            state_text = status.state.capitalize() if status.state else "Unknown"
+        category, state_text = describe_state(status)
+        color = self.COLORS[category]
 
         # Update display
-        self.status_indicator.configure(text_color=color)
-        self.status_text.configure(text=state_text)
+        self._set("status_indicator", text_color=color)
+        self._set("status_text", text=state_text)
 
         # Update character label
         if status.reachable and status.character_name != "Unknown":
             char_text = f"{status.character_name} @ {status.world_name}"
-            self.character_label.configure(text=char_text, text_color=("gray40", "gray60"))
+            self._set("character_label", text=char_text, text_color=("gray40", "gray60"))
         else:
-            self.character_label.configure(text="Character: Unknown", text_color="gray")
+            self._set("character_label", text="Character: Unknown", text_color="gray")
 
         # Update runtime label
         if status.is_executing and status.runtime_seconds > 0:
-            hours, remainder = divmod(status.runtime_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            if hours > 0:
-                runtime_text = f"Runtime: {hours}h {minutes}m {seconds}s"
-            elif minutes > 0:
-                runtime_text = f"Runtime: {minutes}m {seconds}s"
-            else:
-                runtime_text = f"Runtime: {seconds}s"
-            self.runtime_label.configure(text=runtime_text)
+            self._set("runtime_label", text=f"Runtime: {format_runtime(status.runtime_seconds)}")
         else:
-            self.runtime_label.configure(text="")
+            self._set("runtime_label", text="")
 
         # Update file label
         file_text = status.current_file if status.current_file else "None"
         if len(file_text) > 30:
             file_text = "..." + file_text[-27:]
-        self.file_label.configure(text=f"File: {file_text}")
+        self._set("file_label", text=f"File: {file_text}")
 
         # Update button states
         can_run = status.reachable and status.state in ("idle", "stopped")
@@ -631,10 +477,49 @@ class InstancePanel(ctk.CTkFrame):
         can_stop = status.reachable and status.is_executing
         can_advanced = status.reachable and status.state in ("idle", "stopped")
 
-        self.run_btn.configure(state="normal" if can_run else "disabled")
-        self.resume_btn.configure(state="normal" if can_resume else "disabled")
-        self.stop_btn.configure(state="normal" if can_stop else "disabled")
-        self.advanced_btn.configure(state="normal" if can_advanced else "disabled")
+        self._set("run_btn", state="normal" if can_run else "disabled")
+        self._set("resume_btn", state="normal" if can_resume else "disabled")
+        self._set("stop_btn", state="normal" if can_stop else "disabled")
+        self._set("advanced_btn", state="normal" if can_advanced else "disabled")
+
+    def _set(self, name: str, **options):
+        """Configures a child widget only if the options differ from what it already shows."""
+        if self._shown.get(name) == options:
+            return
+        getattr(self, name).configure(**options)
+        self._shown[name] = options
+        InstancePanel.reconfigurations += 1
+
+    def show_history(self, line: Tuple[Optional[str], ...]):
+        """Shows a status sparkline (see StatusHistory.sparkline); only changed bars are redrawn."""
+        previous, self._history = self._history, line
+        if len(previous) != len(line) or len(self._bars) != len(line):
+            self._draw_history()
+            return
+        for n, (old, new) in enumerate(zip(previous, line)):
+            if old != new:
+                self._draw_bar(n)
+                InstancePanel.reconfigurations += 1
+
+    def _draw_history(self):
+        """Recreates the sparkline bars, e.g. after the canvas was resized."""
+        canvas = self.history_canvas
+        canvas.delete("all")
+        canvas.configure(bg=canvas_background(self))
+        self._bars = [canvas.create_rectangle(0, 0, 0, 0, width=0) for _ in self._history]
+        for n in range(len(self._history)):
+            self._draw_bar(n)
+
+    def _draw_bar(self, n: int):
+        category = self._history[n]
+        step = self.history_canvas.winfo_width() / len(self._history)
+        top = SPARKLINE_HEIGHT * (1 - self.HISTORY_LEVELS.get(category, 0))
+        self.history_canvas.coords(self._bars[n], n * step, top, (n + 1) * step - 1, SPARKLINE_HEIGHT)
+        self.history_canvas.itemconfigure(
+            self._bars[n],
+            fill=self.COLORS[category] if category else "",
+            state="normal" if category else "hidden"
+        )
 
     def _on_run_click(self):
         """Handles Run button click."""
@@ -656,8 +541,15 @@ class InstancePanel(ctk.CTkFrame):
         """Handles Remove button click."""
         self.on_remove(self.instance)
 
+    def set_queue_summary(self, text: str):
+        """Shows the order queue readout (empty hides it)."""
+        self._set("queue_label", text=text)
+
     def _show_menu(self):
-        """Shows a simple info dialog for now."""
+        """Opens the order queue, or a simple info dialog without one."""
+        if self.on_queue:
+            self.on_queue(self.instance)
+            return
         messagebox.showinfo(
             "Instance Info",
             f"Name: {self.instance.name}\n"
@@ -672,6 +564,295 @@ class InstancePanel(ctk.CTkFrame):
         if self.on_settings_changed:
             self.on_settings_changed()
 
+    def show_instance(self, instance: WranglerInstance, status: InstanceStatus, queue_summary: str):
+        """Rebinds a recycled panel to another instance."""
+        self.instance = instance
+        self._set("name_label", text=instance.name)
+        self._set("address_label", text=f"{instance.host}:{instance.port}")
+        if self.go_home_var.get() != instance.go_home_after_session:
+            self.go_home_var.set(instance.go_home_after_session)
+        self.set_queue_summary(queue_summary)
+        self.update_status(status)
+
+
+# =============================================================================
+# Virtualized Panel Grid
+# =============================================================================
+
+class VirtualPanelGrid(ctk.CTkFrame):
+    """Scrollable grid of InstancePanels that only has widgets for the visible rows.
+
+    Rows come from a FleetModel. Panels are kept in a pool sized to the
+    viewport and rebound to whichever instances scroll into view, so a
+    thousand instances cost the same widgets as the dozen on screen.
+    """
+
+    def __init__(self, parent, model: FleetModel, history: StatusHistory,
+                 make_panel: Callable[[WranglerInstance], InstancePanel],
+                 columns: int = PANEL_COLUMNS, row_height: int = PANEL_ROW_HEIGHT, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.model = model
+        self.history = history
+        self.make_panel = make_panel
+        self.columns = columns
+        self.row_height = row_height
+        self.offset = 0  # Pixels scrolled from the top
+
+        self._pool: List[InstancePanel] = []
+        self._bound: Dict[str, InstancePanel] = {}  # key -> visible panel showing it
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.placeholder = ctk.CTkLabel(
+            self.viewport,
+            text="No instances configured.\nClick '+ Add' to add a Wrangler instance.",
+            font=ctk.CTkFont(size=14),
+            text_color="gray"
+        )
+
+        self.viewport.bind("<Configure>", lambda event: self._layout())
+        # Wheel events go to the widget under the pointer, so listen app-wide and filter
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, self._on_wheel, add="+")
+
+    def _on_wheel(self, event):
+        widget = self.winfo_containing(event.x_root, event.y_root)
+        if widget is None or not str(widget).startswith(str(self.viewport)):
+            return
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_by(-self.row_height // 3)
+        else:
+            self.scroll_by(self.row_height // 3)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.offset = int(float(amount) * self._content_height())
+        elif unit == "pages":
+            self.offset += int(amount) * int(self.viewport.winfo_height() / self._get_widget_scaling())
+        else:
+            self.offset += int(amount) * self.row_height // 3
+        self._layout()
+
+    def scroll_by(self, pixels: int):
+        self.offset += pixels
+        self._layout()
+
+    def _content_height(self) -> int:
+        rows = -(-len(self.model) // self.columns)
+        return rows * self.row_height
+
+    def refresh(self):
+        """Rebinds the visible panels after rows were added, removed or reordered."""
+        self._layout()
+
+    def refresh_key(self, key: str):
+        """Redraws one instance if it is on screen; off-screen rows cost nothing."""
+        panel = self._bound.get(key)
+        if panel is not None:
+            panel.update_status(self.model.status(key))
+            panel.set_queue_summary(self.model.queue_text(key))
+            panel.show_history(self.history.sparkline(key))
+
+    def visible_panels(self) -> List[InstancePanel]:
+        return list(self._bound.values())
+
+    def _layout(self):
+        """Places pooled panels over the rows in view and binds them to their instances."""
+        count = len(self.model)
+        # place() scales y, so work in unscaled pixels throughout
+        view_height = max(1, int(self.viewport.winfo_height() / self._get_widget_scaling()))
+        content_height = self._content_height()
+        self.offset = max(0, min(self.offset, content_height - view_height))
+
+        if count == 0:
+            self.placeholder.place(relx=0.5, y=50, anchor="n")
+        else:
+            self.placeholder.place_forget()
+
+        first_row = self.offset // self.row_height
+        last_row = (self.offset + view_height) // self.row_height
+        first = first_row * self.columns
+        visible = min(count, (last_row + 1) * self.columns) - first
+
+        while len(self._pool) < visible:
+            self._pool.append(self.make_panel(self.model.row(first + len(self._pool))))
+
+        # Row i always uses pool slot i % pool size, so scrolling by one row
+        # only rebinds the panels of the row that came into view
+        previous, self._bound = self._bound, {}
+        gap = PANEL_GAP / max(1, self.viewport.winfo_width())  # CTk place() takes no pixel width
+        slots = {index % len(self._pool): index for index in range(first, first + visible)} if self._pool else {}
+        for slot, panel in enumerate(self._pool):
+            index = slots.get(slot)
+            if index is None:
+                panel.place_forget()
+                continue
+            instance = self.model.row(index)
+            if previous.get(instance.key) is not panel or panel.instance is not instance:
+                panel.show_instance(instance, self.model.status(instance.key), self.model.queue_text(instance.key))
+                panel.show_history(self.history.sparkline(instance.key))
+            row, column = divmod(index, self.columns)
+            panel.place(
+                relx=column / self.columns + gap / 2, relwidth=1 / self.columns - gap,
+                y=row * self.row_height - self.offset + PANEL_GAP // 2
+            )
+            self._bound[instance.key] = panel
+
+        if content_height <= view_height:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / content_height, (self.offset + view_height) / content_height)
+
+
+# =============================================================================
+# Fleet Table
+# =============================================================================
+
+class FleetTable(ctk.CTkFrame):
+    """Compact one-row-per-instance view of the fleet for large fleets.
+
+    A single ttk.Treeview shows the FleetModel rows (no widgets per
+    instance); click a heading to sort, type in the filter box to narrow
+    the rows, and select several rows (Shift/Ctrl-click) for the bulk
+    actions, which call on_bulk(action, instances) with "run", "resume"
+    or "stop".
+    """
+
+    def __init__(self, parent, model: FleetModel, on_bulk: Callable[[str, List[WranglerInstance]], None],
+                 **kwargs):
+        super().__init__(parent, **kwargs)
+        self.model = model
+        self.on_bulk = on_bulk
+        self.sort_column: Optional[str] = None
+        self.descending = False
+        self._values: Dict[str, tuple] = {}  # key -> values the row shows
+        self._resort_job = None
+
+        # Filter and bulk actions
+        bar = ctk.CTkFrame(self, fg_color="transparent")
+        bar.pack(fill="x", padx=10, pady=(10, 5))
+
+        self.filter_var = ctk.StringVar()
+        self.filter_var.trace_add("write", lambda *args: self.refresh())
+        ctk.CTkEntry(bar, textvariable=self.filter_var, width=240,
+                     placeholder_text="Filter (name, state, character, ...)").pack(side="left")
+
+        self.selection_label = ctk.CTkLabel(bar, text="", text_color="gray")
+        self.selection_label.pack(side="left", padx=10)
+
+        for text, action in (("Stop", "stop"), ("Resume", "resume"), ("Run", "run")):
+            ctk.CTkButton(bar, text=f"{text} Selected", width=110,
+                          command=lambda a=action: self._bulk(a)).pack(side="right", padx=(5, 0))
+
+        # Table
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self._apply_style()
+        columns = [column_id for column_id, _ in TABLE_COLUMNS]
+        self.tree = ttk.Treeview(body, columns=columns, show="headings", selectmode="extended",
+                                 style="Fleet.Treeview")
+        for column_id, heading in TABLE_COLUMNS:
+            self.tree.heading(column_id, text=heading, command=lambda c=column_id: self.sort_by(c))
+            self.tree.column(column_id, width=TABLE_COLUMN_WIDTHS[column_id], minwidth=50,
+                             stretch=column_id == "file")
+        for category, color in InstancePanel.COLORS.items():
+            self.tree.tag_configure(category, foreground=color)
+
+        scrollbar = ctk.CTkScrollbar(body, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind("<<TreeviewSelect>>", lambda event: self._update_selection_label())
+
+    def _apply_style(self):
+        """Colors the Treeview to match the CustomTkinter appearance mode."""
+        dark = ctk.get_appearance_mode() == "Dark"
+        background, foreground = ("#2b2b2b", "#dcddde") if dark else ("#f2f2f2", "#1e1f22")
+        style = ttk.Style(self)
+        style.theme_use("clam")
+        style.configure("Fleet.Treeview", background=background, fieldbackground=background,
+                        foreground=foreground, rowheight=22, borderwidth=0)
+        style.configure("Fleet.Treeview.Heading", background="#202225" if dark else "#dbdbdb",
+                        foreground=foreground, relief="flat")
+        style.map("Fleet.Treeview", background=[("selected", "#5865f2")], foreground=[("selected", "white")])
+
+    def sort_by(self, column: str):
+        """Sorts by a column; clicking the same heading again reverses the order."""
+        if self.sort_column == column:
+            self.descending = not self.descending
+        else:
+            self.sort_column, self.descending = column, False
+        for column_id, heading in TABLE_COLUMNS:
+            arrow = (" \u25bc" if self.descending else " \u25b2") if column_id == column else ""
+            self.tree.heading(column_id, text=heading + arrow)
+        self.refresh()
+
+    def refresh(self):
+        """Brings rows, their order and their values in line with the model, filter and sort."""
+        self._resort_job = None
+        rows = self.model.table_rows(self.filter_var.get(), self.sort_column, self.descending)
+        wanted = {instance.key for instance in rows}
+
+        gone = [key for key in self._values if key not in wanted]
+        if gone:
+            self.tree.delete(*gone)
+            for key in gone:
+                del self._values[key]
+
+        for instance in rows:
+            key = instance.key
+            if key not in self._values:
+                values = self.model.table_values(instance)
+                self.tree.insert("", "end", iid=key, values=values, tags=(self._tag(key),))
+                self._values[key] = values
+            else:
+                self._update_row(instance)
+
+        order = [instance.key for instance in rows]
+        if list(self.tree.get_children()) != order:
+            for index, key in enumerate(order):
+                self.tree.move(key, "", index)
+        self._update_selection_label()
+
+    def refresh_key(self, key: str):
+        """Updates one row if its text changed; re-sorts once the current batch is done."""
+        instance = self.model.instance(key)
+        if instance is None or key not in self._values:
+            return
+        if self._update_row(instance) and self.sort_column and self._resort_job is None:
+            self._resort_job = self.after_idle(self.refresh)
+
+    def _update_row(self, instance: WranglerInstance) -> bool:
+        values = self.model.table_values(instance)
+        if values == self._values[instance.key]:
+            return False
+        self.tree.item(instance.key, values=values, tags=(self._tag(instance.key),))
+        self._values[instance.key] = values
+        return True
+
+    def _tag(self, key: str) -> str:
+        return describe_state(self.model.status(key))[0]
+
+    def selected(self) -> List[WranglerInstance]:
+        instances = (self.model.instance(key) for key in self.tree.selection())
+        return [instance for instance in instances if instance is not None]
+
+    def _update_selection_label(self):
+        count = len(self.tree.selection())
+        shown = len(self.tree.get_children())
+        text = f"{shown} of {len(self.model)} shown"
+        self.selection_label.configure(text=f"{text}, {count} selected" if count else text)
+
+    def _bulk(self, action: str):
+        instances = self.selected()
+        if instances:
+            self.on_bulk(action, instances)
+
 
 # =============================================================================
 # Advanced Run Dialog
@@ -684,8 +865,8 @@ class AdvancedRunDialog(ctk.CTkToplevel):
                  existing_config: Optional[AdvancedRunConfig] = None):
         super().__init__(parent)
         self.title(f"Advanced Run - {instance_name}")
-        self.geometry("480x520")
-        self.minsize(480, 520)
+        self.geometry("480x660")
+        self.minsize(480, 660)
         self.resizable(True, True)
 
         self.result: Optional[AdvancedRunConfig] = None
@@ -879,11 +1060,44 @@ class AdvancedRunDialog(ctk.CTkToplevel):
         self.end_minute_entry.pack(side="left", padx=2)
         ctk.CTkLabel(end_frame, text="(local time)", text_color="gray").pack(side="left", padx=10)
 
+        # Days
+        days_frame = ctk.CTkFrame(self.schedule_frame, fg_color="transparent")
+        days_frame.pack(fill="x", padx=15, pady=5)
+
+        ctk.CTkLabel(days_frame, text="Days:", width=60).pack(side="left")
+        self.days_var = ctk.StringVar(value=format_days(self.config.schedule_days))
+        ctk.CTkEntry(days_frame, textvariable=self.days_var, width=120,
+                     placeholder_text="every day").pack(side="left", padx=2)
+        ctk.CTkLabel(days_frame, text="(e.g. Mon-Fri,Sun)", text_color="gray").pack(side="left", padx=10)
+
+        # Extra windows
+        ctk.CTkLabel(self.schedule_frame, text="More windows:").pack(anchor="w", padx=15, pady=(5, 0))
+        self.extra_windows_var = ctk.StringVar(value=self.config.schedule_extra_windows)
+        ctk.CTkEntry(
+            self.schedule_frame,
+            textvariable=self.extra_windows_var,
+            placeholder_text="Sat,Sun 10:00-02:00; 18:00-20:00"
+        ).pack(fill="x", padx=15, pady=2)
+
+        # Clock
+        clock_frame = ctk.CTkFrame(self.schedule_frame, fg_color="transparent")
+        clock_frame.pack(fill="x", padx=15, pady=5)
+
+        ctk.CTkLabel(clock_frame, text="Time zone:", width=60).pack(side="left")
+        self.timezone_var = ctk.StringVar(value=self.config.schedule_timezone)
+        ctk.CTkEntry(clock_frame, textvariable=self.timezone_var, width=150,
+                     placeholder_text="local").pack(side="left", padx=2)
+
+        self.eorzea_var = ctk.BooleanVar(value=self.config.schedule_eorzea)
+        ctk.CTkCheckBox(clock_frame, text="Eorzea time", variable=self.eorzea_var).pack(side="left", padx=10)
+
         ctk.CTkLabel(
             self.schedule_frame,
-            text="Runs daily: starts at start time, stops at end time.",
+            text="Runs inside every window and stops at its end. A window that\n"
+                 "ends before it starts runs past midnight.",
             font=ctk.CTkFont(size=11),
-            text_color="gray"
+            text_color="gray",
+            justify="left"
         ).pack(anchor="w", padx=15, pady=(5, 15))
 
         # Button frame
@@ -965,6 +1179,10 @@ class AdvancedRunDialog(ctk.CTkToplevel):
             config.schedule_start_minute = int(self.start_minute_var.get())
             config.schedule_end_hour = int(self.end_hour_var.get())
             config.schedule_end_minute = int(self.end_minute_var.get())
+            config.schedule_days = parse_days(self.days_var.get())
+            config.schedule_extra_windows = self.extra_windows_var.get().strip()
+            config.schedule_timezone = self.timezone_var.get().strip()
+            config.schedule_eorzea = self.eorzea_var.get()
 
             if config.mode == "timer":
                 if config.timer_hours < 0 or config.timer_minutes < 0:
@@ -980,6 +1198,7 @@ class AdvancedRunDialog(ctk.CTkToplevel):
                     raise ValueError("End hour must be 0-23")
                 if not (0 <= config.schedule_end_minute <= 59):
                     raise ValueError("End minute must be 0-59")
+                Schedule.from_config(config)  # Validates extra windows and time zone
 
         except ValueError as e:
             messagebox.showerror("Invalid Input", str(e))
@@ -1089,28 +1308,26 @@ class AddInstanceDialog(ctk.CTkToplevel):
 
 
 # =============================================================================
-# Settings Dialog
+# Discover Dialog
 # =============================================================================
 
-class SettingsDialog(ctk.CTkToplevel):
-    """Dialog for application settings."""
+class DiscoverDialog(ctk.CTkToplevel):
+    """Scans the LAN for Wrangler instances and lets the user pick which to add."""
 
-    def __init__(self, parent, settings: AppSettings, on_apply: Callable):
+    def __init__(self, parent, existing: List[WranglerInstance]):
         super().__init__(parent)
-        self.title("Settings")
-        self.geometry("500x620")
-        self.minsize(500, 620)
+        self.title("Discover Wrangler Instances")
+        self.geometry("520x520")
+        self.minsize(460, 400)
         self.resizable(True, True)
 
-        self.settings = settings
-        self.on_apply = on_apply
-        self._auto_save_enabled = False  # Prevent saves during init
+        self.existing = existing
+        self.result: List[WranglerInstance] = []
+        self.found: List[WranglerInstance] = []
+        self.checkboxes: List[ctk.CTkCheckBox] = []
 
         self._create_widgets()
 
-        # Enable auto-save after widgets are created
-        self._auto_save_enabled = True
-
         # Make dialog modal
         self.transient(parent)
         self.grab_set()
@@ -1123,120 +1340,624 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _create_widgets(self):
         """Creates dialog widgets."""
-        # Main frame
         main_frame = ctk.CTkFrame(self, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=30, pady=30)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
-        # Appearance section
-        ctk.CTkLabel(
-            main_frame,
-            text="Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", pady=(0, 15))
+        # Network field
+        ctk.CTkLabel(main_frame, text="Network (CIDR or host):", font=ctk.CTkFont(size=12)).pack(anchor="w", pady=(0, 5))
+        self.network_entry = ctk.CTkEntry(main_frame, placeholder_text="192.168.1.0/24")
+        self.network_entry.pack(fill="x", pady=(0, 10))
+        self.network_entry.insert(0, local_network())
 
-        # Appearance mode
-        mode_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        mode_frame.pack(fill="x", pady=10)
+        # Ports field
+        ctk.CTkLabel(main_frame, text="Ports:", font=ctk.CTkFont(size=12)).pack(anchor="w", pady=(0, 5))
+        self.ports_entry = ctk.CTkEntry(main_frame, placeholder_text=DEFAULT_PORTS)
+        self.ports_entry.pack(fill="x", pady=(0, 10))
+        self.ports_entry.insert(0, DEFAULT_PORTS)
 
-        ctk.CTkLabel(mode_frame, text="Mode:", width=120).pack(side="left")
-        self.appearance_var = ctk.StringVar(value=self.settings.appearance_mode)
-        self.appearance_menu = ctk.CTkOptionMenu(
-            mode_frame,
-            values=["light", "dark", "system"],
-            variable=self.appearance_var,
-            command=self._on_setting_changed,
-            width=200
+        self.scan_btn = ctk.CTkButton(
+            main_frame,
+            text="Scan",
+            fg_color="#2196f3",
+            hover_color="#1976d2",
+            command=self._on_scan
         )
-        self.appearance_menu.pack(side="left")
+        self.scan_btn.pack(fill="x", pady=(0, 10))
 
-        # Color theme
-        theme_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        theme_frame.pack(fill="x", pady=10)
+        self.progress_label = ctk.CTkLabel(main_frame, text="", font=ctk.CTkFont(size=11), text_color="gray")
+        self.progress_label.pack(anchor="w")
 
-        ctk.CTkLabel(theme_frame, text="Color Theme:", width=120).pack(side="left")
-        self.theme_var = ctk.StringVar(value=self.settings.color_theme)
-        self.theme_menu = ctk.CTkOptionMenu(
-            theme_frame,
-            values=AVAILABLE_THEMES,
-            variable=self.theme_var,
-            command=self._on_setting_changed,
-            width=200
-        )
-        self.theme_menu.pack(side="left")
+        self.results_frame = ctk.CTkScrollableFrame(main_frame)
+        self.results_frame.pack(fill="both", expand=True, pady=(5, 15))
 
-        # Font section
-        ctk.CTkLabel(
-            main_frame,
-            text="Font",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", pady=(20, 15))
+        # Button frame
+        btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        btn_frame.pack(fill="x")
 
-        # Font family
-        font_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        font_frame.pack(fill="x", pady=10)
+        ctk.CTkButton(
+            btn_frame,
+            text="Cancel",
+            fg_color="gray",
+            hover_color="gray30",
+            width=100,
+            command=self.destroy
+        ).pack(side="right", padx=5)
 
-        ctk.CTkLabel(font_frame, text="Family:", width=120).pack(side="left")
-        self.font_var = ctk.StringVar(value=self.settings.font_family)
-        self.font_menu = ctk.CTkOptionMenu(
-            font_frame,
-            values=AVAILABLE_FONTS,
-            variable=self.font_var,
-            command=self._on_setting_changed,
-            width=200
+        self.add_btn = ctk.CTkButton(
+            btn_frame,
+            text="Add Selected",
+            fg_color="#5865f2",
+            hover_color="#4752c4",
+            width=120,
+            state="disabled",
+            command=self._on_add
         )
-        self.font_menu.pack(side="left")
+        self.add_btn.pack(side="right", padx=5)
 
-        # Font size
-        size_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        size_frame.pack(fill="x", pady=10)
+    def _on_scan(self):
+        """Runs the sweep on a background thread."""
+        network = self.network_entry.get().strip()
+        ports = self.ports_entry.get().strip() or DEFAULT_PORTS
 
-        ctk.CTkLabel(size_frame, text="Size:", width=120).pack(side="left")
+        self.scan_btn.configure(state="disabled")
+        self.add_btn.configure(state="disabled")
+        for widget in self.results_frame.winfo_children():
+            widget.destroy()
+        self.checkboxes.clear()
 
-        self.font_size_var = ctk.IntVar(value=self.settings.font_size)
-        self.font_size_slider = ctk.CTkSlider(
-            size_frame,
-            from_=10,
-            to=18,
-            number_of_steps=8,
-            variable=self.font_size_var,
-            command=self._on_font_size_changed,
-            width=150
-        )
-        self.font_size_slider.pack(side="left", padx=(0, 10))
+        def progress(message: str):
+            self.after(0, lambda: self.progress_label.configure(text=message))
 
-        self.font_size_label = ctk.CTkLabel(
-            size_frame,
-            text=f"{self.settings.font_size}pt",
-            width=40
-        )
-        self.font_size_label.pack(side="left")
+        def scan():
+            try:
+                found = discover_instances(network, ports, self.existing, on_progress=progress)
+                self.after(0, lambda: self._show_results(found))
+            except ValueError as e:
+                message = str(e)  # e is cleared when the except block ends
+                self.after(0, lambda: self._show_error(message))
 
-        # Background section
-        ctk.CTkLabel(
-            main_frame,
-            text="Background",
-            font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(anchor="w", pady=(20, 15))
+        threading.Thread(target=scan, daemon=True).start()
 
-        # Background image
-        bg_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
-        bg_frame.pack(fill="x", pady=10)
+    def _show_error(self, message: str):
+        self.scan_btn.configure(state="normal")
+        self.progress_label.configure(text=message)
 
-        ctk.CTkLabel(bg_frame, text="Image:", width=120).pack(side="left")
+    def _show_results(self, found: List[WranglerInstance]):
+        """Lists discovered instances as checkboxes, all selected."""
+        self.scan_btn.configure(state="normal")
+        self.found = found
 
-        self.bg_path_var = ctk.StringVar(value=self.settings.background_image)
-        self.bg_entry = ctk.CTkEntry(
-            bg_frame,
-            textvariable=self.bg_path_var,
-            width=200,
-            placeholder_text="No image selected"
-        )
-        self.bg_entry.pack(side="left", padx=(0, 10))
+        for instance in found:
+            checkbox = ctk.CTkCheckBox(self.results_frame, text=f"{instance.name}  ({instance.key})")
+            checkbox.select()
+            checkbox.pack(anchor="w", pady=2)
+            self.checkboxes.append(checkbox)
 
-        ctk.CTkButton(
-            bg_frame,
-            text="Browse",
-            width=70,
+        if found:
+            self.add_btn.configure(state="normal")
+
+    def _on_add(self):
+        """Returns the checked instances."""
+        self.result = [
+            instance for instance, checkbox in zip(self.found, self.checkboxes)
+            if checkbox.get()
+        ]
+        self.destroy()
+
+
+# =============================================================================
+# Bulk Results Dialog
+# =============================================================================
+
+class BulkResultsDialog(ctk.CTkToplevel):
+    """Shows the per-instance outcome of a bulk action."""
+
+    def __init__(self, parent, title: str, results: List[DispatchResult]):
+        super().__init__(parent)
+        self.title(title)
+        self.geometry("640x400")
+        self.minsize(480, 300)
+        self.resizable(True, True)
+
+        self._create_widgets(results)
+
+        self.transient(parent)
+
+        # Center on parent
+        self.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        self.geometry(f"+{x}+{y}")
+
+    def _create_widgets(self, results: List[DispatchResult]):
+        """Creates dialog widgets."""
+        successes, failures, skipped = summarize_results(results)
+
+        ctk.CTkLabel(
+            self,
+            text=f"{successes} succeeded, {failures} failed, {skipped} skipped",
+            font=ctk.CTkFont(size=13, weight="bold")
+        ).pack(anchor="w", padx=20, pady=(20, 10))
+
+        table = ctk.CTkTextbox(self, font=ctk.CTkFont(family="Consolas", size=12), wrap="none")
+        table.pack(fill="both", expand=True, padx=20)
+        table.insert("1.0", format_results_table(results))
+        table.configure(state="disabled")
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=20, pady=20)
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Close",
+            fg_color="gray",
+            hover_color="gray30",
+            width=100,
+            command=self.destroy
+        ).pack(side="right", padx=5)
+
+
+# =============================================================================
+# Order Queue Dialog
+# =============================================================================
+
+class OrderQueueDialog(ctk.CTkToplevel):
+    """Edits an instance's order queue: add, remove, reorder, pause."""
+
+    def __init__(self, parent, instance: WranglerInstance, queue: OrderQueueManager):
+        super().__init__(parent)
+        self.title(f"Order Queue - {instance.name}")
+        self.geometry("560x440")
+        self.minsize(420, 320)
+        self.resizable(True, True)
+
+        self.instance = instance
+        self.queue = queue
+
+        self._create_widgets()
+        self.refresh()
+
+        self.transient(parent)
+
+        # Center on parent
+        self.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        self.geometry(f"+{x}+{y}")
+
+    def _create_widgets(self):
+        """Creates dialog widgets."""
+        ctk.CTkLabel(
+            self,
+            text=f"{self.instance.host}:{self.instance.port}",
+            font=ctk.CTkFont(size=11),
+            text_color="gray"
+        ).pack(anchor="w", padx=20, pady=(15, 0))
+
+        self.summary_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=13, weight="bold"))
+        self.summary_label.pack(anchor="w", padx=20, pady=(0, 5))
+
+        self.running_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=11), text_color="gray")
+        self.running_label.pack(anchor="w", padx=20)
+
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True, padx=20, pady=5)
+
+        self.listbox = Listbox(body, activestyle="none", borderwidth=0, highlightthickness=0,
+                               font=("Consolas", 11), exportselection=False)
+        self.listbox.pack(side="left", fill="both", expand=True)
+
+        side = ctk.CTkFrame(body, fg_color="transparent")
+        side.pack(side="left", fill="y", padx=(10, 0))
+
+        for text, command in (("Add...", self._add), ("Up", lambda: self._move(-1)),
+                              ("Down", lambda: self._move(1)), ("Remove", self._remove),
+                              ("Clear", self._clear)):
+            ctk.CTkButton(side, text=text, width=90, command=command).pack(pady=3)
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=20, pady=15)
+
+        self.pause_btn = ctk.CTkButton(btn_frame, text="Pause", width=100, command=self._toggle_pause)
+        self.pause_btn.pack(side="left", padx=5)
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Close",
+            fg_color="gray",
+            hover_color="gray30",
+            width=100,
+            command=self.destroy
+        ).pack(side="right", padx=5)
+
+    def refresh(self):
+        """Redraws the list and readout from the instance's queue."""
+        selection = self.listbox.curselection()
+        self.listbox.delete(0, "end")
+        for index, path in enumerate(self.instance.order_queue, 1):
+            self.listbox.insert("end", f"{index:>2}. {os.path.basename(path)}")
+        if selection and selection[0] < self.listbox.size():
+            self.listbox.selection_set(selection[0])
+
+        paused = " (paused)" if self.instance.queue_paused else ""
+        rate = self.queue.orders_per_hour(self.instance.key)
+        self.summary_label.configure(
+            text=f"{len(self.instance.order_queue)} queued{paused} - {rate:.1f} orders/hour"
+        )
+        running = self.queue.running(self.instance.key)
+        self.running_label.configure(text=f"Running: {os.path.basename(running)}" if running else "")
+        self.pause_btn.configure(text="Resume Queue" if self.instance.queue_paused else "Pause")
+
+    def _selected(self) -> Optional[int]:
+        selection = self.listbox.curselection()
+        return selection[0] if selection else None
+
+    def _add(self):
+        paths = filedialog.askopenfilenames(
+            parent=self,
+            title="Add Order Files",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+        )
+        if paths:
+            self.queue.add(self.instance, paths)
+
+    def _move(self, offset: int):
+        index = self._selected()
+        if index is None:
+            return
+        target = self.queue.move(self.instance, index, offset)
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(target)
+        self.refresh()
+
+    def _remove(self):
+        index = self._selected()
+        if index is not None:
+            self.queue.remove(self.instance, index)
+
+    def _clear(self):
+        if self.instance.order_queue and messagebox.askyesno(
+                "Clear Queue", f"Remove all queued orders for '{self.instance.name}'?", parent=self):
+            self.queue.clear(self.instance)
+
+    def _toggle_pause(self):
+        self.queue.set_paused(self.instance, not self.instance.queue_paused)
+
+
+# =============================================================================
+# Shard Dialog
+# =============================================================================
+
+class ShardDialog(ctk.CTkToplevel):
+    """Splits one order file across the selected instances."""
+
+    def __init__(self, parent, instances: List[WranglerInstance],
+                 get_planner: Callable[[], tuple], statuses: Dict[str, InstanceStatus],
+                 json_path: str = ""):
+        super().__init__(parent)
+        self.title("Shard Order Across Instances")
+        self.geometry("520x560")
+        self.minsize(460, 440)
+        self.resizable(True, True)
+
+        self.instances = instances
+        self.statuses = statuses
+        self.estimator: Optional[WorkEstimator] = None
+        self.placement: Optional[PlacementEngine] = None
+        self.orders: List[dict] = []
+        self.checkboxes: List[ctk.CTkCheckBox] = []
+        self.result: Optional[tuple] = None  # (shards, instances)
+
+        self._create_widgets()
+        if json_path:
+            self._load_order(json_path)
+
+        # Recipes take a moment to read - load them off the UI thread
+        def load():
+            estimator, placement = get_planner()
+            self.after(0, lambda: self._set_planner(estimator, placement))
+        threading.Thread(target=load, daemon=True).start()
+
+        # Make dialog modal
+        self.transient(parent)
+        self.grab_set()
+
+        # Center on parent
+        self.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        self.geometry(f"+{x}+{y}")
+
+    def _create_widgets(self):
+        """Creates dialog widgets."""
+        main_frame = ctk.CTkFrame(self, fg_color="transparent")
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+        # Order file
+        ctk.CTkLabel(main_frame, text="Order file:", font=ctk.CTkFont(size=12)).pack(anchor="w", pady=(0, 5))
+        file_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+        file_row.pack(fill="x", pady=(0, 10))
+        self.path_label = ctk.CTkLabel(file_row, text="(none)", anchor="w", font=ctk.CTkFont(size=11))
+        self.path_label.pack(side="left", fill="x", expand=True)
+        ctk.CTkButton(file_row, text="Browse...", width=90, command=self._browse).pack(side="right")
+
+        # Shards per instance
+        per_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+        per_row.pack(fill="x", pady=(0, 10))
+        ctk.CTkLabel(per_row, text="Shards per instance:", font=ctk.CTkFont(size=12)).pack(side="left")
+        self.per_instance_var = ctk.StringVar(value=str(SHARDS_PER_INSTANCE))
+        ctk.CTkOptionMenu(
+            per_row,
+            values=["1", "2", "3", "4", "6", "8"],
+            variable=self.per_instance_var,
+            width=70,
+            command=lambda value: self._update_plan()
+        ).pack(side="left", padx=10)
+
+        # Participants
+        ctk.CTkLabel(main_frame, text="Instances:", font=ctk.CTkFont(size=12)).pack(anchor="w", pady=(0, 5))
+        instances_frame = ctk.CTkScrollableFrame(main_frame)
+        instances_frame.pack(fill="both", expand=True, pady=(0, 10))
+        for instance in self.instances:
+            checkbox = ctk.CTkCheckBox(
+                instances_frame,
+                text=f"{instance.name}  ({instance.key})",
+                command=self._update_plan
+            )
+            if instance.enabled:
+                checkbox.select()
+            checkbox.pack(anchor="w", pady=2)
+            self.checkboxes.append(checkbox)
+
+        self.plan_label = ctk.CTkLabel(
+            main_frame, text="Loading recipes...", font=ctk.CTkFont(size=11),
+            text_color="gray", wraplength=460, justify="left"
+        )
+        self.plan_label.pack(anchor="w", pady=(0, 10))
+
+        # Button frame
+        btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        btn_frame.pack(fill="x")
+
+        ctk.CTkButton(
+            btn_frame,
+            text="Cancel",
+            fg_color="gray",
+            hover_color="gray30",
+            width=100,
+            command=self.destroy
+        ).pack(side="right", padx=5)
+
+        self.start_btn = ctk.CTkButton(
+            btn_frame,
+            text="Start",
+            fg_color="#57f287",
+            hover_color="#46c46f",
+            text_color="#000000",
+            text_color_disabled="#666666",
+            width=100,
+            state="disabled",
+            command=self._on_start
+        )
+        self.start_btn.pack(side="right", padx=5)
+
+    def _browse(self):
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Select Order File to Shard",
+            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
+        )
+        if path:
+            self._load_order(path)
+
+    def _load_order(self, path: str):
+        try:
+            self.orders = load_order(path)
+        except (OSError, ValueError) as e:
+            self.orders = []
+            messagebox.showerror("Invalid Order", f"Could not read {os.path.basename(path)}:\n{e}", parent=self)
+            return
+        self.path_label.configure(text=os.path.basename(path))
+        self._update_plan()
+
+    def _set_planner(self, estimator: WorkEstimator, placement: Optional[PlacementEngine]):
+        if not self.winfo_exists():
+            return
+        self.estimator = estimator
+        self.placement = placement
+        self._update_plan()
+
+    def _selected(self) -> List[WranglerInstance]:
+        return [
+            instance for instance, checkbox in zip(self.instances, self.checkboxes)
+            if checkbox.get()
+        ]
+
+    def _plan(self) -> tuple:
+        """Returns (shards, lines no selected character can craft)."""
+        selected = self._selected()
+        count = len(selected) * int(self.per_instance_var.get())
+        if self.placement is None:
+            return plan_shards(self.orders, count, self.estimator), []
+        characters = self.placement.characters_for({i.key: self.statuses.get(i.key) for i in selected})
+        return plan_placed_shards(self.orders, count, self.estimator, self.placement, characters)
+
+    def _update_plan(self):
+        """Recomputes the plan preview for the current file and selection."""
+        if self.estimator is None:
+            return
+        selected = self._selected()
+        shards, unplaceable = self._plan() if self.orders and selected else ([], [])
+        if not shards:
+            self.plan_label.configure(text="Choose an order file and at least one instance.")
+            self.start_btn.configure(state="disabled")
+            return
+
+        text = describe_plan(shards, len(selected))
+        if not self.estimator.recipes:
+            text += "\nrecipes.csv not found - shards are balanced by item count."
+        elif self.placement is None:
+            text += "\nNo gearsets found - every instance is assumed able to craft everything."
+        if unplaceable:
+            text += f"\n{len(unplaceable)} line(s) no selected character can craft will be left out."
+        self.plan_label.configure(text=text)
+        self.start_btn.configure(state="normal")
+
+    def _on_start(self):
+        """Returns the plan and the participating instances."""
+        self.result = (self._plan()[0], self._selected())
+        self.destroy()
+
+
+# =============================================================================
+# Settings Dialog
+# =============================================================================
+
+class SettingsDialog(ctk.CTkToplevel):
+    """Dialog for application settings."""
+
+    def __init__(self, parent, settings: AppSettings, on_apply: Callable):
+        super().__init__(parent)
+        self.title("Settings")
+        self.geometry("500x800")
+        self.minsize(500, 800)
+        self.resizable(True, True)
+
+        self.settings = settings
+        self.on_apply = on_apply
+        self._auto_save_enabled = False  # Prevent saves during init
+
+        self._create_widgets()
+
+        # Enable auto-save after widgets are created
+        self._auto_save_enabled = True
+
+        # Make dialog modal
+        self.transient(parent)
+        self.grab_set()
+
+        # Center on parent
+        self.update_idletasks()
+        x = parent.winfo_x() + (parent.winfo_width() - self.winfo_width()) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - self.winfo_height()) // 2
+        self.geometry(f"+{x}+{y}")
+
+    def _create_widgets(self):
+        """Creates dialog widgets."""
+        # Main frame
+        main_frame = ctk.CTkFrame(self, fg_color="transparent")
+        main_frame.pack(fill="both", expand=True, padx=30, pady=30)
+
+        # Appearance section
+        ctk.CTkLabel(
+            main_frame,
+            text="Appearance",
+            font=ctk.CTkFont(size=16, weight="bold")
+        ).pack(anchor="w", pady=(0, 15))
+
+        # Appearance mode
+        mode_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        mode_frame.pack(fill="x", pady=10)
+
+        ctk.CTkLabel(mode_frame, text="Mode:", width=120).pack(side="left")
+        self.appearance_var = ctk.StringVar(value=self.settings.appearance_mode)
+        self.appearance_menu = ctk.CTkOptionMenu(
+            mode_frame,
+            values=["light", "dark", "system"],
+            variable=self.appearance_var,
+            command=self._on_setting_changed,
+            width=200
+        )
+        self.appearance_menu.pack(side="left")
+
+        # Color theme
+        theme_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        theme_frame.pack(fill="x", pady=10)
+
+        ctk.CTkLabel(theme_frame, text="Color Theme:", width=120).pack(side="left")
+        self.theme_var = ctk.StringVar(value=self.settings.color_theme)
+        self.theme_menu = ctk.CTkOptionMenu(
+            theme_frame,
+            values=AVAILABLE_THEMES,
+            variable=self.theme_var,
+            command=self._on_setting_changed,
+            width=200
+        )
+        self.theme_menu.pack(side="left")
+
+        # Font section
+        ctk.CTkLabel(
+            main_frame,
+            text="Font",
+            font=ctk.CTkFont(size=16, weight="bold")
+        ).pack(anchor="w", pady=(20, 15))
+
+        # Font family
+        font_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        font_frame.pack(fill="x", pady=10)
+
+        ctk.CTkLabel(font_frame, text="Family:", width=120).pack(side="left")
+        self.font_var = ctk.StringVar(value=self.settings.font_family)
+        self.font_menu = ctk.CTkOptionMenu(
+            font_frame,
+            values=AVAILABLE_FONTS,
+            variable=self.font_var,
+            command=self._on_setting_changed,
+            width=200
+        )
+        self.font_menu.pack(side="left")
+
+        # Font size
+        size_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        size_frame.pack(fill="x", pady=10)
+
+        ctk.CTkLabel(size_frame, text="Size:", width=120).pack(side="left")
+
+        self.font_size_var = ctk.IntVar(value=self.settings.font_size)
+        self.font_size_slider = ctk.CTkSlider(
+            size_frame,
+            from_=10,
+            to=18,
+            number_of_steps=8,
+            variable=self.font_size_var,
+            command=self._on_font_size_changed,
+            width=150
+        )
+        self.font_size_slider.pack(side="left", padx=(0, 10))
+
+        self.font_size_label = ctk.CTkLabel(
+            size_frame,
+            text=f"{self.settings.font_size}pt",
+            width=40
+        )
+        self.font_size_label.pack(side="left")
+
+        # Background section
+        ctk.CTkLabel(
+            main_frame,
+            text="Background",
+            font=ctk.CTkFont(size=16, weight="bold")
+        ).pack(anchor="w", pady=(20, 15))
+
+        # Background image
+        bg_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        bg_frame.pack(fill="x", pady=10)
+
+        ctk.CTkLabel(bg_frame, text="Image:", width=120).pack(side="left")
+
+        self.bg_path_var = ctk.StringVar(value=self.settings.background_image)
+        self.bg_entry = ctk.CTkEntry(
+            bg_frame,
+            textvariable=self.bg_path_var,
+            width=200,
+            placeholder_text="No image selected"
+        )
+        self.bg_entry.pack(side="left", padx=(0, 10))
+
+        ctk.CTkButton(
+            bg_frame,
+            text="Browse",
+            width=70,
             command=self._browse_background
         ).pack(side="left")
 
@@ -1277,6 +1998,68 @@ class SettingsDialog(ctk.CTkToplevel):
             command=self._clear_background
         ).pack(side="left", padx=(120, 0))
 
+        # Rollout section
+        ctk.CTkLabel(
+            main_frame,
+            text="Fleet Rollout",
+            font=ctk.CTkFont(size=16, weight="bold")
+        ).pack(anchor="w", pady=(20, 15))
+
+        per_host_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        per_host_frame.pack(fill="x", pady=5)
+
+        ctk.CTkLabel(per_host_frame, text="Starts per host:", width=120).pack(side="left")
+        self.per_host_var = ctk.StringVar(value=str(self.settings.rollout_max_per_host))
+        ctk.CTkOptionMenu(
+            per_host_frame,
+            values=["1", "2", "3", "4", "6", "8", "16"],
+            variable=self.per_host_var,
+            command=self._on_setting_changed,
+            width=80
+        ).pack(side="left")
+
+        spacing_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        spacing_frame.pack(fill="x", pady=5)
+
+        ctk.CTkLabel(spacing_frame, text="Spacing (sec):", width=120).pack(side="left")
+        self.spacing_var = ctk.StringVar(value=f"{self.settings.rollout_spacing:g}")
+        ctk.CTkOptionMenu(
+            spacing_frame,
+            values=["0", "2", "5", "10", "20", "30", "60"],
+            variable=self.spacing_var,
+            command=self._on_setting_changed,
+            width=80
+        ).pack(side="left")
+
+        self.ramp_var = ctk.BooleanVar(value=self.settings.rollout_ramp)
+        ctk.CTkCheckBox(
+            main_frame,
+            text="Wait for each instance to be executing before starting the next",
+            variable=self.ramp_var,
+            command=self._on_setting_changed
+        ).pack(anchor="w", pady=5)
+
+        # Gearsets folder for order placement
+        gear_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        gear_frame.pack(fill="x", pady=10)
+
+        ctk.CTkLabel(gear_frame, text="Lisbeth Debug:", width=120).pack(side="left")
+
+        self.gear_dir_var = ctk.StringVar(value=self.settings.lisbeth_debug_dir)
+        ctk.CTkEntry(
+            gear_frame,
+            textvariable=self.gear_dir_var,
+            width=200,
+            placeholder_text="Auto (next to the master)"
+        ).pack(side="left", padx=(0, 10))
+
+        ctk.CTkButton(
+            gear_frame,
+            text="Browse",
+            width=70,
+            command=self._browse_gear_dir
+        ).pack(side="left")
+
         # Note about theme changes
         note_label = ctk.CTkLabel(
             main_frame,
@@ -1332,6 +2115,13 @@ class SettingsDialog(ctk.CTkToplevel):
             self.bg_path_var.set(path)
             self._apply_settings()
 
+    def _browse_gear_dir(self):
+        """Selects the Lisbeth Debug folder holding <Character>_<World>/Gearsets."""
+        path = filedialog.askdirectory(title="Select Lisbeth Debug Folder")
+        if path:
+            self.gear_dir_var.set(path)
+            self._apply_settings()
+
     def _clear_background(self):
         """Clears the background image selection."""
         self.bg_path_var.set("")
@@ -1345,6 +2135,10 @@ class SettingsDialog(ctk.CTkToplevel):
         self.settings.background_opacity = self.opacity_var.get()
         self.settings.font_family = self.font_var.get()
         self.settings.font_size = int(self.font_size_var.get())
+        self.settings.rollout_max_per_host = int(self.per_host_var.get())
+        self.settings.rollout_spacing = float(self.spacing_var.get())
+        self.settings.rollout_ramp = self.ramp_var.get()
+        self.settings.lisbeth_debug_dir = self.gear_dir_var.get().strip()
         self.on_apply(self.settings)
 
 
@@ -1371,28 +2165,73 @@ class WranglerMasterApp(ctk.CTk):
 
         # Data
         self.instances: List[WranglerInstance] = []
-        self.panels: Dict[str, InstancePanel] = {}
+        self.model = FleetModel()  # Rows and last status; panels only exist for visible rows
+        self.updates = UpdateBatch()  # Background results waiting for the next UI flush
+        self.history = StatusHistory()  # Recent polls per instance, for sparklines and the fleet graph
+        self.config_writer = ConfigWriter(CONFIG_DIR / CONFIG_FILENAME, on_error=self._on_config_error)
         self.polling_active = True
+        self.client = WranglerClient()
+        self.telemetry = TelemetryStore(CONFIG_DIR / TELEMETRY_FILENAME, on_error=self._post_message)
+        self.client.on_command = lambda i, *outcome: self.telemetry.record_command(i.key, *outcome)
+        self.poller = FleetPoller(lambda i: self.client.get_status(i, conditional=True))
+        self.poll_scheduler = PollScheduler()
+        self.dispatcher = BulkDispatcher()
+        self.throttle = StartThrottle(
+            self.client,
+            self.app_settings.rollout_max_per_host,
+            self.app_settings.rollout_spacing,
+            self.app_settings.rollout_ramp
+        )
+        self.streams = StatusStreamManager(
+            self.client,
+            on_status=lambda i, s: self._post_status(i, s, pushed=True),
+            on_disconnect=lambda i: self.poll_scheduler.poll_soon(i.key)
+        )
 
         # Default JSON path for run commands
         self.default_json_path = ""
 
-        # Advanced run tracking
-        self.active_timers: Dict[str, dict] = {}
-        self.active_schedules: Dict[str, dict] = {}
+        # Advanced run tracking (timers and schedules)
+        self.runs = AdvancedRunManager(
+            self.client,
+            get_json_path=lambda: self.default_json_path,
+            on_message=self._post_message,
+            on_status=self._post_status,
+            journal=RunJournal(CONFIG_DIR / JOURNAL_FILENAME),
+            throttle=self.throttle,
+            on_transition=self.telemetry.record_transition
+        )
+
+        # Per-instance order queues
+        self.queue = OrderQueueManager(
+            self.client,
+            on_message=self._post_message,
+            on_change=lambda i: self.after(0, lambda: self._on_queue_changed(i)),
+            throttle=self.throttle,
+            poll_soon=self.poll_scheduler.poll_soon
+        )
+        self._queue_dialog: Optional[OrderQueueDialog] = None
+
+        # Order sharding across instances
+        self.shard_run: Optional[ShardRun] = None
+        self._recipes: Optional[dict] = None
 
         # Background image
         self.bg_image = None
         self.bg_label = None
         self._bg_photo = None  # Keep reference to prevent garbage collection
-        self._cached_bg_pil = None  # Cache the processed PIL image
+        self._bg_size = None  # Window size the background was last requested for
         self._resize_job = None  # For debouncing resize events
+        self.bg_renderer = BackgroundRenderer(
+            on_ready=lambda *result: self.after(0, lambda: self._show_background(*result))
+        )
 
         # Create UI
         self._create_ui()
 
         # Load config and start polling
         self._load_config()
+        self.runs.recover(self.instances)  # Timers and schedules from before a restart
         self._start_polling()
 
         # Handle window close
@@ -1451,85 +2290,70 @@ class WranglerMasterApp(ctk.CTk):
         self._setup_background()
 
     def _setup_background(self):
-        """Sets up background image if configured."""
-        if self.app_settings.background_image and os.path.exists(self.app_settings.background_image):
-            try:
-                # Load and cache the PIL image (original size)
-                self._cached_bg_pil = self._load_background_with_opacity()
-                if self._cached_bg_pil:
-                    # Get initial size - use actual window size or defaults
-                    width = self.winfo_width()
-                    height = self.winfo_height()
-                    if width < 100:
-                        width = 950
-                    if height < 100:
-                        height = 750
-
-                    # Resize cached image for display
-                    resized = self._cached_bg_pil.resize((width, height), Image.Resampling.LANCZOS)
-
-                    # Use ImageTk for raw tkinter compatibility
-                    self._bg_photo = ImageTk.PhotoImage(resized)
-
-                    # Use raw tkinter Label for better stacking control
-                    import tkinter as tk
-                    self.bg_label = tk.Label(self, image=self._bg_photo, bd=0, highlightthickness=0)
-                    self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-
-                    # Lower it to the very bottom of the stacking order
-                    self.bg_label.lower()
-
-                    # Bind resize event to update background (debounced)
-                    self.bind("<Configure>", self._on_resize)
-            except Exception as e:
-                print(f"Failed to load background image: {e}")
-
-    def _load_background_with_opacity(self) -> Optional[Image.Image]:
-        """Loads background image at full opacity."""
-        if not self.app_settings.background_image:
-            return None
-
-        try:
-            img = Image.open(self.app_settings.background_image).convert("RGB")
-            return img
-        except Exception as e:
-            print(f"Failed to process background image: {e}")
-            return None
+        """Sets up background image if configured (decoded and scaled in a worker thread)."""
+        path = self.app_settings.background_image
+        if not (path and os.path.exists(path)):
+            self.bg_renderer.load(None, (0, 0))
+            return
+        self.bg_renderer.load(path, (self.winfo_screenwidth(), self.winfo_screenheight()))
+        self._bg_size = self._window_size()
+        self.bg_renderer.request(self._bg_size)
+
+        # Bind resize event to update background (debounced)
+        self.bind("<Configure>", self._on_resize)
+
+    def _window_size(self) -> tuple:
+        """Current window size - or defaults before the window is mapped."""
+        width = self.winfo_width()
+        height = self.winfo_height()
+        return (width if width >= 100 else 950, height if height >= 100 else 750)
+
+    def _show_background(self, generation: int, size: tuple, image: Image.Image, final: bool):
+        """Shows a render from the background worker (UI thread)."""
+        if generation != self.bg_renderer.generation or size != self._bg_size:
+            return  # Another image was chosen, or the window has been resized since
+
+        # Use ImageTk for raw tkinter compatibility
+        self._bg_photo = ImageTk.PhotoImage(image)
+
+        if self.bg_label is None:
+            # Use raw tkinter Label for better stacking control
+            import tkinter as tk
+            self.bg_label = tk.Label(self, image=self._bg_photo, bd=0, highlightthickness=0)
+            self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+
+            # Lower it to the very bottom of the stacking order
+            self.bg_label.lower()
+        else:
+            self.bg_label.configure(image=self._bg_photo)
 
     def _on_resize(self, event=None):
-        """Updates background image size on window resize (debounced)."""
-        if not self._cached_bg_pil or not self.bg_label:
+        """Updates background image size on window resize.
+
+        Every size change asks for a fast preview; the high-quality render
+        follows once no resize event has arrived for SETTLE_DELAY.
+        """
+        if event is not None and event.widget is not self:
+            return  # <Configure> of a child widget
+        if not self.app_settings.background_image:
             return
 
-        # Cancel any pending resize job
+        size = (self.winfo_width(), self.winfo_height())
+        if size == self._bg_size:
+            return
+        self._bg_size = size
+        self.bg_renderer.request(size, final=False)
+
+        # Cancel any pending final render
         if self._resize_job:
             self.after_cancel(self._resize_job)
-
-        # Schedule the actual resize after 100ms of no resize events
-        self._resize_job = self.after(100, self._do_resize)
+        self._resize_job = self.after(int(SETTLE_DELAY * 1000), self._do_resize)
 
     def _do_resize(self):
-        """Actually performs the background resize."""
+        """Asks the worker for the high-quality render at the settled size."""
         self._resize_job = None
-
-        if not self._cached_bg_pil or not self.bg_label:
-            return
-
-        try:
-            width = self.winfo_width()
-            height = self.winfo_height()
-
-            if width < 10 or height < 10:
-                return
-
-            # Resize from cached PIL image (fast)
-            resized = self._cached_bg_pil.resize((width, height), Image.Resampling.LANCZOS)
-
-            # Update the PhotoImage
-            self._bg_photo = ImageTk.PhotoImage(resized)
-            self.bg_label.configure(image=self._bg_photo)
-        except Exception:
-            pass
+        if self._bg_size:
+            self.bg_renderer.request(self._bg_size, final=True)
 
     def _create_toolbar(self):
         """Creates the toolbar with master controls."""
@@ -1563,6 +2387,18 @@ class WranglerMasterApp(ctk.CTk):
         )
         self.settings_btn.pack(side="left", padx=5)
 
+        self.view_btn = ctk.CTkButton(
+            btn_frame,
+            text=self._view_button_text(),
+            font=self.get_font(size=12),
+            fg_color="gray",
+            hover_color="gray30",
+            width=90,
+            height=32,
+            command=self._toggle_view
+        )
+        self.view_btn.pack(side="left", padx=5)
+
         self.refresh_btn = ctk.CTkButton(
             btn_frame,
             text="Refresh",
@@ -1587,6 +2423,30 @@ class WranglerMasterApp(ctk.CTk):
         )
         self.add_btn.pack(side="left", padx=5)
 
+        self.discover_btn = ctk.CTkButton(
+            btn_frame,
+            text="Discover",
+            font=self.get_font(size=12),
+            fg_color="#3498db",
+            hover_color="#2980b9",
+            width=90,
+            height=32,
+            command=self._discover_dialog
+        )
+        self.discover_btn.pack(side="left", padx=5)
+
+        self.shard_btn = ctk.CTkButton(
+            btn_frame,
+            text="Shard",
+            font=self.get_font(size=12),
+            fg_color="#3498db",
+            hover_color="#2980b9",
+            width=90,
+            height=32,
+            command=self._shard_dialog
+        )
+        self.shard_btn.pack(side="left", padx=5)
+
         self.stop_all_btn = ctk.CTkButton(
             btn_frame,
             text="Stop All",
@@ -1627,11 +2487,64 @@ class WranglerMasterApp(ctk.CTk):
 
     def _create_main_area(self):
         """Creates the main scrollable area for instance panels."""
-        self.panels_scroll = ctk.CTkScrollableFrame(
+        self.panels_scroll = VirtualPanelGrid(
             self.main_container,
+            self.model,
+            self.history,
+            self._make_panel,
             corner_radius=10
         )
-        self.panels_scroll.pack(fill="both", expand=True, padx=15, pady=15)
+        self.fleet_table: Optional[FleetTable] = None  # Created on first use
+        self._show_view()
+
+    @property
+    def view(self):
+        """The instance list on screen: the card grid or the table."""
+        return self.fleet_table if self.app_settings.view_mode == "table" else self.panels_scroll
+
+    def _show_view(self):
+        """Packs the view chosen in the settings and hides the other one."""
+        if self.app_settings.view_mode == "table" and self.fleet_table is None:
+            self.fleet_table = FleetTable(self.main_container, self.model, self._on_bulk_action, corner_radius=10)
+        for view in (self.panels_scroll, self.fleet_table):
+            if view is not None and view is not self.view:
+                view.pack_forget()
+        self.view.pack(fill="both", expand=True, padx=15, pady=15)
+
+    def _view_button_text(self) -> str:
+        return "Cards" if self.app_settings.view_mode == "table" else "Table"
+
+    def _toggle_view(self):
+        """Switches between the card grid and the compact table."""
+        self.app_settings.view_mode = "cards" if self.app_settings.view_mode == "table" else "table"
+        self._save_app_settings()
+        self._show_view()
+        self._apply_foreground_opacity()
+        self.view_btn.configure(text=self._view_button_text())
+        self.view.refresh()
+
+    def _on_bulk_action(self, action: str, instances: List[WranglerInstance]):
+        """Runs a bulk action from the table on the selected instances."""
+        if action == "run":
+            self._start_all(instances)
+        elif action == "resume":
+            self._resume_all(instances)
+        elif action == "stop":
+            self._stop_all(instances)
+
+    def _make_panel(self, instance: WranglerInstance) -> InstancePanel:
+        """Creates a pooled panel; VirtualPanelGrid rebinds it to whichever row it shows."""
+        return InstancePanel(
+            self.panels_scroll.viewport,
+            instance,
+            on_run=self._on_panel_run,
+            on_stop=self._on_panel_stop,
+            on_resume=self._on_panel_resume,
+            on_advanced_run=self._on_panel_advanced_run,
+            on_remove=self._on_panel_remove,
+            on_settings_changed=self._save_config,
+            on_queue=self._show_queue
+        )
 
     def _create_status_bar(self):
         """Creates the status bar at the bottom."""
@@ -1656,6 +2569,24 @@ class WranglerMasterApp(ctk.CTk):
         )
         self.json_label.pack(side="right", padx=15, pady=8)
 
+        # Fleet graph: instances executing over the last few hours
+        self.fleet_canvas = ctk.CTkCanvas(
+            self.status_frame,
+            width=FLEET_GRAPH_SIZE[0],
+            height=FLEET_GRAPH_SIZE[1],
+            highlightthickness=0,
+            borderwidth=0
+        )
+        self.fleet_canvas.pack(side="right", pady=7)
+        self.fleet_label = ctk.CTkLabel(
+            self.status_frame,
+            text="",
+            font=self.get_font(size=11),
+            text_color="gray"
+        )
+        self.fleet_label.pack(side="right", padx=8, pady=8)
+        self._fleet_bars: List[int] = []
+
     def _apply_foreground_opacity(self):
         """Applies the foreground opacity setting to UI elements."""
         fg_color = self.get_fg_color()
@@ -1676,79 +2607,110 @@ class WranglerMasterApp(ctk.CTk):
             self.toolbar.configure(fg_color=toolbar_color)
         if hasattr(self, 'panels_scroll'):
             self.panels_scroll.configure(fg_color=scroll_color)
+        if getattr(self, 'fleet_table', None):
+            self.fleet_table.configure(fg_color=scroll_color)
         if hasattr(self, 'status_frame'):
             self.status_frame.configure(fg_color=status_color)
+            self._draw_fleet_graph()
 
     def _refresh_panels(self):
-        """Recreates all instance panels."""
-        # Clear existing panels
-        for widget in self.panels_scroll.winfo_children():
-            widget.destroy()
-        self.panels.clear()
-
-        if not self.instances:
-            placeholder = ctk.CTkLabel(
-                self.panels_scroll,
-                text="No instances configured.\nClick '+ Add' to add a Wrangler instance.",
-                font=ctk.CTkFont(size=14),
-                text_color="gray"
-            )
-            placeholder.pack(pady=50)
-            return
-
-        # Create panels in a grid layout
-        cols = 3
-        row_frame = None
-
-        for i, instance in enumerate(self.instances):
-            if not instance.enabled:
-                continue
-
-            if i % cols == 0:
-                row_frame = ctk.CTkFrame(self.panels_scroll, fg_color="transparent")
-                row_frame.pack(fill="x", pady=5)
-
-            panel = InstancePanel(
-                row_frame,
-                instance,
-                on_run=self._on_panel_run,
-                on_stop=self._on_panel_stop,
-                on_resume=self._on_panel_resume,
-                on_advanced_run=self._on_panel_advanced_run,
-                on_remove=self._on_panel_remove,
-                on_settings_changed=self._save_config
-            )
-            panel.pack(side="left", padx=5, pady=5, fill="both", expand=True)
+        """Updates the instance list rows from self.instances, keyed by host:port.
 
-            key = f"{instance.host}:{instance.port}"
-            self.panels[key] = panel
+        Status and queue readouts live in self.model, so instances that stay
+        keep what they show; the view only rebinds the panels on screen.
+        """
+        self.streams.sync(self.instances)
+        if self.model.set_instances(self.instances):
+            # New rows start blank, so the next poll must not come back as 304
+            self.client.invalidate()
+        self.history.retain(instance.key for instance in self.instances if instance.enabled)
+        for instance in self.instances:
+            if instance.enabled:
+                self.model.set_queue_text(instance.key, self.queue.summary(instance))
+        self.view.refresh()
 
-    def _update_panel(self, instance: WranglerInstance, status: InstanceStatus):
-        """Updates a single panel with new status."""
+    def _update_panel(self, instance: WranglerInstance, status: InstanceStatus,
+                      pushed: bool = False):
+        """Updates a single panel with new status (polled or pushed via /events)."""
         key = f"{instance.host}:{instance.port}"
-        if key in self.panels:
-            self.panels[key].update_status(status)
+        self.poll_scheduler.record(key, status, pushed)
+        if not (self.shard_run and self.shard_run.on_status(instance, status)):
+            self.queue.on_status(instance, status)
+        if not pushed:
+            self.model.set_latency(key, status.latency)
+        if not status.not_modified:  # 304 - only the latency can have changed
+            self.model.set_status(key, status)
+        self.history.record(key, status, pushed)
+        self.view.refresh_key(key)
+
+    def _draw_fleet_graph(self):
+        """Redraws the executing-count graph in the status bar from the fleet history."""
+        series = self.history.fleet_series()
+        canvas = self.fleet_canvas
+        width, height = FLEET_GRAPH_SIZE
+        canvas.configure(bg=canvas_background(self.status_frame))
+        if len(self._fleet_bars) != len(series):
+            canvas.delete("all")
+            self._fleet_bars = [
+                canvas.create_rectangle(0, 0, 0, 0, width=0, fill=InstancePanel.COLORS["executing"])
+                for _ in series
+            ]
+        step = width / len(series)
+        peak = max(max(series), 1)
+        for n, (bar, count) in enumerate(zip(self._fleet_bars, series)):
+            canvas.coords(bar, n * step, height - (height - 1) * count / peak, (n + 1) * step - 1, height)
+        self.fleet_label.configure(text=f"{series[-1]} executing (peak {max(series)})")
 
     def _start_polling(self):
-        """Starts the background polling loop."""
+        """Starts the background polling loop.
+
+        Each instance is polled on its own interval picked by PollScheduler.
+        Due polls go to the pool without waiting for the batch, so a slow
+        instance never delays the others. Timers and schedules fire from
+        AdvancedRunManager's deadline thread.
+        """
         def poll():
             while self.polling_active:
-                self._refresh_all_async()
-                self._check_timers()
-                self._check_schedules()
-                time.sleep(POLL_INTERVAL_MS / 1000)
+                instances = list(self.instances)
+                due = self.poll_scheduler.due(instances)
+                if due:
+                    self.poller.submit(due, self._post_status)
+                if self.history.sample_fleet(self.model.statuses().values()):
+                    self.after(0, self._draw_fleet_graph)
+
+                wait = self.poll_scheduler.seconds_until_next(instances)
+                # Wake at least once a second so newly added instances are picked up
+                time.sleep(min(max(wait, 0.1), 1.0))
 
         thread = threading.Thread(target=poll, daemon=True)
         thread.start()
 
-    def _refresh_all_async(self):
-        """Fetches status from all instances."""
-        for instance in self.instances:
-            if not instance.enabled:
-                continue
-
-            status = WranglerClient.get_status(instance)
-            self.after(0, lambda i=instance, s=status: self._update_panel(i, s))
+    def _refresh_all_async(self, instances: Optional[List[WranglerInstance]] = None):
+        """Fetches status from the given instances (default: all) concurrently."""
+        instances = list(self.instances) if instances is None else instances
+        snapshot = self.poller.poll(instances)
+        self.telemetry.record_statuses(snapshot)
+        if self.updates.put_many(instances, snapshot):
+            self.after(0, self._flush_updates)
+
+    def _post_status(self, instance: WranglerInstance, status: InstanceStatus, pushed: bool = False):
+        """Queues a status from any thread for the next UI flush."""
+        self.telemetry.record_status(instance.key, status, pushed)
+        if self.updates.put(instance, status, pushed):
+            self.after(0, self._flush_updates)
+
+    def _post_message(self, message: str):
+        """Queues a status bar message from any thread (only the newest per flush is shown)."""
+        if self.updates.put_message(message):
+            self.after(0, self._flush_updates)
+
+    def _flush_updates(self):
+        """Applies everything queued since the last flush, within one frame's budget."""
+        message, more = self.updates.drain(self._update_panel)
+        if message is not None:
+            self._set_status(message)
+        if more:
+            self.after(int(FRAME_INTERVAL * 1000), self._flush_updates)
 
     def _refresh_all(self):
         """Manual refresh triggered by button."""
@@ -1770,12 +2732,12 @@ class WranglerMasterApp(ctk.CTk):
         """Handles settings apply."""
         self.app_settings = settings
         self._save_app_settings()
+        self.throttle.configure(settings.rollout_max_per_host, settings.rollout_spacing, settings.rollout_ramp)
 
         # Apply appearance mode immediately
         ctk.set_appearance_mode(settings.appearance_mode)
 
         # Clear cached background and update
-        self._cached_bg_pil = None
         self._bg_photo = None
         if self.bg_label:
             self.bg_label.destroy()
@@ -1804,6 +2766,17 @@ class WranglerMasterApp(ctk.CTk):
             self._save_config()
             self._set_status(f"Added instance: {name}")
 
+    def _discover_dialog(self):
+        """Shows the LAN discovery dialog and adds the selected instances."""
+        dialog = DiscoverDialog(self, list(self.instances))
+        self.wait_window(dialog)
+
+        if dialog.result:
+            self.instances.extend(dialog.result)
+            self._refresh_panels()
+            self._save_config()
+            self._set_status(f"Added {len(dialog.result)} discovered instance(s)")
+
     def _set_json_path(self):
         """Sets the default JSON path for run commands."""
         path = filedialog.askopenfilename(
@@ -1834,13 +2807,13 @@ class WranglerMasterApp(ctk.CTk):
         self._set_status(f"Starting {instance.name}...")
 
         def do_run():
-            success, message = WranglerClient.run_order(instance, json_path=path)
+            success, message = self.client.run_order(instance, json_path=path)
             self.after(0, lambda: self._set_status(
                 f"{instance.name}: {message}" if success else f"{instance.name} failed: {message}"
             ))
             time.sleep(1)
-            status = WranglerClient.get_status(instance)
-            self.after(0, lambda: self._update_panel(instance, status))
+            status = self.client.get_status(instance)
+            self._post_status(instance, status)
 
         thread = threading.Thread(target=do_run, daemon=True)
         thread.start()
@@ -1850,13 +2823,13 @@ class WranglerMasterApp(ctk.CTk):
         self._set_status(f"Stopping {instance.name}...")
 
         def do_stop():
-            success, message = WranglerClient.stop_gently(instance)
+            success, message = self.client.stop_gently(instance)
             self.after(0, lambda: self._set_status(
                 f"{instance.name}: {message}" if success else f"{instance.name} failed: {message}"
             ))
             time.sleep(2)
-            status = WranglerClient.get_status(instance)
-            self.after(0, lambda: self._update_panel(instance, status))
+            status = self.client.get_status(instance)
+            self._post_status(instance, status)
 
         thread = threading.Thread(target=do_stop, daemon=True)
         thread.start()
@@ -1866,13 +2839,13 @@ class WranglerMasterApp(ctk.CTk):
         self._set_status(f"Resuming {instance.name}...")
 
         def do_resume():
-            success, message = WranglerClient.resume_orders(instance)
+            success, message = self.client.resume_orders(instance)
             self.after(0, lambda: self._set_status(
                 f"{instance.name}: {message}" if success else f"{instance.name} failed: {message}"
             ))
             time.sleep(1)
-            status = WranglerClient.get_status(instance)
-            self.after(0, lambda: self._update_panel(instance, status))
+            status = self.client.get_status(instance)
+            self._post_status(instance, status)
 
         thread = threading.Thread(target=do_resume, daemon=True)
         thread.start()
@@ -1880,8 +2853,7 @@ class WranglerMasterApp(ctk.CTk):
     def _on_panel_advanced_run(self, instance: WranglerInstance):
         """Handles advanced run button click from a panel."""
         key = f"{instance.host}:{instance.port}"
-        panel = self.panels.get(key)
-        has_incomplete = panel.status.has_incomplete_orders if panel else False
+        has_incomplete = self.model.status(key).has_incomplete_orders
 
         existing_config = instance.get_advanced_config()
 
@@ -1910,202 +2882,27 @@ class WranglerMasterApp(ctk.CTk):
             self.default_json_path = path
             self._save_config()
 
-        if config.mode == "none":
-            self._start_none_mode(instance, config)
-        elif config.mode == "timer":
-            self._start_timer_mode(instance, config)
-        else:
-            self._start_schedule_mode(instance, config)
-
-    def _start_none_mode(self, instance: WranglerInstance, config: AdvancedRunConfig):
-        """Starts none mode - runs or resumes immediately."""
-        action = "Resuming" if config.use_resume else "Starting"
-        self._set_status(f"{instance.name}: {action}...")
-
-        def do_run():
-            if config.use_resume:
-                success, message = WranglerClient.resume_orders(instance)
-                action_past = "Resumed"
-            else:
-                success, message = WranglerClient.run_order(instance, json_path=self.default_json_path)
-                action_past = "Started"
-
-            self.after(0, lambda: self._set_status(
-                f"{instance.name}: {action_past}" if success else f"{instance.name} failed: {message}"
-            ))
-            time.sleep(1)
-            status = WranglerClient.get_status(instance)
-            self.after(0, lambda: self._update_panel(instance, status))
-
-        thread = threading.Thread(target=do_run, daemon=True)
-        thread.start()
-
-    def _start_timer_mode(self, instance: WranglerInstance, config: AdvancedRunConfig):
-        """Starts timer mode for an instance."""
-        key = f"{instance.host}:{instance.port}"
-        duration_seconds = config.timer_hours * 3600 + config.timer_minutes * 60
-        end_time = datetime.now() + timedelta(seconds=duration_seconds)
-
-        self.active_timers[key] = {
-            "end_time": end_time,
-            "stopped": False,
-            "instance": instance
-        }
-
-        action = "Resuming" if config.use_resume else "Starting"
-        self._set_status(f"{instance.name}: Timer started ({config.timer_hours}h {config.timer_minutes}m)")
-
-        def do_run():
-            if config.use_resume:
-                success, message = WranglerClient.resume_orders(instance)
-            else:
-                success, message = WranglerClient.run_order(instance, json_path=self.default_json_path)
-
-            self.after(0, lambda: self._set_status(
-                f"{instance.name}: {action} (timer mode)" if success else f"{instance.name} failed: {message}"
-            ))
-            time.sleep(1)
-            status = WranglerClient.get_status(instance)
-            self.after(0, lambda: self._update_panel(instance, status))
-
-        thread = threading.Thread(target=do_run, daemon=True)
-        thread.start()
-
-    def _start_schedule_mode(self, instance: WranglerInstance, config: AdvancedRunConfig):
-        """Starts schedule mode for an instance."""
-        key = f"{instance.host}:{instance.port}"
-
-        self.active_schedules[key] = {
-            "config": config,
-            "instance": instance,
-            "last_action": None
-        }
-
-        mode_desc = "resume" if config.use_resume else "run"
-        self._set_status(
-            f"{instance.name}: Schedule activated ({mode_desc}) "
-            f"({config.schedule_start_hour:02d}:{config.schedule_start_minute:02d} - "
-            f"{config.schedule_end_hour:02d}:{config.schedule_end_minute:02d})"
-        )
-
-        self._check_schedule_for_instance(key)
-
-    def _check_timers(self):
-        """Checks all active timers and stops instances that have expired."""
-        now = datetime.now()
-        keys_to_remove = []
-
-        for key, timer_data in self.active_timers.items():
-            if timer_data["stopped"]:
-                continue
-
-            if now >= timer_data["end_time"]:
-                instance = timer_data["instance"]
-                timer_data["stopped"] = True
-                keys_to_remove.append(key)
-
-                def do_stop(inst=instance):
-                    WranglerClient.stop_gently(inst)
-                    self.after(0, lambda: self._set_status(f"{inst.name}: Timer expired, stopping..."))
-                    time.sleep(2)
-                    status = WranglerClient.get_status(inst)
-                    self.after(0, lambda: self._update_panel(inst, status))
-
-                    if inst.go_home_after_session:
-                        time.sleep(3)
-                        success, msg = WranglerClient.go_home(inst)
-                        self.after(0, lambda: self._set_status(
-                            f"{inst.name}: Going home..." if success else f"{inst.name}: Go home failed"
-                        ))
-
-                threading.Thread(target=do_stop, daemon=True).start()
-
-        for key in keys_to_remove:
-            del self.active_timers[key]
-
-    def _check_schedules(self):
-        """Checks all active schedules."""
-        for key in self.active_schedules:
-            self._check_schedule_for_instance(key)
-
-    def _check_schedule_for_instance(self, key: str):
-        """Checks and manages schedule for a single instance."""
-        if key not in self.active_schedules:
-            return
-
-        schedule_data = self.active_schedules[key]
-        config = schedule_data["config"]
-        instance = schedule_data["instance"]
-        last_action = schedule_data["last_action"]
-
-        now = datetime.now()
-        current_minutes = now.hour * 60 + now.minute
-        start_minutes = config.schedule_start_hour * 60 + config.schedule_start_minute
-        end_minutes = config.schedule_end_hour * 60 + config.schedule_end_minute
-
-        if start_minutes <= end_minutes:
-            in_window = start_minutes <= current_minutes < end_minutes
-        else:
-            in_window = current_minutes >= start_minutes or current_minutes < end_minutes
-
-        status = WranglerClient.get_status(instance)
-
-        if in_window:
-            if last_action != "started" and not status.is_executing:
-                schedule_data["last_action"] = "started"
-
-                def do_start(inst=instance, use_resume=config.use_resume):
-                    if use_resume:
-                        success, message = WranglerClient.resume_orders(inst)
-                        action = "Resumed"
-                    else:
-                        success, message = WranglerClient.run_order(inst, json_path=self.default_json_path)
-                        action = "Started"
-
-                    self.after(0, lambda: self._set_status(
-                        f"{inst.name}: {action} (schedule)" if success else f"{inst.name} failed: {message}"
-                    ))
-                    time.sleep(1)
-                    st = WranglerClient.get_status(inst)
-                    self.after(0, lambda: self._update_panel(inst, st))
-
-                threading.Thread(target=do_start, daemon=True).start()
-        else:
-            if last_action != "stopped" and status.is_executing:
-                schedule_data["last_action"] = "stopped"
-
-                def do_stop(inst=instance):
-                    WranglerClient.stop_gently(inst)
-                    self.after(0, lambda: self._set_status(f"{inst.name}: Stopped (schedule)"))
-                    time.sleep(2)
-                    st = WranglerClient.get_status(inst)
-                    self.after(0, lambda: self._update_panel(inst, st))
-
-                    if inst.go_home_after_session:
-                        time.sleep(3)
-                        success, msg = WranglerClient.go_home(inst)
-                        self.after(0, lambda: self._set_status(
-                            f"{inst.name}: Going home..." if success else f"{inst.name}: Go home failed"
-                        ))
-
-                threading.Thread(target=do_stop, daemon=True).start()
+        self.runs.start(instance, config)
 
     def _on_panel_remove(self, instance: WranglerInstance):
         """Handles remove button click from a panel."""
         if messagebox.askyesno("Remove Instance", f"Remove '{instance.name}' from the list?"):
             key = f"{instance.host}:{instance.port}"
-            if key in self.active_timers:
-                del self.active_timers[key]
-            if key in self.active_schedules:
-                del self.active_schedules[key]
+            self.runs.cancel(key)
+            self.queue.forget(key)
 
             self.instances.remove(instance)
+            self.client.forget(instance)
+            self.poll_scheduler.forget(key)
+            self.streams.forget(key)
             self._refresh_panels()
             self._save_config()
             self._set_status(f"Removed: {instance.name}")
 
-    def _start_all(self):
-        """Starts all instances."""
+    def _start_all(self, instances: Optional[List[WranglerInstance]] = None):
+        """Starts all instances (or the given ones)."""
+        action = "Start All" if instances is None else f"Start {len(instances)} Selected"
+        instances = list(self.instances) if instances is None else instances
         if not self.default_json_path:
             path = filedialog.askopenfilename(
                 title="Select JSON File to Run on All",
@@ -2118,23 +2915,23 @@ class WranglerMasterApp(ctk.CTk):
         else:
             path = self.default_json_path
 
-        self._set_status("Starting all instances...")
+        self._set_status(f"Starting {len(instances)} instance(s)...")
+        statuses = self._statuses()
 
         def do_start_all():
-            successes = 0
-            failures = 0
+            blocked = self._blocked_instances(path, statuses)
 
-            for instance in self.instances:
-                if not instance.enabled:
-                    continue
+            def start_one(instance: WranglerInstance):
+                if instance.key in blocked:
+                    return None, blocked[instance.key]
+                return self.throttle.start(instance, lambda i: self.client.run_order(i, json_path=path))
 
-                success, _ = WranglerClient.run_order(instance, json_path=path)
-                if success:
-                    successes += 1
-                else:
-                    failures += 1
-
-            self.after(0, lambda: self._set_status(f"Started {successes} instances, {failures} failed"))
+            results = self.dispatcher.dispatch(
+                self.throttle.order(instances),
+                start_one,
+                on_result=self._bulk_progress("Starting")
+            )
+            self.after(0, lambda: self._finish_bulk(action, results))
 
             time.sleep(2)
             self._refresh_all_async()
@@ -2142,25 +2939,19 @@ class WranglerMasterApp(ctk.CTk):
         thread = threading.Thread(target=do_start_all, daemon=True)
         thread.start()
 
-    def _stop_all(self):
-        """Stops all instances gently."""
-        self._set_status("Stopping all instances...")
+    def _stop_all(self, instances: Optional[List[WranglerInstance]] = None):
+        """Stops all instances (or the given ones) gently."""
+        action = "Stop All" if instances is None else f"Stop {len(instances)} Selected"
+        instances = list(self.instances) if instances is None else instances
+        self._set_status(f"Stopping {len(instances)} instance(s)...")
 
         def do_stop_all():
-            successes = 0
-            failures = 0
-
-            for instance in self.instances:
-                if not instance.enabled:
-                    continue
-
-                success, _ = WranglerClient.stop_gently(instance)
-                if success:
-                    successes += 1
-                else:
-                    failures += 1
-
-            self.after(0, lambda: self._set_status(f"Stopped {successes} instances, {failures} failed"))
+            results = self.dispatcher.dispatch(
+                instances,
+                self.client.stop_gently,
+                on_result=self._bulk_progress("Stopping")
+            )
+            self.after(0, lambda: self._finish_bulk(action, results))
 
             time.sleep(2)
             self._refresh_all_async()
@@ -2168,41 +2959,29 @@ class WranglerMasterApp(ctk.CTk):
         thread = threading.Thread(target=do_stop_all, daemon=True)
         thread.start()
 
-    def _resume_all(self):
-        """Resumes all instances with incomplete orders."""
-        self._set_status("Resuming all instances...")
+    def _resume_all(self, instances: Optional[List[WranglerInstance]] = None):
+        """Resumes all instances (or the given ones) with incomplete orders."""
+        action = "Resume All" if instances is None else f"Resume {len(instances)} Selected"
+        instances = list(self.instances) if instances is None else instances
+        self._set_status(f"Resuming {len(instances)} instance(s)...")
+
+        def resume_one(instance: WranglerInstance):
+            status = self.client.get_status(instance)
+            if not status.reachable:
+                return False, status.error or "Unreachable"
+            if not status.has_incomplete_orders:
+                return None, "No incomplete orders"
+            if status.is_executing:
+                return None, "Already executing"
+            return self.throttle.start(instance, self.client.resume_orders)
 
         def do_resume_all():
-            successes = 0
-            failures = 0
-            skipped = 0
-
-            for instance in self.instances:
-                if not instance.enabled:
-                    continue
-
-                status = WranglerClient.get_status(instance)
-                if not status.reachable:
-                    failures += 1
-                    continue
-
-                if not status.has_incomplete_orders:
-                    skipped += 1
-                    continue
-
-                if status.is_executing:
-                    skipped += 1
-                    continue
-
-                success, _ = WranglerClient.resume_orders(instance)
-                if success:
-                    successes += 1
-                else:
-                    failures += 1
-
-            self.after(0, lambda: self._set_status(
-                f"Resumed {successes} instances, {failures} failed, {skipped} skipped"
-            ))
+            results = self.dispatcher.dispatch(
+                self.throttle.order(instances),
+                resume_one,
+                on_result=self._bulk_progress("Resuming")
+            )
+            self.after(0, lambda: self._finish_bulk(action, results))
 
             time.sleep(2)
             self._refresh_all_async()
@@ -2210,19 +2989,119 @@ class WranglerMasterApp(ctk.CTk):
         thread = threading.Thread(target=do_resume_all, daemon=True)
         thread.start()
 
+    def _bulk_progress(self, verb: str) -> Callable:
+        """Returns a dispatcher callback that streams progress into the status bar."""
+        def on_result(result: DispatchResult, done: List[DispatchResult], total: int):
+            successes, failures, skipped = summarize_results(done)
+            text = f"{verb} {len(done)}/{total}: {successes} ok, {failures} failed"
+            if skipped:
+                text += f", {skipped} skipped"
+            self._post_message(text)
+        return on_result
+
+    def _finish_bulk(self, action: str, results: List[DispatchResult]):
+        """Shows the final summary of a bulk action; lists details if anything failed."""
+        successes, failures, skipped = summarize_results(results)
+        self._set_status(f"{action}: {successes} succeeded, {failures} failed, {skipped} skipped")
+        if failures:
+            BulkResultsDialog(self, f"{action} Results", results)
+
+    def _show_queue(self, instance: WranglerInstance):
+        """Opens the order queue dialog for an instance."""
+        if self._queue_dialog and self._queue_dialog.winfo_exists():
+            self._queue_dialog.destroy()
+        self._queue_dialog = OrderQueueDialog(self, instance, self.queue)
+
+    def _on_queue_changed(self, instance: WranglerInstance):
+        """Saves an edited queue and refreshes its readouts."""
+        self._save_config()
+        self.model.set_queue_text(instance.key, self.queue.summary(instance))
+        self.view.refresh_key(instance.key)
+        dialog = self._queue_dialog
+        if dialog and dialog.winfo_exists() and dialog.instance is instance:
+            dialog.refresh()
+
+    def _load_recipes(self) -> dict:
+        """Returns Data/recipes.csv by item id, read on first use ({} if missing)."""
+        if self._recipes is None:
+            recipes = {}
+            path = find_data_file(RECIPES_FILENAME, CONFIG_DIR)
+            if path:
+                try:
+                    recipes = load_recipes(path)
+                except (OSError, ValueError) as e:
+                    print(f"Error loading recipes: {e}")
+            self._recipes = recipes
+        return self._recipes
+
+    def _planner(self) -> tuple:
+        """Returns (WorkEstimator, PlacementEngine or None); gearsets are re-read every call.
+
+        Blocks while recipes.csv is read the first time - call it off the UI thread.
+        """
+        recipes = self._load_recipes()
+        debug_dir = self.app_settings.lisbeth_debug_dir or find_lisbeth_debug_dir(CONFIG_DIR)
+        gear = GearsetIndex.load(debug_dir) if debug_dir else GearsetIndex()
+        placement = PlacementEngine(gear, recipes) if len(gear) and recipes else None
+        return WorkEstimator(recipes), placement
+
+    def _blocked_instances(self, json_path: str, statuses: Dict[str, InstanceStatus]) -> Dict[str, str]:
+        """Instances whose character's gear cannot craft the order file (see wrangler_gearsets)."""
+        try:
+            orders = load_order(json_path)
+        except (OSError, ValueError):
+            return {}  # Not a plain order list - let the instance decide
+        _, placement = self._planner()
+        if placement is None:
+            return {}
+        return placement.blocked(orders, placement.characters_for(statuses))
+
+    def _statuses(self) -> Dict[str, InstanceStatus]:
+        """Last status of every instance, by key."""
+        return self.model.statuses()
+
+    def _shard_dialog(self):
+        """Plans and starts a shard run, or offers to cancel the one in progress."""
+        run = self.shard_run
+        if run and not run.finished:
+            if messagebox.askyesno(
+                    "Shard Run", f"{run.progress()}\n\nStop handing out the remaining shards?"):
+                run.cancel()
+            return
+
+        dialog = ShardDialog(self, list(self.instances), self._planner, self._statuses(), self.default_json_path)
+        self.wait_window(dialog)
+        if not dialog.result:
+            return
+
+        shards, instances = dialog.result
+        self.shard_run = ShardRun(
+            self.client, shards, instances,
+            on_message=self._post_message,
+            on_change=lambda: self.after(0, self._on_shard_changed),
+            throttle=self.throttle,
+            poll_soon=self.poll_scheduler.poll_soon
+        )
+        self._set_status(f"Sharding across {len(instances)} instance(s): {describe_plan(shards, len(instances))}")
+        self._on_shard_changed()
+        self.shard_run.start()
+
+    def _on_shard_changed(self):
+        """Shows shard progress on the toolbar button."""
+        run = self.shard_run
+        if run and not run.finished:
+            self.shard_btn.configure(text=f"Shard {len(run.done)}/{run.total}")
+        else:
+            self.shard_btn.configure(text="Shard")
+
     def _save_config(self):
-        """Saves current configuration to file."""
-        config = {
-            "instances": [asdict(i) for i in self.instances],
-            "default_json_path": self.default_json_path
-        }
+        """Saves current configuration to file (in the background, coalescing rapid changes)."""
+        self.config_writer.save(self.instances, self.default_json_path)
 
-        config_path = CONFIG_DIR / CONFIG_FILENAME
-        try:
-            with open(config_path, "w") as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save config: {e}")
+    def _on_config_error(self, error: Exception):
+        """Reports a failed config write (called from the writer thread)."""
+        message = str(error)
+        self.after(0, lambda: messagebox.showerror("Error", f"Failed to save config: {message}"))
 
     def _load_config(self):
         """Loads configuration from file."""
@@ -2232,14 +3111,7 @@ class WranglerMasterApp(ctk.CTk):
             return
 
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-
-            self.instances = [
-                WranglerInstance(**data)
-                for data in config.get("instances", [])
-            ]
-            self.default_json_path = config.get("default_json_path", "")
+            self.instances, self.default_json_path = load_config(config_path)
 
             if self.default_json_path:
                 self.json_label.configure(text=f"JSON: {os.path.basename(self.default_json_path)}")
@@ -2259,12 +3131,16 @@ class WranglerMasterApp(ctk.CTk):
             "background_image": self.app_settings.background_image,
             "background_opacity": self.app_settings.background_opacity,
             "font_family": self.app_settings.font_family,
-            "font_size": self.app_settings.font_size
+            "font_size": self.app_settings.font_size,
+            "rollout_max_per_host": self.app_settings.rollout_max_per_host,
+            "rollout_spacing": self.app_settings.rollout_spacing,
+            "rollout_ramp": self.app_settings.rollout_ramp,
+            "lisbeth_debug_dir": self.app_settings.lisbeth_debug_dir,
+            "view_mode": self.app_settings.view_mode
         }
 
         try:
-            with open(settings_file, "w") as f:
-                json.dump(settings, f, indent=2)
+            write_json_atomic(settings_file, settings)
         except Exception as e:
             print(f"Failed to save app settings: {e}")
 
@@ -2285,6 +3161,11 @@ class WranglerMasterApp(ctk.CTk):
             self.app_settings.background_opacity = settings.get("background_opacity", 0.3)
             self.app_settings.font_family = settings.get("font_family", "Segoe UI")
             self.app_settings.font_size = settings.get("font_size", 13)
+            self.app_settings.rollout_max_per_host = settings.get("rollout_max_per_host", ROLLOUT_MAX_PER_HOST)
+            self.app_settings.rollout_spacing = settings.get("rollout_spacing", ROLLOUT_MIN_SPACING)
+            self.app_settings.rollout_ramp = settings.get("rollout_ramp", True)
+            self.app_settings.lisbeth_debug_dir = settings.get("lisbeth_debug_dir", "")
+            self.app_settings.view_mode = settings.get("view_mode", "cards")
 
         except Exception as e:
             print(f"Failed to load app settings: {e}")
@@ -2296,7 +3177,13 @@ class WranglerMasterApp(ctk.CTk):
     def _on_close(self):
         """Handles window close."""
         self.polling_active = False
+        self.runs.shutdown()
+        self.streams.stop_all()
+        self.poller.shutdown()
+        self.client.close()
         self._save_config()
+        self.config_writer.flush()
+        self.telemetry.close()
         self._save_app_settings()
         self.destroy()
 
@@ -13,7 +13,11 @@ Features:
 - Display Wrangler instances as status panels
 - Start/Stop individual instances
 - Master Start All / Stop All controls
-- Auto-refresh status every 10 seconds
+- Adaptive status polling (fast while executing, slow when idle, backoff when unreachable)
+- Live status push over /events, falling back to polling for older instances
+- LAN discovery of instances across a network and port range
+- Shard one large order across instances, balanced by estimated work
+- Gearset-aware placement: orders only go to characters that meet the recipe stats
 - Save/Load instance configuration
 """
 
@@ -23,8 +27,7 @@ import os
 import sys
 import threading
 import time
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, List, Dict
 
@@ -53,12 +56,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-try:
-    import requests
-except ImportError:
-    print("ERROR: 'requests' library is required.")
-    print("Install it with: pip install requests")
-    sys.exit(1)
+from wrangler_core import (
+    AdvancedRunConfig, WranglerInstance, InstanceStatus,
+    WranglerClient, FleetPoller, PollScheduler, BulkDispatcher, DispatchResult,
+    StatusStreamManager, StartThrottle, ConfigWriter, load_config, write_json_atomic,
+    ROLLOUT_MAX_PER_HOST, ROLLOUT_MIN_SPACING,
+    summarize_results, format_results_table,
+)
+from wrangler_runs import AdvancedRunManager
+from wrangler_queue import OrderQueueManager
+from wrangler_model import (
+    FleetModel, UpdateBatch, FRAME_INTERVAL, TABLE_COLUMNS, describe_state, format_runtime,
+)
+from wrangler_history import StatusHistory, SPARKLINE_BUCKETS, FLEET_BUCKETS
+from wrangler_telemetry import TelemetryStore, TELEMETRY_FILENAME
+from wrangler_recipes import RECIPES_FILENAME, find_data_file, load_recipes
+from wrangler_shard import (
+    ShardRun, WorkEstimator, SHARDS_PER_INSTANCE,
+    load_order, plan_shards, plan_placed_shards, describe_plan,
+)
+from wrangler_gearsets import GearsetIndex, PlacementEngine, find_lisbeth_debug_dir
+from wrangler_journal import RunJournal, JOURNAL_FILENAME
+from wrangler_schedule import Schedule, parse_days, format_days
+from wrangler_discovery import discover_instances, local_network, DEFAULT_PORTS
 
 
 # =============================================================================
@@ -67,8 +87,10 @@ except ImportError:
 
 CONFIG_FILENAME = "wrangler_config.json"
 SETTINGS_FILENAME = "app_settings.json"
-POLL_INTERVAL_SECONDS = 10
-REQUEST_TIMEOUT = 5
+PANEL_WIDTH = 500  # Pixels per instance panel (wide enough to show all options)
+PANEL_ROW_HEIGHT = 324  # Pixels per panel row (panels are recycled, so rows are fixed-height)
+SPARKLINE_HEIGHT = 16  # Pixels of the status history strip on each panel
+FLEET_GRAPH_SIZE = (180, 20)  # Pixels of the executing-count graph in the status bar
 
 
 def get_base_path() -> Path:
@@ -130,141 +152,17 @@ class Colors:
 # Data Classes
 # =============================================================================
 
-@dataclass
-class AdvancedRunConfig:
-    """Configuration for advanced run modes."""
-    mode: str = "none"
-    timer_hours: int = 0
-    timer_minutes: int = 30
-    schedule_start_hour: int = 8
-    schedule_start_minute: int = 0
-    schedule_end_hour: int = 22
-    schedule_end_minute: int = 0
-    use_resume: bool = False
-
-
-@dataclass
-class WranglerInstance:
-    """Represents a Wrangler instance configuration."""
-    name: str
-    host: str
-    port: int
-    enabled: bool = True
-    go_home_after_session: bool = False
-    advanced_config: Optional[dict] = None
-
-    @property
-    def base_url(self) -> str:
-        return f"http://{self.host}:{self.port}"
-
-    def get_advanced_config(self) -> AdvancedRunConfig:
-        if self.advanced_config is None:
-            return AdvancedRunConfig()
-        return AdvancedRunConfig(**self.advanced_config)
-
-    def set_advanced_config(self, config: AdvancedRunConfig):
-        self.advanced_config = asdict(config)
-
-
-@dataclass
-class InstanceStatus:
-    """Current status of a Wrangler instance."""
-    state: str = "unknown"
-    is_executing: bool = False
-    has_pending_order: bool = False
-    has_incomplete_orders: bool = False
-    current_file: str = "None"
-    api_status: str = "Unknown"
-    bot_running: bool = False
-    reachable: bool = False
-    error: Optional[str] = None
-    character_name: str = "Unknown"
-    world_name: str = "Unknown"
-    runtime_seconds: int = 0
-
-
 @dataclass
 class AppSettings:
     """Application-wide settings."""
     background_image: str = ""
     background_opacity: float = 0.3
     font_size: int = 14
-
-
-# =============================================================================
-# API Client
-# =============================================================================
-
-class WranglerClient:
-    """HTTP client for communicating with Wrangler instances."""
-
-    @staticmethod
-    def get_status(instance: WranglerInstance) -> InstanceStatus:
-        status = InstanceStatus()
-        try:
-            response = requests.get(f"{instance.base_url}/status", timeout=REQUEST_TIMEOUT)
-            if response.status_code == 200:
-                data = response.json()
-                status.state = data.get("state", "unknown")
-                status.is_executing = data.get("isExecuting", False)
-                status.has_pending_order = data.get("hasPendingOrder", False)
-                status.has_incomplete_orders = data.get("hasIncompleteOrders", False)
-                status.current_file = data.get("currentFile", "None")
-                status.api_status = data.get("apiStatus", "Unknown")
-                status.bot_running = data.get("botRunning", False)
-                status.character_name = data.get("characterName", "Unknown")
-                status.world_name = data.get("worldName", "Unknown")
-                status.runtime_seconds = data.get("runtimeSeconds", 0)
-                status.reachable = True
-            else:
-                status.error = f"HTTP {response.status_code}"
-        except requests.exceptions.ConnectionError:
-            status.error = "Connection refused"
-        except requests.exceptions.Timeout:
-            status.error = "Timeout"
-        except Exception as e:
-            status.error = str(e)
-        return status
-
-    @staticmethod
-    def run_order(instance: WranglerInstance, json_path: str) -> tuple:
-        try:
-            response = requests.post(
-                f"{instance.base_url}/run",
-                json={"jsonPath": json_path},
-                timeout=REQUEST_TIMEOUT
-            )
-            data = response.json()
-            return data.get("success", False), data.get("message", data.get("error", "Unknown"))
-        except Exception as e:
-            return False, str(e)
-
-    @staticmethod
-    def stop_gently(instance: WranglerInstance) -> tuple:
-        try:
-            response = requests.post(f"{instance.base_url}/stop", timeout=REQUEST_TIMEOUT)
-            data = response.json()
-            return data.get("success", False), data.get("message", data.get("error", "Unknown"))
-        except Exception as e:
-            return False, str(e)
-
-    @staticmethod
-    def resume_orders(instance: WranglerInstance) -> tuple:
-        try:
-            response = requests.post(f"{instance.base_url}/resume", timeout=REQUEST_TIMEOUT)
-            data = response.json()
-            return data.get("success", False), data.get("message", data.get("error", "Unknown"))
-        except Exception as e:
-            return False, str(e)
-
-    @staticmethod
-    def go_home(instance: WranglerInstance) -> tuple:
-        try:
-            response = requests.post(f"{instance.base_url}/gohome", timeout=REQUEST_TIMEOUT)
-            data = response.json()
-            return data.get("success", False), data.get("message", data.get("error", "Unknown"))
-        except Exception as e:
-            return False, str(e)
+    rollout_max_per_host: int = ROLLOUT_MAX_PER_HOST
+    rollout_spacing: float = ROLLOUT_MIN_SPACING
+    rollout_ramp: bool = True
+    lisbeth_debug_dir: str = ""  # Lisbeth/Debug folder with gearset dumps; empty = look next to the master
+    view_mode: str = "cards"  # "cards" or "table"
 
 
 # =============================================================================
@@ -280,8 +178,23 @@ class InstancePanel(ft.UserControl):
         "idle": Colors.BLURPLE,
         "pending": Colors.YELLOW,
         "executing": Colors.GREEN,
+        "tripped": Colors.RED,
+    }
+
+    # Status history bar heights (fraction of the strip) per state
+    HISTORY_LEVELS = {
+        "unreachable": 0.25,
+        "stopped": 0.25,
+        "idle": 0.45,
+        "pending": 0.7,
+        "executing": 1.0,
+        "tripped": 1.0,
     }
 
+    # Controls changed by status updates, across all panels.
+    # A poll of an unchanged fleet must leave it where it was.
+    reconfigurations = 0
+
     def __init__(
         self,
         instance: WranglerInstance,
@@ -292,6 +205,7 @@ class InstancePanel(ft.UserControl):
         on_advanced,
         on_settings_changed,
         panel_opacity: float = 1.0,
+        on_queue=None,
     ):
         super().__init__()
         self.instance = instance
@@ -302,7 +216,10 @@ class InstancePanel(ft.UserControl):
         self._on_remove = on_remove
         self._on_advanced = on_advanced
         self._on_settings_changed = on_settings_changed
+        self._on_queue = on_queue
         self.panel_opacity = panel_opacity
+        self.queue_summary = ""
+        self.history_line = (None,) * SPARKLINE_BUCKETS  # StatusHistory.sparkline to show
 
     def build(self):
         # Status indicator
@@ -337,6 +254,23 @@ class InstancePanel(ft.UserControl):
             color=Colors.TEXT_MUTED,
         )
 
+        self.queue_text = ft.Text(
+            self.queue_summary,
+            size=11,
+            color=Colors.TEXT_MUTED,
+            visible=bool(self.queue_summary),
+        )
+
+        # Status history of the last few hours, one bar per time bucket
+        self.history_bars = [ft.Container(expand=1, height=0) for _ in self.history_line]
+        self.history_row = ft.Row(
+            spacing=1,
+            height=SPARKLINE_HEIGHT,
+            vertical_alignment=ft.CrossAxisAlignment.END,
+            controls=self.history_bars,
+        )
+        self._render_history()
+
         # Button style helper
         def btn_style(bg_color, text_color=Colors.TEXT_PRIMARY):
             return ft.ButtonStyle(
@@ -370,6 +304,15 @@ class InstancePanel(ft.UserControl):
             on_click=lambda _: self._on_advanced(self.instance),
         )
 
+        self.queue_btn = ft.IconButton(
+            icon=ft.icons.PLAYLIST_PLAY,
+            icon_color=Colors.TEXT_MUTED,
+            icon_size=18,
+            tooltip="Order queue",
+            on_click=lambda _: self._on_queue(self.instance),
+            visible=self._on_queue is not None,
+        )
+
         self.remove_btn = ft.IconButton(
             icon=ft.icons.CLOSE,
             icon_color=Colors.RED,
@@ -377,6 +320,19 @@ class InstancePanel(ft.UserControl):
             on_click=lambda _: self._on_remove(self.instance),
         )
 
+        self.name_text = ft.Text(
+            self.instance.name,
+            size=15,
+            weight=ft.FontWeight.BOLD,
+            color=Colors.TEXT_PRIMARY,
+        )
+
+        self.address_text = ft.Text(
+            f"{self.instance.host}:{self.instance.port}",
+            size=12,
+            color=Colors.TEXT_MUTED,
+        )
+
         # Go home checkbox
         self.go_home_cb = ft.Checkbox(
             label="Go Home after session",
@@ -384,6 +340,9 @@ class InstancePanel(ft.UserControl):
             on_change=self._on_go_home_change,
         )
 
+        if self.status.fetched_at:
+            self._render_status()  # Built for a recycled row that already has a status
+
         # Calculate panel background with opacity
         panel_bg = Colors.with_opacity(Colors.BG_DARK, self.panel_opacity) if self.panel_opacity < 1.0 else Colors.BG_DARK
 
@@ -398,19 +357,7 @@ class InstancePanel(ft.UserControl):
                     # Header
                     ft.Row(
                         alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                        controls=[
-                            ft.Text(
-                                self.instance.name,
-                                size=15,
-                                weight=ft.FontWeight.BOLD,
-                                color=Colors.TEXT_PRIMARY,
-                            ),
-                            ft.Text(
-                                f"{self.instance.host}:{self.instance.port}",
-                                size=12,
-                                color=Colors.TEXT_MUTED,
-                            ),
-                        ],
+                        controls=[self.name_text, self.address_text],
                     ),
                     # Status row
                     ft.Row(
@@ -420,6 +367,8 @@ class InstancePanel(ft.UserControl):
                     self.character_text,
                     self.runtime_text,
                     self.file_text,
+                    self.queue_text,
+                    self.history_row,
                     self.go_home_cb,
                     # Buttons
                     ft.Row(
@@ -430,6 +379,7 @@ class InstancePanel(ft.UserControl):
                             self.stop_btn,
                             self.advanced_btn,
                             ft.Container(expand=True),
+                            self.queue_btn,
                             self.remove_btn,
                         ],
                     ),
@@ -441,56 +391,100 @@ class InstancePanel(ft.UserControl):
         self.instance.go_home_after_session = e.control.value
         self._on_settings_changed()
 
-    def update_status(self, status: InstanceStatus):
+    def set_queue_summary(self, text: str):
+        """Shows the order queue readout (empty hides it)."""
+        self.queue_summary = text
+        if not hasattr(self, "queue_text"):
+            return  # Not built yet - build() picks up queue_summary
+        if self._set(self.queue_text, value=text, visible=bool(text)):
+            self._send()
+
+    def show_instance(self, instance: WranglerInstance, status: InstanceStatus, queue_summary: str):
+        """Rebinds a recycled panel to another instance."""
+        self.instance = instance
         self.status = status
+        self.queue_summary = queue_summary
+        if not hasattr(self, "status_text"):
+            return  # Not built yet - build() picks everything up
+        changed = self._set(self.name_text, value=instance.name)
+        changed |= self._set(self.address_text, value=f"{instance.host}:{instance.port}")
+        changed |= self._set(self.go_home_cb, value=instance.go_home_after_session)
+        changed |= self._set(self.queue_text, value=queue_summary, visible=bool(queue_summary))
+        changed |= self._render_status()
+        if changed:
+            self._send()
+
+    def show_history(self, line, send: bool = True) -> bool:
+        """Shows a status sparkline (see StatusHistory.sparkline); returns True if a bar changed."""
+        self.history_line = line
+        if not hasattr(self, "history_bars"):
+            return False  # Not built yet - build() picks it up
+        changed = self._render_history()
+        if changed and send:
+            self._send()
+        return changed
+
+    def _render_history(self) -> bool:
+        changed = False
+        for bar, category in zip(self.history_bars, self.history_line):
+            height = round(SPARKLINE_HEIGHT * self.HISTORY_LEVELS[category]) if category else 0
+            changed |= self._set(bar, height=height, bgcolor=self.STATUS_COLORS[category] if category else None)
+        return changed
+
+    def update_status(self, status: InstanceStatus, send: bool = True) -> bool:
+        """Shows a status; returns True if any control changed.
+
+        send=False leaves the changes for the caller's next page.update().
+        """
+        self.status = status
+        changed = self._render_status()
+        if changed and send:
+            self._send()
+        return changed
+
+    def _set(self, control: ft.Control, **values) -> bool:
+        """Sets control properties only if they differ from what it already shows."""
+        if all(getattr(control, name) == value for name, value in values.items()):
+            return False
+        for name, value in values.items():
+            setattr(control, name, value)
+        InstancePanel.reconfigurations += 1
+        return True
+
+    def _send(self):
+        try:
+            self.update()
+        except Exception:
+            pass
+
+    def _render_status(self) -> bool:
+        status = self.status
 
         # Determine color and text
-        if not status.reachable:
-            color = self.STATUS_COLORS["unreachable"]
-            state_text = "Unreachable"
-        elif status.state == "executing":
-            color = self.STATUS_COLORS["executing"]
-            state_text = "Executing"
-        elif status.state == "pending":
-            color = self.STATUS_COLORS["pending"]
-            state_text = "Pending"
-        elif status.state == "idle":
-            color = self.STATUS_COLORS["idle"]
-            state_text = "Idle"
-        elif status.state == "stopped":
-            color = self.STATUS_COLORS["stopped"]
-            state_text = "Bot Stopped"
-        else:
-            color = self.STATUS_COLORS["unreachable"]
-            state_text = status.state.capitalize() if status.state else "Unknown"
+        category, state_text = describe_state(status)
+        color = self.STATUS_COLORS[category]
 
-        self.status_dot.bgcolor = color
-        self.status_text.value = state_text
+        changed = self._set(self.status_dot, bgcolor=color)
+        changed |= self._set(self.status_text, value=state_text)
 
         # Character info
         if status.reachable and status.character_name != "Unknown":
-            self.character_text.value = f"{status.character_name} @ {status.world_name}"
+            changed |= self._set(self.character_text, value=f"{status.character_name} @ {status.world_name}")
         else:
-            self.character_text.value = "Character: Unknown"
+            changed |= self._set(self.character_text, value="Character: Unknown")
 
         # Runtime
         if status.is_executing and status.runtime_seconds > 0:
-            hours, remainder = divmod(status.runtime_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            if hours > 0:
-                self.runtime_text.value = f"Runtime: {hours}h {minutes}m {seconds}s"
-            elif minutes > 0:
-                self.runtime_text.value = f"Runtime: {minutes}m {seconds}s"
-            else:
-                self.runtime_text.value = f"Runtime: {seconds}s"
+            runtime_text = f"Runtime: {format_runtime(status.runtime_seconds)}"
         else:
-            self.runtime_text.value = ""
+            runtime_text = ""
+        changed |= self._set(self.runtime_text, value=runtime_text)
 
         # File
         file_text = status.current_file if status.current_file else "None"
         if len(file_text) > 35:
             file_text = "..." + file_text[-32:]
-        self.file_text.value = f"File: {file_text}"
+        changed |= self._set(self.file_text, value=f"File: {file_text}")
 
         # Button states
         can_run = status.reachable and status.state in ("idle", "stopped")
@@ -498,15 +492,305 @@ class InstancePanel(ft.UserControl):
         can_stop = status.reachable and status.is_executing
         can_advanced = status.reachable and status.state in ("idle", "stopped")
 
-        self.run_btn.disabled = not can_run
-        self.resume_btn.disabled = not can_resume
-        self.stop_btn.disabled = not can_stop
-        self.advanced_btn.disabled = not can_advanced
+        changed |= self._set(self.run_btn, disabled=not can_run)
+        changed |= self._set(self.resume_btn, disabled=not can_resume)
+        changed |= self._set(self.stop_btn, disabled=not can_stop)
+        changed |= self._set(self.advanced_btn, disabled=not can_advanced)
+        return changed
+
+
+# =============================================================================
+# Virtualized Panel Grid
+# =============================================================================
+
+class VirtualPanelGrid(ft.UserControl):
+    """Scrollable grid of InstancePanels that only has controls for the visible rows.
+
+    Rows come from a FleetModel. Panels sit in a fixed-height Stack at
+    their row's offset; a pool sized to the viewport is rebound to
+    whichever instances scroll into view, so the page only ever carries
+    the panels on screen.
+    """
+
+    def __init__(self, model: FleetModel, history: StatusHistory, make_panel, width: float, height: float):
+        super().__init__(expand=True)
+        self.model = model
+        self.history = history
+        self.make_panel = make_panel
+        self.viewport_width = width
+        self.viewport_height = height
+        self.offset = 0.0  # Pixels scrolled from the top
+
+        self._pool: List[ft.Container] = []  # Sizing cells, each holding one InstancePanel
+        self._bound: Dict[str, InstancePanel] = {}  # key -> visible panel showing it
+
+    def build(self):
+        self.canvas = ft.Stack(height=0)
+        self.placeholder = ft.Container(
+            padding=50,
+            visible=False,
+            content=ft.Text(
+                "No instances configured.\nClick '+ Add' to add a Wrangler instance.",
+                size=14,
+                color=Colors.TEXT_MUTED,
+                text_align=ft.TextAlign.CENTER,
+            ),
+        )
+        self._layout()
+        return ft.Column(
+            expand=True,
+            scroll=ft.ScrollMode.AUTO,
+            spacing=0,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+            controls=[self.placeholder, self.canvas],
+        )
 
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        self.offset = e.pixels
+        if e.viewport_dimension:
+            self.viewport_height = e.viewport_dimension
+        self.refresh()
+
+    def resize(self, width: float, height: float):
+        """Called when the window size changes (columns and visible rows follow it)."""
+        self.viewport_width = width
+        self.viewport_height = height
+        self.refresh()
+
+    def refresh(self):
+        """Rebinds the visible panels after scrolling or rows being added, removed or reordered."""
+        self._layout()
         try:
             self.update()
         except Exception:
-            pass
+            pass  # Not on the page yet
+
+    def refresh_key(self, key: str, send: bool = True) -> bool:
+        """Redraws one instance if it is on screen; off-screen rows cost nothing.
+
+        send=False only changes the controls, for a batch that ends in one
+        page.update(). Returns True if anything changed.
+        """
+        panel = self._bound.get(key)
+        if panel is None:
+            return False
+        if send:
+            panel.set_queue_summary(self.model.queue_text(key))
+        changed = panel.update_status(self.model.status(key), send=send)
+        return panel.show_history(self.history.sparkline(key), send=send) or changed
+
+    def visible_panels(self) -> List[InstancePanel]:
+        return list(self._bound.values())
+
+    def _layout(self):
+        """Positions pooled panels over the rows in view and binds them to their instances."""
+        count = len(self.model)
+        columns = max(1, int(self.viewport_width // PANEL_WIDTH))
+        self.canvas.height = -(-count // columns) * PANEL_ROW_HEIGHT
+        self.placeholder.visible = count == 0
+
+        first_row = int(self.offset // PANEL_ROW_HEIGHT)
+        last_row = int((self.offset + self.viewport_height) // PANEL_ROW_HEIGHT)
+        first = min(count, first_row * columns)
+        visible = min(count, (last_row + 1) * columns) - first
+
+        while len(self._pool) < visible:
+            cell = ft.Container(
+                width=PANEL_WIDTH,
+                height=PANEL_ROW_HEIGHT,
+                margin=0,
+                padding=1,
+                content=self.make_panel(self.model.row(first + len(self._pool))),
+            )
+            self._pool.append(cell)
+            self.canvas.controls.append(cell)
+
+        # Row i always uses pool slot i % pool size, so scrolling by one row
+        # only rebinds the panels of the row that came into view
+        previous, self._bound = self._bound, {}
+        slots = {index % len(self._pool): index for index in range(first, first + visible)} if self._pool else {}
+        for slot, cell in enumerate(self._pool):
+            index = slots.get(slot)
+            if index is None:
+                cell.visible = False
+                continue
+            panel = cell.content
+            instance = self.model.row(index)
+            if previous.get(instance.key) is not panel or panel.instance is not instance:
+                panel.show_instance(instance, self.model.status(instance.key), self.model.queue_text(instance.key))
+                panel.show_history(self.history.sparkline(instance.key), send=False)
+            row, column = divmod(index, columns)
+            cell.left = column * PANEL_WIDTH
+            cell.top = row * PANEL_ROW_HEIGHT
+            cell.visible = True
+            self._bound[instance.key] = panel
+
+
+# =============================================================================
+# Fleet Table
+# =============================================================================
+
+class FleetTable(ft.UserControl):
+    """Compact one-row-per-instance view of the fleet for large fleets.
+
+    One DataTable row of plain Text cells per instance instead of a card;
+    click a heading to sort, type in the filter box to narrow the rows and
+    tick rows for the bulk actions, which call on_bulk(action, instances)
+    with "run", "resume" or "stop".
+    """
+
+    def __init__(self, model: FleetModel, on_bulk):
+        super().__init__(expand=True)
+        self.model = model
+        self.on_bulk = on_bulk
+        self.sort_column: Optional[str] = None
+        self.descending = False
+        self.selected_keys = set()
+        self._rows: Dict[str, ft.DataRow] = {}  # key -> row showing it
+        self._order: List[str] = []
+
+        self.filter_field = ft.TextField(
+            hint_text="Filter (name, state, character, ...)",
+            width=280,
+            dense=True,
+            on_change=lambda e: self.refresh(),
+        )
+        self.selection_text = ft.Text("", size=12, color=Colors.TEXT_MUTED)
+        self.table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text(heading), on_sort=lambda e, c=column_id: self.sort_by(c))
+                for column_id, heading in TABLE_COLUMNS
+            ],
+            show_checkbox_column=True,
+            heading_row_height=36,
+            data_row_min_height=28,
+            data_row_max_height=28,
+            column_spacing=20,
+        )
+
+    def build(self):
+        def btn_style(bg_color):
+            return ft.ButtonStyle(
+                shape=ft.RoundedRectangleBorder(radius=0),
+                bgcolor=bg_color,
+                color=Colors.TEXT_PRIMARY,
+            )
+
+        self._layout()
+        return ft.Column(
+            expand=True,
+            spacing=8,
+            controls=[
+                ft.Row(
+                    spacing=5,
+                    controls=[
+                        self.filter_field,
+                        self.selection_text,
+                        ft.Container(expand=True),
+                        ft.ElevatedButton("Run Selected", style=btn_style(Colors.BLURPLE),
+                                          on_click=lambda _: self._bulk("run")),
+                        ft.ElevatedButton("Resume Selected", style=btn_style(Colors.BLURPLE),
+                                          on_click=lambda _: self._bulk("resume")),
+                        ft.ElevatedButton("Stop Selected", style=btn_style(Colors.BG_LIGHTER),
+                                          on_click=lambda _: self._bulk("stop")),
+                    ],
+                ),
+                ft.Column(expand=True, scroll=ft.ScrollMode.AUTO, controls=[self.table]),
+            ],
+        )
+
+    def sort_by(self, column: str):
+        """Sorts by a column; clicking the same heading again reverses the order."""
+        if self.sort_column == column:
+            self.descending = not self.descending
+        else:
+            self.sort_column, self.descending = column, False
+        self.refresh()
+
+    def refresh(self):
+        """Brings rows, their order and their values in line with the model, filter and sort."""
+        self._layout()
+        try:
+            self.update()
+        except Exception:
+            pass  # Not on the page yet
+
+    def refresh_key(self, key: str, send: bool = True) -> bool:
+        """Updates one row if its text changed; returns True if it did."""
+        instance = self.model.instance(key)
+        row = self._rows.get(key)
+        if instance is None or row is None or not self._fill(row, instance):
+            return False
+        if send:
+            try:
+                self.update()
+            except Exception:
+                pass
+        return True
+
+    def _layout(self):
+        columns = [column_id for column_id, _ in TABLE_COLUMNS]
+        self.table.sort_column_index = columns.index(self.sort_column) if self.sort_column else None
+        self.table.sort_ascending = not self.descending
+
+        rows = self.model.table_rows(self.filter_field.value or "", self.sort_column, self.descending)
+        wanted = {instance.key for instance in rows}
+        for key in [key for key in self._rows if key not in wanted]:
+            del self._rows[key]
+        self.selected_keys &= {instance.key for instance in (self.model.row(n) for n in range(len(self.model)))}
+
+        for instance in rows:
+            row = self._rows.get(instance.key)
+            if row is None:
+                row = ft.DataRow(
+                    cells=[ft.DataCell(ft.Text("", size=12)) for _ in columns],
+                    on_select_changed=lambda e, key=instance.key: self._on_select(key, e.data == "true"),
+                )
+                self._rows[instance.key] = row
+            row.selected = instance.key in self.selected_keys
+            self._fill(row, instance)
+
+        order = [instance.key for instance in rows]
+        if order != self._order:
+            self.table.rows = [self._rows[key] for key in order]
+            self._order = order
+        self._update_selection_text()
+
+    def _fill(self, row: ft.DataRow, instance: WranglerInstance) -> bool:
+        """Writes a row's values, touching only cells whose text changed."""
+        changed = False
+        color = InstancePanel.STATUS_COLORS[describe_state(self.model.status(instance.key))[0]]
+        for cell, value in zip(row.cells, self.model.table_values(instance)):
+            text = cell.content
+            if text.value != value:
+                text.value = value
+                changed = True
+        state_cell = row.cells[2].content
+        if state_cell.color != color:
+            state_cell.color = color
+            changed = True
+        return changed
+
+    def _on_select(self, key: str, selected: bool):
+        if selected:
+            self.selected_keys.add(key)
+        else:
+            self.selected_keys.discard(key)
+        self._rows[key].selected = selected
+        self._update_selection_text()
+        self.update()
+
+    def _update_selection_text(self):
+        text = f"{len(self._order)} of {len(self.model)} shown"
+        count = len(self.selected_keys)
+        self.selection_text.value = f"{text}, {count} selected" if count else text
+
+    def _bulk(self, action: str):
+        instances = [self.model.instance(key) for key in self.selected_keys]
+        instances = [instance for instance in instances if instance is not None]
+        if instances:
+            self.on_bulk(action, instances)
 
 
 # =============================================================================
@@ -520,11 +804,50 @@ class WranglerMasterApp:
         logger.info("WranglerMasterApp initializing...")
         self.page = page
         self.instances: List[WranglerInstance] = []
-        self.panels: Dict[str, InstancePanel] = {}
+        self.model = FleetModel()  # Rows and last status; panels only exist for visible rows
+        self.updates = UpdateBatch()  # Background results waiting for the next page.update()
+        self.history = StatusHistory()  # Recent polls per instance, for sparklines and the fleet graph
+        self.config_writer = ConfigWriter(
+            CONFIG_DIR / CONFIG_FILENAME,
+            on_error=lambda error: print(f"Failed to save config: {error}"),
+        )
         self.settings = AppSettings()
         self.default_json_path = ""
         self.polling_active = True
-        self.active_timers: Dict[str, dict] = {}
+        self.client = WranglerClient()
+        self.telemetry = TelemetryStore(
+            CONFIG_DIR / TELEMETRY_FILENAME,
+            on_error=lambda message: print(message),
+        )
+        self.client.on_command = lambda i, *outcome: self.telemetry.record_command(i.key, *outcome)
+        self.poller = FleetPoller(lambda i: self.client.get_status(i, conditional=True))
+        self.poll_scheduler = PollScheduler()
+        self.dispatcher = BulkDispatcher()
+        self.throttle = StartThrottle(self.client)
+        self.streams = StatusStreamManager(
+            self.client,
+            on_status=lambda i, s: self._post_status(i, s, pushed=True),
+            on_disconnect=lambda i: self.poll_scheduler.poll_soon(i.key)
+        )
+        self.runs = AdvancedRunManager(
+            self.client,
+            get_json_path=lambda: self.default_json_path,
+            on_message=self._set_status,
+            on_status=self._post_status,
+            journal=RunJournal(CONFIG_DIR / JOURNAL_FILENAME),
+            throttle=self.throttle,
+            on_transition=self.telemetry.record_transition
+        )
+        self.queue = OrderQueueManager(
+            self.client,
+            on_message=self._set_status,
+            on_change=self._on_queue_changed,
+            throttle=self.throttle,
+            poll_soon=self.poll_scheduler.poll_soon
+        )
+        self._queue_dialog_refresh = None
+        self.shard_run: Optional[ShardRun] = None
+        self._recipes: Optional[dict] = None
 
         # File picker (add once to page)
         self.file_picker = ft.FilePicker(on_result=self._on_file_picked)
@@ -535,6 +858,7 @@ class WranglerMasterApp:
         self._load_config()
         self._setup_page()
         self._build_ui()
+        self.runs.recover(self.instances)  # Timers and schedules from before a restart
         self._start_polling()
         logger.info("WranglerMasterApp initialized successfully")
 
@@ -550,6 +874,7 @@ class WranglerMasterApp:
         self.page.spacing = 0
         # Hide Windows title bar for cleaner look
         self.page.window_frameless = True
+        self.page.on_resize = self._on_resize
 
     def _build_ui(self):
         # Status bar text
@@ -565,14 +890,16 @@ class WranglerMasterApp:
             color=Colors.TEXT_MUTED,
         )
 
-        # Panels container
-        self.panels_container = ft.Row(
-            wrap=True,
-            spacing=0,
-            run_spacing=0,
+        # Panels container (fresh panels - the opacity may have changed)
+        self.panels_container = VirtualPanelGrid(
+            self.model,
+            self.history,
+            self._make_panel,
+            self.page.width or self.page.window_width,
+            self.page.height or self.page.window_height,
         )
-
-        # Build the main layout
+        self.fleet_table = FleetTable(self.model, self._on_bulk_action)
+        self.view_holder = ft.Container(expand=True, padding=0, content=self.view)
         self._rebuild_panels()
 
         # Background image (if set) - use expand and COVER fit to fill window
@@ -594,16 +921,7 @@ class WranglerMasterApp:
             spacing=0,
             controls=[
                 self._build_toolbar(),
-                ft.Container(
-                    expand=True,
-                    padding=0,
-                    content=ft.Column(
-                        expand=True,
-                        scroll=ft.ScrollMode.AUTO,
-                        spacing=0,
-                        controls=[self.panels_container],
-                    ),
-                ),
+                self.view_holder,
                 self._build_status_bar(),
             ],
         )
@@ -645,8 +963,21 @@ class WranglerMasterApp:
             self.page.update()
 
         def close_window(e):
+            self.config_writer.flush()
+            self.telemetry.close()
             self.page.window_close()
 
+        self.shard_btn = ft.ElevatedButton(
+            self._shard_button_text(),
+            style=btn_style(Colors.BLURPLE),
+            on_click=self._show_shard_dialog,
+        )
+        self.view_btn = ft.ElevatedButton(
+            self._view_button_text(),
+            style=btn_style(Colors.BG_LIGHTER),
+            on_click=lambda _: self._toggle_view(),
+        )
+
         return ft.WindowDragArea(
             content=ft.Container(
                 bgcolor=toolbar_bg,
@@ -668,6 +999,7 @@ class WranglerMasterApp:
                                     style=btn_style(Colors.BG_LIGHTER),
                                     on_click=self._show_settings,
                                 ),
+                                self.view_btn,
                                 ft.ElevatedButton(
                                     "Refresh",
                                     style=btn_style(Colors.BLURPLE),
@@ -678,6 +1010,12 @@ class WranglerMasterApp:
                                     style=btn_style(Colors.BLURPLE),
                                     on_click=self._show_add_dialog,
                                 ),
+                                ft.ElevatedButton(
+                                    "Discover",
+                                    style=btn_style(Colors.BLURPLE),
+                                    on_click=self._show_discover_dialog,
+                                ),
+                                self.shard_btn,
                                 ft.ElevatedButton(
                                     "Stop All",
                                     style=btn_style(Colors.BG_LIGHTER),
@@ -722,6 +1060,17 @@ class WranglerMasterApp:
         else:
             status_bg = Colors.BG_DARKEST
 
+        # Fleet graph: instances executing over the last few hours
+        self.fleet_text = ft.Text("", size=12, color=Colors.TEXT_MUTED)
+        self.fleet_bars = [ft.Container(expand=1, height=0, bgcolor=Colors.GREEN) for _ in range(FLEET_BUCKETS)]
+        self.fleet_graph = ft.Row(
+            spacing=1,
+            width=FLEET_GRAPH_SIZE[0],
+            height=FLEET_GRAPH_SIZE[1],
+            vertical_alignment=ft.CrossAxisAlignment.END,
+            controls=self.fleet_bars,
+        )
+
         return ft.Container(
             bgcolor=status_bg,
             padding=ft.padding.symmetric(horizontal=15, vertical=8),
@@ -729,62 +1078,121 @@ class WranglerMasterApp:
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 controls=[
                     self.status_text,
-                    self.json_path_text,
+                    ft.Row(
+                        spacing=15,
+                        controls=[self.fleet_text, self.fleet_graph, self.json_path_text],
+                    ),
                 ],
             ),
         )
 
-    def _rebuild_panels(self):
-        """Rebuilds all instance panels."""
-        self.panels_container.controls.clear()
-        self.panels.clear()
+    def _draw_fleet_graph(self):
+        """Redraws the executing-count graph in the status bar from the fleet history."""
+        series = self.history.fleet_series()
+        peak = max(max(series), 1)
+        for bar, count in zip(self.fleet_bars, series):
+            bar.height = 1 + (FLEET_GRAPH_SIZE[1] - 1) * count / peak
+        self.fleet_text.value = f"{series[-1]} executing (peak {max(series)})"
+        try:
+            self.page.update()
+        except Exception as e:
+            logger.error(f"Failed to update page: {e}")
 
-        if not self.instances:
-            self.panels_container.controls.append(
-                ft.Container(
-                    padding=50,
-                    content=ft.Text(
-                        "No instances configured.\nClick '+ Add' to add a Wrangler instance.",
-                        size=14,
-                        color=Colors.TEXT_MUTED,
-                        text_align=ft.TextAlign.CENTER,
-                    ),
-                )
-            )
-        else:
-            for instance in self.instances:
-                if not instance.enabled:
-                    continue
-
-                # Calculate panel opacity (inverse of background opacity setting)
-                panel_opacity = 1.0 - self.settings.background_opacity if self.settings.background_image else 1.0
-
-                panel = InstancePanel(
-                    instance,
-                    on_run=self._on_run,
-                    on_stop=self._on_stop,
-                    on_resume=self._on_resume,
-                    on_remove=self._on_remove,
-                    on_advanced=self._on_advanced,
-                    on_settings_changed=self._save_config,
-                    panel_opacity=panel_opacity,
-                )
+    @property
+    def view(self):
+        """The instance list on screen: the card grid or the table."""
+        return self.fleet_table if self.settings.view_mode == "table" else self.panels_container
 
-                # Wrap in container for sizing (wider to show all options)
-                panel_container = ft.Container(
-                    width=500,
-                    margin=0,
-                    padding=1,
-                    content=panel,
-                )
+    def _view_button_text(self) -> str:
+        return "Cards" if self.settings.view_mode == "table" else "Table"
+
+    def _toggle_view(self):
+        """Switches between the card grid and the compact table."""
+        self.settings.view_mode = "cards" if self.settings.view_mode == "table" else "table"
+        self._save_config()
+        self.view_holder.content = self.view
+        self.view_btn.text = self._view_button_text()
+        self.page.update()
+        self.view.refresh()
+
+    def _on_bulk_action(self, action: str, instances: List[WranglerInstance]):
+        """Runs a bulk action from the table on the selected instances."""
+        if action == "run":
+            self._start_all(instances)
+        elif action == "resume":
+            self._resume_all(instances)
+        elif action == "stop":
+            self._stop_all(instances)
+
+    def _make_panel(self, instance: WranglerInstance) -> InstancePanel:
+        """Creates a pooled panel; VirtualPanelGrid rebinds it to whichever row it shows."""
+        # Calculate panel opacity (inverse of background opacity setting)
+        panel_opacity = 1.0 - self.settings.background_opacity if self.settings.background_image else 1.0
+        return InstancePanel(
+            instance,
+            on_run=self._on_run,
+            on_stop=self._on_stop,
+            on_resume=self._on_resume,
+            on_remove=self._on_remove,
+            on_advanced=self._on_advanced,
+            on_settings_changed=self._save_config,
+            panel_opacity=panel_opacity,
+            on_queue=self._show_queue_dialog,
+        )
+
+    def _rebuild_panels(self):
+        """Updates the instance list rows from self.instances, keyed by host:port.
+
+        Status and queue readouts live in self.model, so instances that stay
+        keep what they show; the view only rebinds the panels on screen.
+        """
+        self.streams.sync(self.instances)
+        if self.model.set_instances(self.instances):
+            # New rows start blank, so the next poll must not come back as 304
+            self.client.invalidate()
+        self.history.retain(instance.key for instance in self.instances if instance.enabled)
+        for instance in self.instances:
+            if instance.enabled:
+                self.model.set_queue_text(instance.key, self.queue.summary(instance))
+        self.view.refresh()
 
-                self.panels_container.controls.append(panel_container)
-                key = f"{instance.host}:{instance.port}"
-                self.panels[key] = panel
+    def _on_resize(self, e):
+        self.panels_container.resize(self.page.width, self.page.height)
 
     def _set_status(self, message: str):
-        self.status_text.value = message
-        self.page.update()
+        """Shows a status bar message; messages from the same flush share one page.update()."""
+        if self.updates.put_message(message):
+            self._flush_updates()
+
+    def _post_status(self, instance: WranglerInstance, status: InstanceStatus, pushed: bool = False):
+        """Queues a status from any thread for the next flush."""
+        self.telemetry.record_status(instance.key, status, pushed)
+        if self.updates.put(instance, status, pushed):
+            self._flush_updates()
+
+    def _flush_updates(self):
+        """Applies everything queued so far and sends it in a single page.update().
+
+        Runs on the thread that started the batch; anything queued meanwhile
+        joins it. Work beyond one frame's budget goes out in the next flush,
+        and a flush that changed nothing sends nothing.
+        """
+        changed = False
+
+        def apply(instance: WranglerInstance, status: InstanceStatus, pushed: bool):
+            nonlocal changed
+            changed = self._apply_status(instance.key, status, pushed) or changed
+
+        message, more = self.updates.drain(apply)
+        if message is not None:
+            self.status_text.value = message
+        if message is not None or changed:
+            try:
+                self.page.update()
+            except Exception as e:
+                logger.error(f"Failed to update page: {e}")
+        if more:
+            threading.Timer(FRAME_INTERVAL, self._flush_updates).start()
 
     # =========================================================================
     # Instance Actions
@@ -804,7 +1212,7 @@ class WranglerMasterApp:
         self._set_status(f"Starting {instance.name}...")
 
         def run():
-            success, message = WranglerClient.run_order(instance, json_path)
+            success, message = self.client.run_order(instance, json_path)
             status_msg = f"{instance.name}: {message}" if success else f"{instance.name} failed: {message}"
             self._set_status(status_msg)
             time.sleep(1)
@@ -816,7 +1224,7 @@ class WranglerMasterApp:
         self._set_status(f"Stopping {instance.name}...")
 
         def stop():
-            success, message = WranglerClient.stop_gently(instance)
+            success, message = self.client.stop_gently(instance)
             status_msg = f"{instance.name}: {message}" if success else f"{instance.name} failed: {message}"
             self._set_status(status_msg)
             time.sleep(2)
@@ -828,7 +1236,7 @@ class WranglerMasterApp:
         self._set_status(f"Resuming {instance.name}...")
 
         def resume():
-            success, message = WranglerClient.resume_orders(instance)
+            success, message = self.client.resume_orders(instance)
             status_msg = f"{instance.name}: {message}" if success else f"{instance.name} failed: {message}"
             self._set_status(status_msg)
             time.sleep(1)
@@ -843,6 +1251,11 @@ class WranglerMasterApp:
             logger.debug(f"do_remove called with {e.control.text}")
             if e.control.text == "Yes":
                 self.instances.remove(instance)
+                self.client.forget(instance)
+                self.poll_scheduler.forget(instance.key)
+                self.streams.forget(instance.key)
+                self.runs.cancel(instance.key)
+                self.queue.forget(instance.key)
                 self._rebuild_panels()
                 self._save_config()
                 self._set_status(f"Removed: {instance.name}")
@@ -911,6 +1324,30 @@ class WranglerMasterApp:
             width=80,
             border_radius=0,
         )
+        schedule_days = ft.TextField(
+            label="Days",
+            value=format_days(config.schedule_days),
+            hint_text="every day",
+            width=180,
+            border_radius=0,
+        )
+        schedule_extra = ft.TextField(
+            label="More windows",
+            value=config.schedule_extra_windows,
+            hint_text="Sat,Sun 10:00-02:00; 18:00-20:00",
+            border_radius=0,
+        )
+        schedule_timezone = ft.TextField(
+            label="Time zone",
+            value=config.schedule_timezone,
+            hint_text="local",
+            width=180,
+            border_radius=0,
+        )
+        schedule_eorzea_cb = ft.Checkbox(
+            label="Eorzea time",
+            value=config.schedule_eorzea,
+        )
 
         # Use resume checkbox
         use_resume_cb = ft.Checkbox(
@@ -940,7 +1377,8 @@ class WranglerMasterApp:
         # Schedule section
         schedule_section = ft.Container(
             content=ft.Column([
-                ft.Text("Schedule Mode: Run during specific hours daily", size=12, color=Colors.TEXT_MUTED),
+                ft.Text("Schedule Mode: Run inside each window (an end before the start crosses midnight)",
+                        size=12, color=Colors.TEXT_MUTED),
                 ft.Row([
                     ft.Text("Start:", width=50),
                     schedule_start_hour,
@@ -953,6 +1391,8 @@ class WranglerMasterApp:
                     ft.Text(":"),
                     schedule_end_minute,
                 ]),
+                ft.Row([schedule_days, schedule_timezone, schedule_eorzea_cb]),
+                schedule_extra,
             ]),
             padding=10,
         )
@@ -973,8 +1413,14 @@ class WranglerMasterApp:
                     schedule_start_minute=int(schedule_start_minute.value),
                     schedule_end_hour=int(schedule_end_hour.value),
                     schedule_end_minute=int(schedule_end_minute.value),
+                    schedule_days=parse_days(schedule_days.value),
+                    schedule_extra_windows=schedule_extra.value.strip(),
+                    schedule_timezone=schedule_timezone.value.strip(),
+                    schedule_eorzea=schedule_eorzea_cb.value,
                     use_resume=use_resume_cb.value,
                 )
+                if new_config.mode == "schedule":
+                    Schedule.from_config(new_config)  # Validates windows and time zone
 
                 # Save config to instance
                 instance.set_advanced_config(new_config)
@@ -990,14 +1436,12 @@ class WranglerMasterApp:
                         self._on_resume(instance)
                     else:
                         self._on_run(instance)
-                elif new_config.mode == "timer":
-                    self._start_timer_mode(instance, new_config)
-                elif new_config.mode == "schedule":
-                    self._start_schedule_mode(instance, new_config)
+                else:
+                    self.runs.start(instance, new_config)
 
             except ValueError as ex:
                 logger.error(f"Invalid value: {ex}")
-                self._set_status(f"Error: Invalid value in form")
+                self._set_status(f"Error: {ex}")
 
         dlg = ft.AlertDialog(
             modal=True,
@@ -1034,211 +1478,188 @@ class WranglerMasterApp:
         dlg.open = True
         self.page.update()
 
-    def _start_timer_mode(self, instance: WranglerInstance, config: AdvancedRunConfig):
-        """Starts timer mode for an instance."""
-        duration_seconds = config.timer_hours * 3600 + config.timer_minutes * 60
-        if duration_seconds <= 0:
-            self._set_status(f"{instance.name}: Invalid timer duration")
-            return
-
-        key = f"{instance.host}:{instance.port}"
-        end_time = datetime.now() + timedelta(seconds=duration_seconds)
-
-        self.active_timers[key] = {
-            "instance": instance,
-            "end_time": end_time,
-            "config": config,
-        }
-
-        # Start the run
-        if config.use_resume:
-            self._on_resume(instance)
-        else:
-            self._on_run(instance)
-
-        hours, mins = config.timer_hours, config.timer_minutes
-        self._set_status(f"{instance.name}: Timer started ({hours}h {mins}m)")
-
-        # Start timer check thread
-        def check_timer():
-            while key in self.active_timers:
-                time.sleep(10)
-                if datetime.now() >= self.active_timers[key]["end_time"]:
-                    # Time's up - stop the instance
-                    WranglerClient.stop_gently(instance)
-                    if instance.go_home_after_session:
-                        time.sleep(2)
-                        WranglerClient.go_home(instance)
-                    del self.active_timers[key]
-                    self._set_status(f"{instance.name}: Timer ended")
-                    break
-
-        threading.Thread(target=check_timer, daemon=True).start()
-
-    def _start_schedule_mode(self, instance: WranglerInstance, config: AdvancedRunConfig):
-        """Starts schedule mode for an instance."""
-        key = f"{instance.host}:{instance.port}"
-
-        self.active_timers[key] = {
-            "instance": instance,
-            "config": config,
-            "mode": "schedule",
-            "last_action": None,
-        }
-
-        self._set_status(
-            f"{instance.name}: Schedule active "
-            f"({config.schedule_start_hour:02d}:{config.schedule_start_minute:02d} - "
-            f"{config.schedule_end_hour:02d}:{config.schedule_end_minute:02d})"
-        )
-
-        # Check schedule immediately and start monitoring
-        def check_schedule():
-            while key in self.active_timers:
-                schedule_data = self.active_timers.get(key)
-                if not schedule_data or schedule_data.get("mode") != "schedule":
-                    break
-
-                cfg = schedule_data["config"]
-                inst = schedule_data["instance"]
-                now = datetime.now()
-                current_minutes = now.hour * 60 + now.minute
-                start_minutes = cfg.schedule_start_hour * 60 + cfg.schedule_start_minute
-                end_minutes = cfg.schedule_end_hour * 60 + cfg.schedule_end_minute
-
-                in_window = start_minutes <= current_minutes < end_minutes
-
-                if in_window and schedule_data["last_action"] != "started":
-                    # Start/resume
-                    if cfg.use_resume:
-                        WranglerClient.resume_orders(inst)
-                    else:
-                        if self.default_json_path:
-                            WranglerClient.run_order(inst, self.default_json_path)
-                    schedule_data["last_action"] = "started"
-                    self._set_status(f"{inst.name}: Started (schedule)")
-                elif not in_window and schedule_data["last_action"] == "started":
-                    # Stop
-                    WranglerClient.stop_gently(inst)
-                    if inst.go_home_after_session:
-                        time.sleep(2)
-                        WranglerClient.go_home(inst)
-                    schedule_data["last_action"] = "stopped"
-                    self._set_status(f"{inst.name}: Stopped (schedule)")
-
-                time.sleep(60)  # Check every minute
-
-        threading.Thread(target=check_schedule, daemon=True).start()
-
     # =========================================================================
     # Bulk Actions
     # =========================================================================
 
-    def _start_all(self):
+    def _start_all(self, instances: Optional[List[WranglerInstance]] = None):
+        """Starts all instances (or the given ones)."""
         logger.debug("_start_all called")
         if not self.default_json_path:
-            self._pick_json_file(lambda path: self._do_start_all(path))
+            self._pick_json_file(lambda path: self._do_start_all(path, instances))
         else:
-            self._do_start_all(self.default_json_path)
+            self._do_start_all(self.default_json_path, instances)
 
-    def _do_start_all(self, json_path: str):
+    def _do_start_all(self, json_path: str, instances: Optional[List[WranglerInstance]] = None):
         if not json_path:
             return
+        action = "Start All" if instances is None else f"Start {len(instances)} Selected"
+        instances = list(self.instances) if instances is None else instances
         self.default_json_path = json_path
         self._save_config()
-        self._set_status("Starting all instances...")
+        self._set_status(f"Starting {len(instances)} instance(s)...")
+        statuses = self._statuses()
 
         def start():
-            successes = 0
-            failures = 0
-            for instance in self.instances:
-                if instance.enabled:
-                    success, _ = WranglerClient.run_order(instance, json_path)
-                    if success:
-                        successes += 1
-                    else:
-                        failures += 1
-            self._set_status(f"Started {successes} instances, {failures} failed")
+            blocked = self._blocked_instances(json_path, statuses)
+
+            def start_one(instance: WranglerInstance):
+                if instance.key in blocked:
+                    return None, blocked[instance.key]
+                return self.throttle.start(instance, lambda i: self.client.run_order(i, json_path))
+
+            results = self.dispatcher.dispatch(
+                self.throttle.order(instances),
+                start_one,
+                on_result=self._bulk_progress("Starting"),
+            )
+            self._finish_bulk(action, results)
             time.sleep(2)
             self._refresh_all()
 
         threading.Thread(target=start, daemon=True).start()
 
-    def _stop_all(self):
+    def _stop_all(self, instances: Optional[List[WranglerInstance]] = None):
+        """Stops all instances (or the given ones)."""
         logger.debug("_stop_all called")
-        self._set_status("Stopping all instances...")
+        action = "Stop All" if instances is None else f"Stop {len(instances)} Selected"
+        instances = list(self.instances) if instances is None else instances
+        self._set_status(f"Stopping {len(instances)} instance(s)...")
 
         def stop():
-            successes = 0
-            failures = 0
-            for instance in self.instances:
-                if instance.enabled:
-                    success, _ = WranglerClient.stop_gently(instance)
-                    if success:
-                        successes += 1
-                    else:
-                        failures += 1
-            self._set_status(f"Stopped {successes} instances, {failures} failed")
+            results = self.dispatcher.dispatch(
+                instances,
+                self.client.stop_gently,
+                on_result=self._bulk_progress("Stopping"),
+            )
+            self._finish_bulk(action, results)
             time.sleep(2)
             self._refresh_all()
 
         threading.Thread(target=stop, daemon=True).start()
 
-    def _resume_all(self):
+    def _resume_all(self, instances: Optional[List[WranglerInstance]] = None):
+        """Resumes all instances (or the given ones) that have incomplete orders."""
         logger.debug("_resume_all called")
-        self._set_status("Resuming all instances...")
+        action = "Resume All" if instances is None else f"Resume {len(instances)} Selected"
+        instances = list(self.instances) if instances is None else instances
+        self._set_status(f"Resuming {len(instances)} instance(s)...")
+
+        def resume_one(instance: WranglerInstance):
+            status = self.client.get_status(instance)
+            if not status.reachable or status.is_executing:
+                return None, status.error or "Already executing"
+            if not status.has_incomplete_orders:
+                return None, "No incomplete orders"
+            return self.throttle.start(instance, self.client.resume_orders)
 
         def resume():
-            successes = 0
-            failures = 0
-            skipped = 0
-            for instance in self.instances:
-                if not instance.enabled:
-                    continue
-                status = WranglerClient.get_status(instance)
-                if not status.reachable or status.is_executing:
-                    skipped += 1
-                    continue
-                if not status.has_incomplete_orders:
-                    skipped += 1
-                    continue
-                success, _ = WranglerClient.resume_orders(instance)
-                if success:
-                    successes += 1
-                else:
-                    failures += 1
-            self._set_status(f"Resumed {successes}, {failures} failed, {skipped} skipped")
+            results = self.dispatcher.dispatch(
+                self.throttle.order(instances),
+                resume_one,
+                on_result=self._bulk_progress("Resuming"),
+            )
+            self._finish_bulk(action, results)
             time.sleep(2)
             self._refresh_all()
 
         threading.Thread(target=resume, daemon=True).start()
 
+    def _bulk_progress(self, verb: str):
+        """Returns a dispatcher callback that streams progress into the status bar."""
+        def on_result(result: DispatchResult, done: List[DispatchResult], total: int):
+            successes, failures, skipped = summarize_results(done)
+            text = f"{verb} {len(done)}/{total}: {successes} ok, {failures} failed"
+            if skipped:
+                text += f", {skipped} skipped"
+            self._set_status(text)
+        return on_result
+
+    def _finish_bulk(self, action: str, results: List[DispatchResult]):
+        """Shows the final summary of a bulk action; lists details if anything failed."""
+        successes, failures, skipped = summarize_results(results)
+        table = format_results_table(results)
+        logger.info(f"{action} results:\n{table}")
+        self._set_status(f"{action}: {successes} succeeded, {failures} failed, {skipped} skipped")
+        if not failures:
+            return
+
+        def close_dlg(e):
+            dlg.open = False
+            self.page.update()
+
+        dlg = ft.AlertDialog(
+            modal=False,
+            title=ft.Text(f"{action} Results"),
+            content=ft.Column(
+                tight=True,
+                width=600,
+                scroll=ft.ScrollMode.AUTO,
+                controls=[ft.Text(table, font_family="Consolas", size=12, selectable=True)],
+            ),
+            actions=[ft.TextButton("Close", on_click=close_dlg)],
+        )
+        # Flet 0.19.0 style dialog
+        self.page.dialog = dlg
+        dlg.open = True
+        self.page.update()
+
     # =========================================================================
     # Polling & Status Updates
     # =========================================================================
 
     def _start_polling(self):
+        """Polls each instance on its own adaptive interval (see PollScheduler).
+
+        Due polls go to the pool without waiting for the batch, so a slow
+        instance never delays the others.
+        """
         def poll():
             while self.polling_active:
-                self._refresh_all()
-                time.sleep(POLL_INTERVAL_SECONDS)
+                instances = list(self.instances)
+                due = self.poll_scheduler.due(instances)
+                if due:
+                    self.poller.submit(due, self._post_status)
+                if self.history.sample_fleet(self.model.statuses().values()):
+                    self._draw_fleet_graph()
+                # Wake at least once a second so newly added instances are picked up
+                wait = self.poll_scheduler.seconds_until_next(instances)
+                time.sleep(min(max(wait, 0.1), 1.0))
 
         threading.Thread(target=poll, daemon=True).start()
 
-    def _refresh_all(self):
+    def _refresh_all(self, instances: Optional[List[WranglerInstance]] = None):
         logger.debug("_refresh_all called")
-        for instance in self.instances:
-            if instance.enabled:
-                self._update_instance_status(instance)
+        instances = list(self.instances) if instances is None else instances
+        snapshot = self.poller.poll(instances)
+        self.telemetry.record_statuses(snapshot)
+        if self.updates.put_many(instances, snapshot):
+            self._flush_updates()
 
     def _update_instance_status(self, instance: WranglerInstance):
-        status = WranglerClient.get_status(instance)
-        key = f"{instance.host}:{instance.port}"
-        if key in self.panels:
-            try:
-                self.panels[key].update_status(status)
-            except Exception as e:
-                logger.error(f"Failed to update panel: {e}")
+        self._post_status(instance, self.client.get_status(instance))
+
+    def _apply_status(self, key: str, status: InstanceStatus, pushed: bool = False) -> bool:
+        """Routes one status and redraws its row (sent with the flush's page.update()).
+
+        Returns True if anything on screen changed.
+        """
+        self.poll_scheduler.record(key, status, pushed)
+        instance = self.model.instance(key)
+        if instance is None:
+            return False  # Removed or disabled meanwhile
+        if not (self.shard_run and self.shard_run.on_status(instance, status)):
+            self.queue.on_status(instance, status)
+        if not pushed:
+            self.model.set_latency(key, status.latency)
+        if not status.not_modified:  # 304 - only the latency can have changed
+            self.model.set_status(key, status)
+        self.history.record(key, status, pushed)
+        try:
+            return self.view.refresh_key(key, send=False)
+        except Exception as e:
+            logger.error(f"Failed to update panel: {e}")
+            return False
 
     # =========================================================================
     # Dialogs
@@ -1317,6 +1738,393 @@ class WranglerMasterApp:
         self.page.update()
         logger.debug("Dialog should be visible now")
 
+    def _on_queue_changed(self, instance: WranglerInstance):
+        self._save_config()
+        self.model.set_queue_text(instance.key, self.queue.summary(instance))
+        self.view.refresh_key(instance.key)
+        if self._queue_dialog_refresh:
+            self._queue_dialog_refresh(instance)
+
+    def _show_queue_dialog(self, instance: WranglerInstance):
+        logger.debug(f"_show_queue_dialog called for {instance.name}")
+
+        summary_text = ft.Text("", weight=ft.FontWeight.BOLD)
+        running_text = ft.Text("", size=12, color=Colors.TEXT_MUTED)
+        rows = ft.ListView(height=260, spacing=2)
+        pause_btn = ft.TextButton("Pause")
+
+        def refresh(changed: WranglerInstance = None):
+            if changed is not None and changed is not instance:
+                return
+            queue = list(instance.order_queue)
+            rows.controls = [
+                ft.Row(
+                    spacing=0,
+                    controls=[
+                        ft.Text(f"{index + 1:>2}. {os.path.basename(path)}", expand=True, size=13),
+                        ft.IconButton(ft.icons.ARROW_UPWARD, icon_size=16,
+                                      on_click=lambda _, i=index: self.queue.move(instance, i, -1)),
+                        ft.IconButton(ft.icons.ARROW_DOWNWARD, icon_size=16,
+                                      on_click=lambda _, i=index: self.queue.move(instance, i, 1)),
+                        ft.IconButton(ft.icons.DELETE_OUTLINE, icon_size=16, icon_color=Colors.RED,
+                                      on_click=lambda _, i=index: self.queue.remove(instance, i)),
+                    ],
+                )
+                for index, path in enumerate(queue)
+            ]
+            paused = " (paused)" if instance.queue_paused else ""
+            rate = self.queue.orders_per_hour(instance.key)
+            summary_text.value = f"{len(queue)} queued{paused} - {rate:.1f} orders/hour"
+            running = self.queue.running(instance.key)
+            running_text.value = f"Running: {os.path.basename(running)}" if running else ""
+            pause_btn.text = "Resume Queue" if instance.queue_paused else "Pause"
+            self.page.update()
+
+        def on_files_picked(e):
+            if e.files:
+                self.queue.add(instance, [f.path for f in e.files])
+
+        def add_files(e):
+            self.file_picker_callback = on_files_picked
+            self.file_picker.pick_files(
+                allowed_extensions=["json"],
+                allow_multiple=True,
+                dialog_title="Add Order Files",
+            )
+
+        def close_dlg(e):
+            self._queue_dialog_refresh = None
+            dlg.open = False
+            self.page.update()
+
+        pause_btn.on_click = lambda _: self.queue.set_paused(instance, not instance.queue_paused)
+
+        dlg = ft.AlertDialog(
+            modal=True,
+            title=ft.Text(f"Order Queue - {instance.name}"),
+            content=ft.Column(
+                tight=True,
+                width=460,
+                controls=[summary_text, running_text, rows],
+            ),
+            actions=[
+                ft.TextButton("Add...", on_click=add_files),
+                ft.TextButton("Clear", on_click=lambda _: self.queue.clear(instance)),
+                pause_btn,
+                ft.TextButton("Close", on_click=close_dlg),
+            ],
+        )
+        self.page.dialog = dlg
+        dlg.open = True
+        self._queue_dialog_refresh = refresh
+        refresh()
+
+    def _load_recipes(self) -> dict:
+        """Returns Data/recipes.csv by item id, read on first use ({} if missing)."""
+        if self._recipes is None:
+            recipes = {}
+            path = find_data_file(RECIPES_FILENAME, CONFIG_DIR)
+            if path:
+                try:
+                    recipes = load_recipes(path)
+                except (OSError, ValueError) as e:
+                    logger.error(f"Failed to load recipes: {e}")
+            self._recipes = recipes
+        return self._recipes
+
+    def _planner(self):
+        """Returns (WorkEstimator, PlacementEngine or None); gearsets are re-read every call."""
+        recipes = self._load_recipes()
+        debug_dir = self.settings.lisbeth_debug_dir or find_lisbeth_debug_dir(CONFIG_DIR)
+        gear = GearsetIndex.load(debug_dir) if debug_dir else GearsetIndex()
+        placement = PlacementEngine(gear, recipes) if len(gear) and recipes else None
+        return WorkEstimator(recipes), placement
+
+    def _statuses(self) -> Dict[str, InstanceStatus]:
+        return self.model.statuses()
+
+    def _blocked_instances(self, json_path: str, statuses: Dict[str, InstanceStatus]) -> Dict[str, str]:
+        """Instances whose character's gear cannot craft the order file (see wrangler_gearsets)."""
+        try:
+            orders = load_order(json_path)
+        except (OSError, ValueError):
+            return {}  # Not a plain order list - let the instance decide
+        _, placement = self._planner()
+        if placement is None:
+            return {}
+        return placement.blocked(orders, placement.characters_for(statuses))
+
+    def _shard_button_text(self) -> str:
+        run = self.shard_run
+        if run and not run.finished:
+            return f"Shard {len(run.done)}/{run.total}"
+        return "Shard"
+
+    def _on_shard_changed(self):
+        self.shard_btn.text = self._shard_button_text()
+        self.page.update()
+
+    def _show_shard_dialog(self, e):
+        logger.debug("_show_shard_dialog called!")
+
+        def close_dlg(e):
+            dlg.open = False
+            self.page.update()
+
+        run = self.shard_run
+        if run and not run.finished:
+            def cancel_run(e):
+                run.cancel()
+                close_dlg(e)
+
+            dlg = ft.AlertDialog(
+                modal=True,
+                title=ft.Text("Shard Run"),
+                content=ft.Text(run.progress()),
+                actions=[
+                    ft.TextButton("Stop Handing Out Shards", on_click=cancel_run),
+                    ft.TextButton("Close", on_click=close_dlg),
+                ],
+            )
+            self.page.dialog = dlg
+            dlg.open = True
+            self.page.update()
+            return
+
+        orders: List[dict] = []
+        statuses = self._statuses()
+        state = {"estimator": None, "placement": None}
+        path_text = ft.Text("(none)", size=13)
+        plan_text = ft.Text("Loading recipes...", size=12, color=Colors.TEXT_MUTED)
+        per_instance = ft.Dropdown(
+            label="Shards per instance",
+            value=str(SHARDS_PER_INSTANCE),
+            options=[ft.dropdown.Option(v) for v in ["1", "2", "3", "4", "6", "8"]],
+            border_radius=0,
+            width=200,
+        )
+        checkboxes = [
+            ft.Checkbox(label=f"{instance.name}  ({instance.key})", value=instance.enabled)
+            for instance in self.instances
+        ]
+
+        def selected() -> List[WranglerInstance]:
+            return [instance for instance, checkbox in zip(self.instances, checkboxes) if checkbox.value]
+
+        def plan():
+            """Returns (shards, lines no selected character can craft)."""
+            count = len(selected()) * int(per_instance.value)
+            placement = state["placement"]
+            if placement is None:
+                return plan_shards(orders, count, state["estimator"]), []
+            characters = placement.characters_for({i.key: statuses.get(i.key) for i in selected()})
+            return plan_placed_shards(orders, count, state["estimator"], placement, characters)
+
+        def update_plan(e=None):
+            estimator = state["estimator"]
+            if estimator is None:
+                return
+            shards, unplaceable = plan() if orders and selected() else ([], [])
+            if shards:
+                plan_text.value = describe_plan(shards, len(selected()))
+                if not estimator.recipes:
+                    plan_text.value += "\nrecipes.csv not found - shards are balanced by item count."
+                elif state["placement"] is None:
+                    plan_text.value += "\nNo gearsets found - every instance is assumed able to craft everything."
+                if unplaceable:
+                    plan_text.value += f"\n{len(unplaceable)} line(s) no selected character can craft will be left out."
+            else:
+                plan_text.value = "Choose an order file and at least one instance."
+            start_btn.disabled = not shards
+            self.page.update()
+
+        def load_file(path: str):
+            try:
+                orders[:] = load_order(path)
+            except (OSError, ValueError) as err:
+                orders.clear()
+                path_text.value = f"Could not read {os.path.basename(path)}: {err}"
+            else:
+                path_text.value = os.path.basename(path)
+            update_plan()
+
+        def on_file_picked(e):
+            if e.files:
+                load_file(e.files[0].path)
+
+        def browse(e):
+            self.file_picker_callback = on_file_picked
+            self.file_picker.pick_files(
+                allowed_extensions=["json"],
+                dialog_title="Select Order File to Shard",
+            )
+
+        def start(e):
+            shards, instances = plan()[0], selected()
+            dlg.open = False
+            self.shard_run = ShardRun(
+                self.client, shards, instances,
+                on_message=self._set_status,
+                on_change=self._on_shard_changed,
+                throttle=self.throttle,
+                poll_soon=self.poll_scheduler.poll_soon
+            )
+            self._set_status(f"Sharding across {len(instances)} instance(s): {describe_plan(shards, len(instances))}")
+            self._on_shard_changed()
+            self.shard_run.start()
+
+        per_instance.on_change = update_plan
+        for checkbox in checkboxes:
+            checkbox.on_change = update_plan
+
+        start_btn = ft.ElevatedButton(
+            "Start",
+            disabled=True,
+            style=ft.ButtonStyle(
+                shape=ft.RoundedRectangleBorder(radius=0),
+                bgcolor=Colors.GREEN,
+                color=Colors.TEXT_DARK,
+            ),
+            on_click=start,
+        )
+
+        dlg = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("Shard Order Across Instances"),
+            content=ft.Column(
+                tight=True,
+                width=440,
+                controls=[
+                    ft.Row([path_text, ft.TextButton("Browse...", on_click=browse)],
+                           alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    per_instance,
+                    ft.Column(checkboxes, scroll=ft.ScrollMode.AUTO, height=200, spacing=2),
+                    plan_text,
+                ],
+            ),
+            actions=[
+                ft.TextButton("Cancel", on_click=close_dlg),
+                start_btn,
+            ],
+        )
+        self.page.dialog = dlg
+        dlg.open = True
+        self.page.update()
+
+        # Recipes take a moment to read - load them off the UI thread
+        def load_estimator():
+            state["estimator"], state["placement"] = self._planner()
+            if self.default_json_path and not orders:
+                load_file(self.default_json_path)
+            else:
+                update_plan()
+
+        threading.Thread(target=load_estimator, daemon=True).start()
+
+    def _show_discover_dialog(self, e):
+        logger.debug("_show_discover_dialog called!")
+
+        network_field = ft.TextField(
+            label="Network (CIDR or host)",
+            value=local_network(),
+            border_radius=0,
+        )
+        ports_field = ft.TextField(
+            label="Ports",
+            value=DEFAULT_PORTS,
+            border_radius=0,
+        )
+        progress_text = ft.Text("", size=12, color=Colors.TEXT_MUTED)
+        results_column = ft.Column(scroll=ft.ScrollMode.AUTO, height=220, spacing=2)
+        found: List[WranglerInstance] = []
+
+        def close_dlg(e):
+            dlg.open = False
+            self.page.update()
+
+        def set_progress(message: str):
+            progress_text.value = message
+            self.page.update()
+
+        def scan(e):
+            scan_btn.disabled = True
+            add_btn.disabled = True
+            results_column.controls.clear()
+            found.clear()
+            self.page.update()
+
+            def do_scan():
+                try:
+                    found.extend(discover_instances(
+                        network_field.value.strip(),
+                        ports_field.value.strip() or DEFAULT_PORTS,
+                        self.instances,
+                        on_progress=set_progress,
+                    ))
+                except ValueError as err:
+                    set_progress(str(err))
+
+                for instance in found:
+                    results_column.controls.append(
+                        ft.Checkbox(label=f"{instance.name}  ({instance.key})", value=True)
+                    )
+                scan_btn.disabled = False
+                add_btn.disabled = not found
+                self.page.update()
+
+            threading.Thread(target=do_scan, daemon=True).start()
+
+        def add_selected(e):
+            selected = [
+                instance for instance, checkbox in zip(found, results_column.controls)
+                if checkbox.value
+            ]
+            dlg.open = False
+            self.page.update()
+
+            if selected:
+                self.instances.extend(selected)
+                self._rebuild_panels()
+                self._save_config()
+                self._set_status(f"Added {len(selected)} discovered instance(s)")
+
+        scan_btn = ft.ElevatedButton(
+            "Scan",
+            style=ft.ButtonStyle(
+                shape=ft.RoundedRectangleBorder(radius=0),
+                bgcolor=Colors.BLURPLE,
+                color=Colors.TEXT_PRIMARY,
+            ),
+            on_click=scan,
+        )
+        add_btn = ft.ElevatedButton(
+            "Add Selected",
+            disabled=True,
+            style=ft.ButtonStyle(
+                shape=ft.RoundedRectangleBorder(radius=0),
+                bgcolor=Colors.BLURPLE,
+                color=Colors.TEXT_PRIMARY,
+            ),
+            on_click=add_selected,
+        )
+
+        dlg = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("Discover Wrangler Instances"),
+            content=ft.Column(
+                tight=True,
+                width=420,
+                controls=[network_field, ports_field, scan_btn, progress_text, results_column],
+            ),
+            actions=[
+                ft.TextButton("Cancel", on_click=close_dlg),
+                add_btn,
+            ],
+        )
+        self.page.dialog = dlg
+        dlg.open = True
+        self.page.update()
+
     def _show_settings(self, e):
         logger.debug("_show_settings called!")
 
@@ -1342,6 +2150,31 @@ class WranglerMasterApp:
 
         opacity_slider.on_change = on_opacity_change
 
+        per_host_dd = ft.Dropdown(
+            label="Starts per host",
+            value=str(self.settings.rollout_max_per_host),
+            options=[ft.dropdown.Option(v) for v in ["1", "2", "3", "4", "6", "8", "16"]],
+            width=190,
+            border_radius=0,
+        )
+        spacing_dd = ft.Dropdown(
+            label="Spacing (sec)",
+            value=f"{self.settings.rollout_spacing:g}",
+            options=[ft.dropdown.Option(v) for v in ["0", "2", "5", "10", "20", "30", "60"]],
+            width=190,
+            border_radius=0,
+        )
+        ramp_cb = ft.Checkbox(
+            label="Wait for each instance to be executing before starting the next",
+            value=self.settings.rollout_ramp,
+        )
+        gear_dir_field = ft.TextField(
+            label="Lisbeth Debug folder (gearsets)",
+            value=self.settings.lisbeth_debug_dir,
+            hint_text="Auto (next to the master)",
+            border_radius=0,
+        )
+
         def browse_bg(e):
             logger.debug("browse_bg called")
             # Store the text field ref for the callback
@@ -1361,6 +2194,11 @@ class WranglerMasterApp:
             logger.debug("save_settings called")
             self.settings.background_image = bg_field.value
             self.settings.background_opacity = opacity_slider.value
+            self.settings.rollout_max_per_host = int(per_host_dd.value)
+            self.settings.rollout_spacing = float(spacing_dd.value)
+            self.settings.rollout_ramp = ramp_cb.value
+            self.settings.lisbeth_debug_dir = gear_dir_field.value.strip()
+            self._apply_rollout_settings()
             self._save_settings()
             self._rebuild_ui()
             dlg.open = False
@@ -1389,6 +2227,12 @@ class WranglerMasterApp:
                     ft.Container(height=10),
                     opacity_text,
                     opacity_slider,
+                    ft.Container(height=10),
+                    ft.Text("Fleet Rollout", weight=ft.FontWeight.BOLD),
+                    ft.Row([per_host_dd, spacing_dd]),
+                    ramp_cb,
+                    ft.Container(height=10),
+                    gear_dir_field,
                 ],
             ),
             actions=[
@@ -1448,25 +2292,15 @@ class WranglerMasterApp:
     # =========================================================================
 
     def _save_config(self):
-        config = {
-            "instances": [asdict(i) for i in self.instances],
-            "default_json_path": self.default_json_path,
-        }
-        try:
-            with open(CONFIG_DIR / CONFIG_FILENAME, "w") as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save config: {e}")
+        """Saves the configuration in the background, coalescing rapid changes."""
+        self.config_writer.save(self.instances, self.default_json_path)
 
     def _load_config(self):
         config_path = CONFIG_DIR / CONFIG_FILENAME
         if not config_path.exists():
             return
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            self.instances = [WranglerInstance(**d) for d in config.get("instances", [])]
-            self.default_json_path = config.get("default_json_path", "")
+            self.instances, self.default_json_path = load_config(config_path)
         except Exception as e:
             print(f"Failed to load config: {e}")
 
@@ -1475,10 +2309,14 @@ class WranglerMasterApp:
             "background_image": self.settings.background_image,
             "background_opacity": self.settings.background_opacity,
             "font_size": self.settings.font_size,
+            "rollout_max_per_host": self.settings.rollout_max_per_host,
+            "rollout_spacing": self.settings.rollout_spacing,
+            "rollout_ramp": self.settings.rollout_ramp,
+            "lisbeth_debug_dir": self.settings.lisbeth_debug_dir,
+            "view_mode": self.settings.view_mode,
         }
         try:
-            with open(CONFIG_DIR / SETTINGS_FILENAME, "w") as f:
-                json.dump(settings, f, indent=2)
+            write_json_atomic(CONFIG_DIR / SETTINGS_FILENAME, settings)
         except Exception as e:
             print(f"Failed to save settings: {e}")
 
@@ -1492,8 +2330,21 @@ class WranglerMasterApp:
             self.settings.background_image = data.get("background_image", "")
             self.settings.background_opacity = data.get("background_opacity", 0.3)
             self.settings.font_size = data.get("font_size", 14)
+            self.settings.rollout_max_per_host = data.get("rollout_max_per_host", ROLLOUT_MAX_PER_HOST)
+            self.settings.rollout_spacing = data.get("rollout_spacing", ROLLOUT_MIN_SPACING)
+            self.settings.rollout_ramp = data.get("rollout_ramp", True)
+            self.settings.lisbeth_debug_dir = data.get("lisbeth_debug_dir", "")
+            self.settings.view_mode = data.get("view_mode", "cards")
         except Exception as e:
             print(f"Failed to load settings: {e}")
+        self._apply_rollout_settings()
+
+    def _apply_rollout_settings(self):
+        self.throttle.configure(
+            self.settings.rollout_max_per_host,
+            self.settings.rollout_spacing,
+            self.settings.rollout_ramp,
+        )
 
 
 # =============================================================================
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Wrangler Fleet Model
+====================
+
+The data behind the instance list, kept apart from any widgets: the
+ordered rows (enabled instances), the last status of each instance and
+its order queue readout, all keyed by host:port.
+
+The frontends render it through a virtualized view that only has
+widgets for the rows on screen and rebinds them while scrolling, so
+status for instances that are scrolled away lives here and nowhere else.
+The compact table view reads the same model through table_values() and
+table_rows() (filtering and sorting).
+
+UpdateBatch collects what the background threads (polling, /events
+pushes, runs, queues, bulk actions) want to show and hands it to the UI
+thread in one flush per frame: statuses are coalesced per instance and
+only the newest status-bar message is kept, so a poll cycle over the
+whole fleet costs one UI batch (one page.update() in Flet) instead of
+one round-trip per instance.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from wrangler_core import WranglerInstance, InstanceStatus
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+FRAME_BUDGET = 0.012  # seconds of UI work per flush before yielding to the event loop
+FRAME_INTERVAL = 0.016  # seconds until the next flush when a backlog is left
+
+# Table view columns: (id, heading)
+TABLE_COLUMNS = (
+    ("name", "Name"),
+    ("address", "Address"),
+    ("state", "State"),
+    ("character", "Character"),
+    ("world", "World"),
+    ("runtime", "Runtime"),
+    ("file", "File"),
+    ("latency", "Latency"),
+)
+
+
+# =============================================================================
+# Display Text
+# =============================================================================
+
+def describe_state(status: InstanceStatus) -> Tuple[str, str]:
+    """(color key, label) for a status, e.g. ("executing", "Executing") or ("tripped", "Tripped")."""
+    if not status.reachable and status.breaker_state == "open":
+        return "tripped", "Tripped"
+    if not status.reachable and status.breaker_state == "half_open":
+        return "pending", "Probing..."
+    if not status.reachable:
+        return "unreachable", "Timed Out" if status.error == "Timeout" else "Unreachable"
+    if status.state == "executing":
+        return "executing", "Executing"
+    if status.state == "pending":
+        return "pending", "Pending"
+    if status.state == "idle":
+        return "idle", "Idle"
+    if status.state == "stopped":
+        return "stopped", "Bot Stopped"
+    return "unreachable", status.state.capitalize() if status.state else "Unknown"
+
+
+def format_runtime(seconds: int) -> str:
+    """e.g. "1h 2m 3s", "2m 3s" or "3s"."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    if minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+# =============================================================================
+# Fleet Model
+# =============================================================================
+
+class FleetModel:
+    """Rows and per-instance display state for the instance list (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows: List[WranglerInstance] = []
+        self._index: Dict[str, int] = {}
+        self._status: Dict[str, InstanceStatus] = {}
+        self._queue_text: Dict[str, str] = {}
+        self._latency: Dict[str, float] = {}  # Last polled /status round-trip, seconds
+
+    def set_instances(self, instances: Iterable[WranglerInstance]) -> bool:
+        """Replaces the rows with the enabled instances, keeping state for keys that stay.
+
+        Returns True if any row is new (it has no status to show yet).
+        """
+        rows = [instance for instance in instances if instance.enabled]
+        with self._lock:
+            added = any(instance.key not in self._index for instance in rows)
+            self._rows = rows
+            self._index = {instance.key: n for n, instance in enumerate(rows)}
+            for key in [key for key in self._status if key not in self._index]:
+                del self._status[key]
+            for key in [key for key in self._queue_text if key not in self._index]:
+                del self._queue_text[key]
+            for key in [key for key in self._latency if key not in self._index]:
+                del self._latency[key]
+            return added
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def row(self, index: int) -> WranglerInstance:
+        return self._rows[index]
+
+    def index_of(self, key: str) -> Optional[int]:
+        return self._index.get(key)
+
+    def instance(self, key: str) -> Optional[WranglerInstance]:
+        """The row's instance for a key, or None if it is not in the list."""
+        with self._lock:
+            index = self._index.get(key)
+            return self._rows[index] if index is not None else None
+
+    def status(self, key: str) -> InstanceStatus:
+        """Last status for an instance (a blank one before the first poll)."""
+        status = self._status.get(key)
+        return status if status is not None else InstanceStatus()
+
+    def set_status(self, key: str, status: InstanceStatus):
+        with self._lock:
+            if key in self._index:
+                self._status[key] = status
+
+    def statuses(self) -> Dict[str, InstanceStatus]:
+        """Last status of every row, by key (rows not yet polled are omitted)."""
+        with self._lock:
+            return dict(self._status)
+
+    def queue_text(self, key: str) -> str:
+        return self._queue_text.get(key, "")
+
+    def set_queue_text(self, key: str, text: str):
+        with self._lock:
+            if key in self._index:
+                self._queue_text[key] = text
+
+    def set_latency(self, key: str, seconds: float):
+        with self._lock:
+            if key in self._index:
+                self._latency[key] = seconds
+
+    def table_values(self, instance: WranglerInstance) -> Tuple[str, ...]:
+        """One table row's display text, in TABLE_COLUMNS order."""
+        status = self.status(instance.key)
+        known = status.reachable
+        latency = self._latency.get(instance.key)
+        return (
+            instance.name,
+            instance.key,
+            describe_state(status)[1],
+            status.character_name if known and status.character_name != "Unknown" else "",
+            status.world_name if known and status.world_name != "Unknown" else "",
+            format_runtime(status.runtime_seconds) if status.is_executing and status.runtime_seconds > 0 else "",
+            status.current_file if status.current_file and status.current_file != "None" else "",
+            f"{latency * 1000:.0f} ms" if latency is not None else "",
+        )
+
+    def table_rows(self, filter_text: str = "", sort_column: Optional[str] = None,
+                   descending: bool = False) -> List[WranglerInstance]:
+        """Rows matching every word of filter_text in some column (case-insensitive), sorted by a column."""
+        with self._lock:
+            rows = list(self._rows)
+        words = filter_text.lower().split()
+        if words:
+            def matches(row: WranglerInstance) -> bool:
+                text = "\n".join(self.table_values(row)).lower()
+                return all(word in text for word in words)
+            rows = [row for row in rows if matches(row)]
+        if sort_column:
+            rows.sort(key=lambda row: self._sort_key(row, sort_column), reverse=descending)
+        return rows
+
+    def _sort_key(self, instance: WranglerInstance, column: str):
+        status = self.status(instance.key)
+        if column == "runtime":
+            return status.runtime_seconds if status.is_executing else -1
+        if column == "latency":
+            return self._latency.get(instance.key, float("inf"))
+        if column == "address":
+            return (instance.host, instance.port)
+        index = [column_id for column_id, _ in TABLE_COLUMNS].index(column)
+        return self.table_values(instance)[index].lower()
+
+
+# =============================================================================
+# UI Update Batching
+# =============================================================================
+
+class UpdateBatch:
+    """Statuses and status-bar text waiting for the next UI flush (thread-safe).
+
+    Any thread may put(); it returns True when the caller has to schedule
+    a flush on the UI thread (nothing was waiting, or the last flush has
+    finished). Until then further puts just join the batch. A newer status
+    replaces a waiting one for the same instance, except that a 304 never
+    replaces a real status that has not been drawn yet.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statuses: Dict[str, Tuple[WranglerInstance, InstanceStatus, bool]] = {}
+        self._message: Optional[str] = None
+        self._scheduled = False
+        self.flushes = 0  # UI batches run
+        self.applied = 0  # statuses handed to the UI
+        self.coalesced = 0  # statuses replaced before the UI saw them
+
+    def _schedule_locked(self) -> bool:
+        if self._scheduled:
+            return False
+        self._scheduled = True
+        return True
+
+    def _put_locked(self, instance: WranglerInstance, status: InstanceStatus, pushed: bool):
+        waiting = self._statuses.get(instance.key)
+        if waiting is not None:
+            self.coalesced += 1
+            if status.not_modified and not waiting[1].not_modified:
+                return
+        self._statuses[instance.key] = (instance, status, pushed)
+
+    def put(self, instance: WranglerInstance, status: InstanceStatus, pushed: bool = False) -> bool:
+        with self._lock:
+            self._put_locked(instance, status, pushed)
+            return self._schedule_locked()
+
+    def put_many(self, instances: Iterable[WranglerInstance], snapshot: Dict[str, InstanceStatus]) -> bool:
+        """Adds one poll cycle's results (instances missing from snapshot are skipped)."""
+        with self._lock:
+            added = False
+            for instance in instances:
+                status = snapshot.get(instance.key)
+                if status is not None:
+                    self._put_locked(instance, status, False)
+                    added = True
+            return added and self._schedule_locked()
+
+    def put_message(self, message: str) -> bool:
+        with self._lock:
+            self._message = message
+            return self._schedule_locked()
+
+    def drain(self, apply: Callable[[WranglerInstance, InstanceStatus, bool], None],
+              budget: float = FRAME_BUDGET) -> Tuple[Optional[str], bool]:
+        """Applies waiting statuses on the UI thread until none are left or budget runs out.
+
+        Returns (newest message or None, more). When more is True the batch
+        stays scheduled and the caller flushes again after FRAME_INTERVAL;
+        otherwise the next put() asks for a new flush.
+        """
+        deadline = time.perf_counter() + budget
+        applied = 0
+        while True:
+            with self._lock:
+                more = bool(self._statuses)
+                if not more or (applied and time.perf_counter() >= deadline):
+                    message, self._message = self._message, None
+                    self._scheduled = more
+                    self.flushes += 1
+                    self.applied += applied
+                    return message, more
+                key = next(iter(self._statuses))
+                instance, status, pushed = self._statuses.pop(key)
+            apply(instance, status, pushed)
+            applied += 1
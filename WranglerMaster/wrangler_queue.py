@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Wrangler Order Queues
+=====================
+
+A persistent queue of order JSON files per instance. The queue lives in
+the instance's entry in wrangler_config.json (order_queue / queue_paused),
+so it survives restarts.
+
+The master feeds every status it receives (polled or pushed) to
+OrderQueueManager.on_status(). As soon as an instance reports "idle" with
+no pending or incomplete orders, the next file is sent with /run, so the
+idle gap is at most one poll interval or push event.
+
+An order that ends with incomplete orders (stopped by hand, crashed) holds
+the queue until the instance is resumed and finishes or the incomplete
+orders are cleared. A failed /run puts the file back and pauses the queue.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable
+
+from wrangler_core import WranglerClient, WranglerInstance, InstanceStatus, StartThrottle
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+QUEUE_RATE_WINDOW = 3600.0  # completions counted for the orders/hour readout
+
+
+class OrderQueueManager:
+    """Dispatches queued order files to instances as they go idle.
+
+    on_message receives status-bar style messages, on_change(instance) is
+    called after a queue is modified (save the config, redraw the panel)
+    and poll_soon(key) after an order is sent, so the caller can fetch a
+    fresh status; all may be called from any thread.
+    """
+
+    def __init__(self, client: WranglerClient,
+                 on_message: Callable[[str], None] = None,
+                 on_change: Callable[[WranglerInstance], None] = None,
+                 throttle: StartThrottle = None,
+                 poll_soon: Callable[[str], None] = None):
+        self.client = client
+        self.on_message = on_message or (lambda message: None)
+        self.on_change = on_change or (lambda instance: None)
+        self.throttle = throttle
+        self.poll_soon = poll_soon or (lambda key: None)
+        self._lock = threading.Lock()
+        self._active: Dict[str, dict] = {}  # key -> order sent by the queue and not yet finished
+        self._completions: Dict[str, deque] = {}  # key -> completion timestamps
+        self._first_dispatch: Dict[str, float] = {}
+
+    # =========================================================================
+    # Editing
+    # =========================================================================
+
+    def add(self, instance: WranglerInstance, paths: Iterable[str]):
+        """Appends order files to the end of an instance's queue."""
+        with self._lock:
+            instance.order_queue.extend(paths)
+        self.on_change(instance)
+
+    def remove(self, instance: WranglerInstance, index: int):
+        with self._lock:
+            if 0 <= index < len(instance.order_queue):
+                del instance.order_queue[index]
+        self.on_change(instance)
+
+    def move(self, instance: WranglerInstance, index: int, offset: int) -> int:
+        """Moves a queued file up (offset < 0) or down; returns its new index."""
+        with self._lock:
+            queue = instance.order_queue
+            if not 0 <= index < len(queue):
+                return index
+            target = max(0, min(len(queue) - 1, index + offset))
+            queue.insert(target, queue.pop(index))
+        self.on_change(instance)
+        return target
+
+    def clear(self, instance: WranglerInstance):
+        with self._lock:
+            instance.order_queue.clear()
+        self.on_change(instance)
+
+    def set_paused(self, instance: WranglerInstance, paused: bool):
+        """Pauses or resumes dispatching; the order already running is not touched."""
+        with self._lock:
+            instance.queue_paused = paused
+        self.on_change(instance)
+
+    def forget(self, key: str):
+        """Drops runtime state for a removed instance."""
+        with self._lock:
+            self._active.pop(key, None)
+            self._completions.pop(key, None)
+            self._first_dispatch.pop(key, None)
+
+    # =========================================================================
+    # Readout
+    # =========================================================================
+
+    def running(self, key: str) -> str:
+        """Returns the queued file currently running on an instance, or ""."""
+        with self._lock:
+            active = self._active.get(key)
+            return active["path"] if active else ""
+
+    def orders_per_hour(self, key: str) -> float:
+        """Orders completed per hour over the last QUEUE_RATE_WINDOW (or since the first dispatch)."""
+        now = time.time()
+        with self._lock:
+            completions = self._completions.get(key)
+            first = self._first_dispatch.get(key)
+            if not completions or first is None:
+                return 0.0
+            while completions and completions[0] < now - QUEUE_RATE_WINDOW:
+                completions.popleft()
+            span = max(60.0, min(now - first, QUEUE_RATE_WINDOW))
+            return len(completions) * 3600.0 / span
+
+    def summary(self, instance: WranglerInstance) -> str:
+        """Short panel text, e.g. "Queue: 3 (paused) | 2.4 orders/h"; "" when unused."""
+        queued = len(instance.order_queue)
+        rate = self.orders_per_hour(instance.key)
+        if not queued and not rate and not self.running(instance.key):
+            return ""
+        text = f"Queue: {queued}"
+        if instance.queue_paused:
+            text += " (paused)"
+        return f"{text} | {rate:.1f} orders/h"
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    def on_status(self, instance: WranglerInstance, status: InstanceStatus):
+        """Notes finished orders and dispatches the next file when the instance is idle."""
+        if not status.reachable:
+            return
+
+        key = instance.key
+        finished = None
+        with self._lock:
+            active = self._active.get(key)
+            if active:
+                if status.is_executing or status.state == "pending" or status.has_pending_order:
+                    return
+                if active["sent"] is None or status.fetched_at < active["sent"]:
+                    return  # Waiting for a start slot, or a status requested before /run was accepted
+                del self._active[key]
+                finished = active
+                if not status.has_incomplete_orders:
+                    self._completions.setdefault(key, deque()).append(time.time())
+
+            path = None
+            if (instance.order_queue and not instance.queue_paused
+                    and status.state == "idle"
+                    and not status.has_pending_order and not status.has_incomplete_orders):
+                path = instance.order_queue.pop(0)
+                self._active[key] = {"path": path, "sent": None}
+                self._first_dispatch.setdefault(key, time.time())
+
+        if finished:
+            if status.has_incomplete_orders:
+                self.on_message(f"{instance.name}: Order stopped with incomplete orders - queue held")
+            else:
+                self.on_message(f"{instance.name}: Finished {_basename(finished['path'])}")
+        if path:
+            threading.Thread(target=self._dispatch, args=(instance, path), daemon=True).start()
+            self.on_change(instance)
+        elif finished:
+            self.on_change(instance)
+
+    def _dispatch(self, instance: WranglerInstance, path: str):
+        def command(inst: WranglerInstance):
+            return self.client.run_order(inst, json_path=path)
+
+        if self.throttle:
+            success, message = self.throttle.start(instance, command)
+        else:
+            success, message = command(instance)
+
+        if success:
+            with self._lock:
+                active = self._active.get(instance.key)
+                if active and active["path"] == path:
+                    active["sent"] = time.monotonic()
+            self.on_message(f"{instance.name}: Started {_basename(path)} from queue")
+            self.poll_soon(instance.key)
+            return
+
+        with self._lock:
+            self._active.pop(instance.key, None)
+            instance.order_queue.insert(0, path)
+            instance.queue_paused = True
+        self.on_message(f"{instance.name}: Queue paused - {_basename(path)} failed: {message}")
+        self.on_change(instance)
+
+
+def _basename(path: str) -> str:
+    return path.replace("\\", "/").rsplit("/", 1)[-1]
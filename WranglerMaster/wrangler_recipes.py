@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Wrangler Recipe Data
+====================
+
+Read-only access to the game data shipped in the repository's Data
+folder (Data/recipes.csv), used to estimate how much work an order is.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import csv
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RECIPES_FILENAME = "recipes.csv"
+MAX_INGREDIENTS = 10  # ing1_* ... ingN_* columns probed in recipes.csv
+
+
+@dataclass
+class Recipe:
+    """One crafting recipe from recipes.csv."""
+    recipe_id: int
+    job: str  # Short job name, e.g. "CRP"
+    item_id: int
+    item_name: str
+    recipe_level: int
+    max_durability: int
+    max_progress: int
+    req_craftsmanship: int = 0
+    req_control: int = 0
+    ingredients: List[Tuple[int, int]] = field(default_factory=list)  # (item_id, amount)
+
+
+def find_data_file(name: str, base_dir: Optional[Path] = None) -> Optional[Path]:
+    """Looks for Data/<name> next to the master, then in the repository root."""
+    if base_dir is None:
+        base_dir = Path(sys.executable if getattr(sys, 'frozen', False) else __file__).resolve().parent
+    for candidate in (base_dir / "Data" / name, base_dir.parent / "Data" / name):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _int(value: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def load_recipes(path) -> Dict[int, Recipe]:
+    """Reads recipes.csv into {item_id: Recipe}; the first recipe for an item wins."""
+    recipes: Dict[int, Recipe] = {}
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            item_id = _int(row.get("item_id"))
+            if not item_id or item_id in recipes:
+                continue
+
+            ingredients = []
+            for n in range(1, MAX_INGREDIENTS + 1):
+                ingredient = _int(row.get(f"ing{n}_id"))
+                if ingredient:
+                    ingredients.append((ingredient, _int(row.get(f"ing{n}_amount")) or 1))
+
+            recipes[item_id] = Recipe(
+                recipe_id=_int(row.get("recipe_id")),
+                job=row.get("job_name", ""),
+                item_id=item_id,
+                item_name=row.get("item_name", ""),
+                recipe_level=_int(row.get("recipe_level")),
+                max_durability=_int(row.get("max_durability")),
+                max_progress=_int(row.get("max_progress")),
+                req_craftsmanship=_int(row.get("req_craftsmanship")),
+                req_control=_int(row.get("req_control")),
+                ingredients=ingredients,
+            )
+    return recipes
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Wrangler Advanced Runs
+======================
+
+Timer and schedule run modes, shared by the GUI frontends and the
+headless daemon (wrangler_cli.py).
+
+- none:     run or resume once, immediately
+- timer:    run or resume now, stop gently when the timer expires
+- schedule: run or resume inside the schedule's windows (see
+            wrangler_schedule), stop gently outside them
+
+Every timer expiry and schedule transition is a deadline in one
+DeadlineScheduler, so nothing polls and thread count does not grow with
+the number of instances.
+
+With a RunJournal attached, activations, transitions and completions are
+journaled, and recover() restores them after a restart: schedules resume
+and timers that expired while the master was down are stopped.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from dataclasses import asdict, fields
+from typing import Callable, Dict, List
+
+from wrangler_core import (
+    AdvancedRunConfig, WranglerClient, WranglerInstance, InstanceStatus, DeadlineScheduler,
+    StartThrottle,
+)
+from wrangler_journal import RunJournal
+from wrangler_schedule import Schedule
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SCHEDULE_RETRY_DELAY = 60.0  # seconds before re-checking a schedule whose instance was unreachable
+SCHEDULE_IDLE_RECHECK = 7 * 86400.0  # wake-up for schedules with no upcoming transition
+
+
+class AdvancedRunManager:
+    """Tracks active timers and schedules and sends the commands they call for.
+
+    Timer expiries and schedule transitions are scheduled as deadlines, so
+    commands go out on time rather than at the next periodic check. Commands
+    run on short-lived background threads. on_message receives status-bar
+    style messages and on_status the status fetched after each command;
+    both may be called from any thread. With a StartThrottle, run and
+    resume commands wait their turn on the instance's host, so schedules
+    that open together still start one client at a time.
+
+    on_transition receives (key, "timer" or "schedule", event) for each
+    timer started / expired / restored / cancelled and schedule activated /
+    started / stopped / cancelled, e.g. for TelemetryStore.record_transition.
+    """
+
+    def __init__(self, client: WranglerClient,
+                 get_json_path: Callable[[], str],
+                 on_message: Callable[[str], None] = None,
+                 on_status: Callable[[WranglerInstance, InstanceStatus], None] = None,
+                 journal: RunJournal = None,
+                 throttle: StartThrottle = None,
+                 on_transition: Callable[[str, str, str], None] = None):
+        self.client = client
+        self.get_json_path = get_json_path
+        self.on_message = on_message or (lambda message: None)
+        self.on_status = on_status or (lambda instance, status: None)
+        self.on_transition = on_transition or (lambda key, kind, event: None)
+        self.journal = journal
+        self.throttle = throttle
+        self.active_timers: Dict[str, dict] = {}
+        self.active_schedules: Dict[str, dict] = {}
+        self.deadlines = DeadlineScheduler()
+        self._lock = threading.Lock()
+
+    def start(self, instance: WranglerInstance, config: AdvancedRunConfig):
+        """Starts an instance in the mode selected by its config."""
+        if config.mode == "timer":
+            self.start_timer(instance, config)
+        elif config.mode == "schedule":
+            self.start_schedule(instance, config)
+        else:
+            self.start_now(instance, config)
+
+    def cancel(self, key: str):
+        """Drops any timer or schedule for an instance (e.g. when it is removed)."""
+        with self._lock:
+            had_timer = self.active_timers.pop(key, None) is not None
+            had_schedule = self.active_schedules.pop(key, None) is not None
+        self.deadlines.cancel(f"timer:{key}")
+        self.deadlines.cancel(f"schedule:{key}")
+        self._journal("done", f"timer:{key}")
+        self._journal("done", f"schedule:{key}")
+        if had_timer:
+            self.on_transition(key, "timer", "cancelled")
+        if had_schedule:
+            self.on_transition(key, "schedule", "cancelled")
+
+    def is_active(self, key: str) -> bool:
+        """Returns True if the instance has a timer or schedule running."""
+        with self._lock:
+            return key in self.active_timers or key in self.active_schedules
+
+    def shutdown(self):
+        """Stops the deadline thread and closes the journal.
+
+        Journal entries stay live, so the next start can recover them.
+        """
+        self.deadlines.stop()
+        if self.journal:
+            self.journal.close()
+
+    def _journal(self, method: str, *args, **kwargs):
+        """Writes a journal record; a failed write is reported but never stops a run."""
+        if self.journal is None:
+            return
+        try:
+            getattr(self.journal, method)(*args, **kwargs)
+        except OSError as e:
+            self.on_message(f"Run journal write failed: {e}")
+
+    # =========================================================================
+    # Commands
+    # =========================================================================
+
+    def _run(self, instance: WranglerInstance, use_resume: bool) -> tuple[bool, str]:
+        def command(inst: WranglerInstance):
+            if use_resume:
+                return self.client.resume_orders(inst)
+            return self.client.run_order(inst, json_path=self.get_json_path())
+
+        if self.throttle:
+            return self.throttle.start(instance, command)
+        return command(instance)
+
+    def _refresh(self, instance: WranglerInstance, delay: float):
+        time.sleep(delay)
+        self.on_status(instance, self.client.get_status(instance))
+
+    def _stop(self, instance: WranglerInstance, message: str):
+        """Stops gently, then sends the instance home if configured."""
+        self.client.stop_gently(instance)
+        self.on_message(message)
+        self._refresh(instance, 2)
+
+        if instance.go_home_after_session:
+            time.sleep(3)
+            success, _ = self.client.go_home(instance)
+            self.on_message(
+                f"{instance.name}: Going home..." if success else f"{instance.name}: Go home failed"
+            )
+
+    @staticmethod
+    def _spawn(target, *args):
+        threading.Thread(target=target, args=args, daemon=True).start()
+
+    # =========================================================================
+    # Modes
+    # =========================================================================
+
+    def start_now(self, instance: WranglerInstance, config: AdvancedRunConfig):
+        """Starts none mode - runs or resumes immediately."""
+        action = "Resuming" if config.use_resume else "Starting"
+        self.on_message(f"{instance.name}: {action}...")
+
+        def do_run():
+            success, message = self._run(instance, config.use_resume)
+            action_past = "Resumed" if config.use_resume else "Started"
+            self.on_message(
+                f"{instance.name}: {action_past}" if success else f"{instance.name} failed: {message}"
+            )
+            self._refresh(instance, 1)
+
+        self._spawn(do_run)
+
+    def start_timer(self, instance: WranglerInstance, config: AdvancedRunConfig):
+        """Starts timer mode for an instance."""
+        duration_seconds = config.timer_hours * 3600 + config.timer_minutes * 60
+        if duration_seconds <= 0:
+            self.on_message(f"{instance.name}: Invalid timer duration")
+            return
+
+        key = instance.key
+        end_time = datetime.now() + timedelta(seconds=duration_seconds)
+        self._arm_timer(instance, end_time)
+        self._journal("start", f"timer:{key}", key, end=end_time.timestamp())
+        self.on_transition(key, "timer", "started")
+
+        action = "Resuming" if config.use_resume else "Starting"
+        self.on_message(f"{instance.name}: Timer started ({config.timer_hours}h {config.timer_minutes}m)")
+
+        def do_run():
+            success, message = self._run(instance, config.use_resume)
+            self.on_message(
+                f"{instance.name}: {action} (timer mode)" if success else f"{instance.name} failed: {message}"
+            )
+            self._refresh(instance, 1)
+
+        self._spawn(do_run)
+
+    def start_schedule(self, instance: WranglerInstance, config: AdvancedRunConfig,
+                       last_action: str = None):
+        """Starts schedule mode for an instance."""
+        try:
+            schedule = Schedule.from_config(config)
+        except ValueError as e:
+            self.on_message(f"{instance.name}: Invalid schedule: {e}")
+            return
+
+        with self._lock:
+            self.active_schedules[instance.key] = {
+                "config": config,
+                "schedule": schedule,
+                "instance": instance,
+                "last_action": last_action
+            }
+        self._journal("start", f"schedule:{instance.key}", instance.key,
+                      config=asdict(config), last_action=last_action)
+        self.on_transition(instance.key, "schedule", "activated")
+
+        mode_desc = "resume" if config.use_resume else "run"
+        self.on_message(f"{instance.name}: Schedule activated ({mode_desc}) ({schedule.describe()})")
+
+        self._spawn(self.check_schedule, instance.key)
+
+    # =========================================================================
+    # Deadlines
+    # =========================================================================
+
+    def _arm_timer(self, instance: WranglerInstance, end_time: datetime, recovered: bool = False):
+        key = instance.key
+        with self._lock:
+            self.active_timers[key] = {
+                "end_time": end_time,
+                "instance": instance,
+                "recovered": recovered
+            }
+        self.deadlines.schedule(f"timer:{key}", end_time.timestamp(), lambda: self._on_timer_expired(key))
+
+    def _on_timer_expired(self, key: str):
+        with self._lock:
+            timer_data = self.active_timers.pop(key, None)
+        if not timer_data:
+            return
+
+        instance = timer_data["instance"]
+        if timer_data["recovered"]:
+            self._spawn(self._stop_recovered_timer, instance, timer_data)
+            return
+
+        self._journal("done", f"timer:{key}")
+        self.on_transition(key, "timer", "expired")
+        self._spawn(self._stop, instance, f"{instance.name}: Timer expired, stopping...")
+
+    def _stop_recovered_timer(self, instance: WranglerInstance, timer_data: dict):
+        """Stops a journaled timer only if the instance is still running its order."""
+        key = instance.key
+        status = self.client.get_status(instance)
+        if not status.reachable:
+            # Keep the journal entry and try again shortly
+            with self._lock:
+                if key in self.active_timers:
+                    return  # Replaced by a new timer meanwhile
+                self.active_timers[key] = timer_data
+            self.deadlines.schedule(f"timer:{key}", time.time() + SCHEDULE_RETRY_DELAY,
+                                    lambda: self._on_timer_expired(key))
+            return
+
+        self._journal("done", f"timer:{key}")
+        self.on_transition(key, "timer", "expired")
+        if status.is_executing:
+            self._stop(instance, f"{instance.name}: Timer expired while the master was closed, stopping...")
+        else:
+            self.on_status(instance, status)
+
+    def check_schedule(self, key: str):
+        """Starts or stops a scheduled instance to match its window, then arms the next check."""
+        with self._lock:
+            schedule_data = self.active_schedules.get(key)
+        if schedule_data is None:
+            return
+
+        config = schedule_data["config"]
+        schedule = schedule_data["schedule"]
+        instance = schedule_data["instance"]
+        last_action = schedule_data["last_action"]
+
+        now = time.time()
+        in_window = schedule.is_active(now)
+        status = self.client.get_status(instance)
+
+        if in_window:
+            if last_action != "started" and not status.is_executing and status.reachable:
+                schedule_data["last_action"] = "started"
+                self._journal("action", f"schedule:{key}", "started")
+                self.on_transition(key, "schedule", "started")
+
+                def do_start():
+                    success, message = self._run(instance, config.use_resume)
+                    action = "Resumed" if config.use_resume else "Started"
+                    self.on_message(
+                        f"{instance.name}: {action} (schedule)" if success else f"{instance.name} failed: {message}"
+                    )
+                    self._refresh(instance, 1)
+
+                self._spawn(do_start)
+        else:
+            if last_action != "stopped" and status.is_executing:
+                schedule_data["last_action"] = "stopped"
+                self._journal("action", f"schedule:{key}", "stopped")
+                self.on_transition(key, "schedule", "stopped")
+                self._spawn(self._stop, instance, f"{instance.name}: Stopped (schedule)")
+
+        # Wake at the next transition, or sooner if the instance could not be reached
+        when = schedule.next_transition(now) or now + SCHEDULE_IDLE_RECHECK
+        if not status.reachable:
+            when = min(when, time.time() + SCHEDULE_RETRY_DELAY)
+
+        with self._lock:
+            if self.active_schedules.get(key) is not schedule_data:
+                return  # Cancelled or replaced while we were checking
+        self.deadlines.schedule(f"schedule:{key}", when, lambda: self._spawn(self.check_schedule, key))
+
+    # =========================================================================
+    # Recovery
+    # =========================================================================
+
+    def recover(self, instances: List[WranglerInstance]) -> List[str]:
+        """Restores the journaled timers and schedules of `instances` after a restart.
+
+        Timers still running are re-armed without sending another run
+        command; timers that expired while the master was down fire at
+        once, and stop the instance only if /status shows it still
+        executing. Schedules resume with their last action, so the first
+        check stops an instance that is running outside its window.
+        Returns the keys that were restored.
+        """
+        if self.journal is None:
+            return []
+
+        by_key = {instance.key: instance for instance in instances}
+        config_fields = {f.name for f in fields(AdvancedRunConfig)}
+        restored = []
+
+        for entry_id, record in self.journal.entries().items():
+            instance = by_key.get(record.get("key"))
+            if instance is None:
+                self._journal("done", entry_id)  # Instance was removed while we were down
+                continue
+
+            if entry_id.startswith("timer:"):
+                end_time = datetime.fromtimestamp(record["end"])
+                self._arm_timer(instance, end_time, recovered=True)
+                self.on_transition(instance.key, "timer", "restored")
+                if end_time > datetime.now():
+                    self.on_message(f"{instance.name}: Timer restored (ends {end_time:%H:%M})")
+            elif entry_id.startswith("schedule:"):
+                saved = {k: v for k, v in record.get("config", {}).items() if k in config_fields}
+                self.start_schedule(instance, AdvancedRunConfig(**saved), record.get("last_action"))
+            else:
+                continue
+            restored.append(instance.key)
+
+        return restored
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Wrangler Schedules
+==================
+
+Weekly run schedules made of one or more daily windows.
+
+- Each window has a start and end time of day; an end at or before the
+  start crosses midnight (22:00-02:00 runs four hours)
+- Each window has a day-of-week mask for the days it *starts* on
+- Times are local, in an IANA time zone, or in Eorzea time (where one
+  Eorzean day lasts 70 real minutes and day masks do not apply)
+
+Window text syntax, windows separated by ";":
+    "08:00-22:00"                 every day
+    "Mon-Fri 08:00-17:30"         weekdays
+    "Sat,Sun 22:00-02:00"         weekend nights, crossing midnight
+
+Schedule.next_transition() computes the next start or stop instant
+directly from the window definitions, so callers can sleep until then
+instead of re-checking every minute.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+from typing import List, Optional, Tuple
+
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+    ZoneInfoNotFoundError = KeyError
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+ALL_DAYS = 0x7F  # bit 0 = Monday ... bit 6 = Sunday
+EORZEA_RATIO = 3600 / 175  # Eorzea seconds per real second (one Eorzean hour = 175 s)
+MINUTES_PER_DAY = 24 * 60
+
+
+# =============================================================================
+# Windows
+# =============================================================================
+
+@dataclass
+class ScheduleWindow:
+    """A daily run window; times are minutes after midnight."""
+    start: int
+    end: int
+    days: int = ALL_DAYS
+
+    @property
+    def length(self) -> int:
+        """Window length in minutes (windows ending at or before their start cross midnight)."""
+        return (self.end - self.start) % MINUTES_PER_DAY
+
+
+def parse_days(text: str) -> int:
+    """Parses "Mon-Fri,Sun" into a day mask; an empty string means every day."""
+    text = text.strip()
+    if not text:
+        return ALL_DAYS
+
+    lookup = {name.lower(): index for index, name in enumerate(DAY_NAMES)}
+    mask = 0
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                first, last = (lookup[p[:3].lower()] for p in part.split("-", 1))
+                index = first
+                while True:
+                    mask |= 1 << index
+                    if index == last:
+                        break
+                    index = (index + 1) % 7
+            else:
+                mask |= 1 << lookup[part[:3].lower()]
+        except KeyError:
+            raise ValueError(f"Unknown day in '{part}' (use Mon, Tue, ... Sun)")
+    return mask
+
+
+def format_days(mask: int) -> str:
+    """Formats a day mask as "Mon-Fri,Sun"; every day formats as ""."""
+    if mask & ALL_DAYS == ALL_DAYS:
+        return ""
+
+    parts = []
+    index = 0
+    while index < 7:
+        if mask & (1 << index):
+            end = index
+            while end + 1 < 7 and mask & (1 << (end + 1)):
+                end += 1
+            parts.append(DAY_NAMES[index] if end == index else f"{DAY_NAMES[index]}-{DAY_NAMES[end]}")
+            index = end + 1
+        else:
+            index += 1
+    return ",".join(parts)
+
+
+def _parse_time(text: str) -> int:
+    hour, _, minute = text.partition(":")
+    hour, minute = int(hour), int(minute or 0)
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid time '{text}'")
+    return hour * 60 + minute
+
+
+def parse_windows(text: str) -> List[ScheduleWindow]:
+    """Parses "Mon-Fri 08:00-22:00; 23:00-01:00" into windows."""
+    windows = []
+    for spec in text.split(";"):
+        spec = spec.strip()
+        if not spec:
+            continue
+        days_text, _, times = spec.rpartition(" ")
+        try:
+            start_text, end_text = times.split("-")
+            start, end = _parse_time(start_text), _parse_time(end_text)
+        except ValueError:
+            raise ValueError(f"Invalid window '{spec}' (expected e.g. 'Mon-Fri 08:00-22:00')")
+        windows.append(ScheduleWindow(start, end, parse_days(days_text)))
+    return windows
+
+
+def format_window(window: ScheduleWindow) -> str:
+    """Formats a window in the text syntax."""
+    times = (f"{window.start // 60:02d}:{window.start % 60:02d}-"
+             f"{window.end // 60:02d}:{window.end % 60:02d}")
+    days = format_days(window.days)
+    return f"{days} {times}" if days else times
+
+
+# =============================================================================
+# Schedule
+# =============================================================================
+
+class Schedule:
+    """A set of windows in one clock (local, a time zone, or Eorzea time)."""
+
+    def __init__(self, windows: List[ScheduleWindow], timezone: str = "", eorzea: bool = False):
+        self.windows = [w for w in windows if w.days & ALL_DAYS and w.start != w.end]
+        self.timezone = timezone
+        self.eorzea = eorzea
+        self._tz = None
+        if timezone and not eorzea:
+            if ZoneInfo is None:
+                raise ValueError("Time zones need Python 3.9 or newer")
+            try:
+                self._tz = ZoneInfo(timezone)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise ValueError(f"Unknown time zone '{timezone}' (on Windows: pip install tzdata)")
+
+    @classmethod
+    def from_config(cls, config) -> "Schedule":
+        """Builds a schedule from an AdvancedRunConfig; raises ValueError if it is invalid."""
+        primary = ScheduleWindow(
+            config.schedule_start_hour * 60 + config.schedule_start_minute,
+            config.schedule_end_hour * 60 + config.schedule_end_minute,
+            config.schedule_days
+        )
+        windows = [primary] + parse_windows(config.schedule_extra_windows)
+        return cls(windows, config.schedule_timezone, config.schedule_eorzea)
+
+    def describe(self) -> str:
+        """Short human-readable summary, e.g. "Mon-Fri 08:00-22:00 (Europe/London)"."""
+        text = ", ".join(format_window(w) for w in self.windows) or "no windows"
+        if self.eorzea:
+            return f"{text} ET"
+        if self.timezone:
+            return f"{text} ({self.timezone})"
+        return text
+
+    def _intervals(self, at: float) -> List[Tuple[float, float]]:
+        """Merged (start, end) timestamps of every window occurrence near `at`."""
+        intervals = []
+
+        if self.eorzea:
+            day = math.floor(at * EORZEA_RATIO / 86400)
+            for n in (day - 1, day, day + 1):
+                for w in self.windows:
+                    start = (n * 86400 + w.start * 60) / EORZEA_RATIO
+                    intervals.append((start, start + w.length * 60 / EORZEA_RATIO))
+        else:
+            today = datetime.fromtimestamp(at, self._tz).date()
+            # Yesterday's windows may still be open; a week ahead covers every day mask
+            for offset in range(-1, 8):
+                day = today + timedelta(days=offset)
+                for w in self.windows:
+                    if w.days & (1 << day.weekday()):
+                        intervals.append((self._timestamp(day, w.start),
+                                          self._timestamp(day, w.start + w.length)))
+
+        intervals.sort()
+        merged: List[Tuple[float, float]] = []
+        for start, end in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _timestamp(self, day: date, minutes: int) -> float:
+        """Timestamp of `minutes` after midnight on `day` in the schedule's zone."""
+        day = day + timedelta(days=minutes // MINUTES_PER_DAY)
+        minutes %= MINUTES_PER_DAY
+        moment = datetime(day.year, day.month, day.day, minutes // 60, minutes % 60, tzinfo=self._tz)
+        return moment.timestamp()
+
+    def is_active(self, at: Optional[float] = None) -> bool:
+        """Returns True if `at` (default: now) falls inside a window."""
+        at = time.time() if at is None else at
+        return any(start <= at < end for start, end in self._intervals(at))
+
+    def next_transition(self, at: Optional[float] = None) -> Optional[float]:
+        """Returns the timestamp of the next start or stop after `at`, or None if there is none."""
+        at = time.time() if at is None else at
+        for start, end in self._intervals(at):
+            if start > at:
+                return start
+            if end > at:
+                return end
+        return None
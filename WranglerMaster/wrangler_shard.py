@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Wrangler Order Sharding
+=======================
+
+Splits one large Lisbeth order across several instances.
+
+1. WorkEstimator gives every order line a rough cost in seconds from
+   Data/recipes.csv: crafting steps from durability, crafted intermediates
+   recursively, and gathered materials per item. Without recipe data every
+   item costs the same, so shards balance by item count.
+2. plan_shards() cuts large lines into pieces and packs them into shards
+   of roughly equal work (largest piece first onto the lightest shard).
+3. plan_placed_shards() first groups lines by which characters' gearsets
+   can craft them (see wrangler_gearsets), so every shard is limited to
+   instances that can finish it; lines nobody can craft are left out.
+4. ShardRun keeps the shards in one shared pool, largest first. Each
+   participating instance takes the next shard it is eligible for when it
+   goes idle - the most restricted first - and sends it with
+   run_order(json_content=...), so instances that finish early take the
+   remaining work (work stealing) and the run ends at roughly
+   total work / N.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import heapq
+import json
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from wrangler_core import WranglerClient, WranglerInstance, InstanceStatus, StartThrottle
+from wrangler_gearsets import CharacterGear, PlacementEngine
+from wrangler_recipes import Recipe
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+SHARDS_PER_INSTANCE = 3  # more shards than instances leaves work to steal
+MIN_SHARD_WORK = 120.0  # estimated seconds; smaller shards cost more in start-up than they save
+CRAFT_SECONDS_PER_STEP = 2.5  # one crafting action
+DURABILITY_PER_STEP = 5  # rough steps per craft = durability / this
+QUICK_SYNTH_SECONDS = 3.0  # one quick synthesis
+GATHER_SECONDS_PER_ITEM = 2.0  # gathered or bought materials
+COLLECTABLE_FACTOR = 3.0  # collectables take several rotations
+
+
+# =============================================================================
+# Estimation
+# =============================================================================
+
+class WorkEstimator:
+    """Estimates order work in seconds from recipe data (cached per item)."""
+
+    def __init__(self, recipes: Optional[Dict[int, Recipe]] = None):
+        self.recipes = recipes or {}
+        self._cache: Dict[tuple, float] = {}
+
+    def unit_cost(self, item_id: int, quick_synth: bool = False, collectable: bool = False) -> float:
+        """Seconds to produce one of an item, including its crafted intermediates."""
+        cache_key = (item_id, quick_synth, collectable)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = self._cost(item_id, quick_synth, set()) * (
+                COLLECTABLE_FACTOR if collectable else 1.0
+            )
+        return self._cache[cache_key]
+
+    def _cost(self, item_id: int, quick_synth: bool, visiting: set) -> float:
+        recipe = self.recipes.get(item_id)
+        if recipe is None or item_id in visiting:
+            return GATHER_SECONDS_PER_ITEM
+
+        visiting.add(item_id)
+        if quick_synth:
+            cost = QUICK_SYNTH_SECONDS
+        else:
+            steps = max(1, recipe.max_durability // DURABILITY_PER_STEP)
+            cost = steps * CRAFT_SECONDS_PER_STEP
+        for ingredient, amount in recipe.ingredients:
+            cost += amount * self._cost(ingredient, quick_synth, visiting)
+        visiting.discard(item_id)
+        return cost
+
+    def line_cost(self, line: dict) -> float:
+        """Seconds for a whole order line."""
+        return line_amount(line) * self.unit_cost(
+            int(line.get("Item", 0)), bool(line.get("QuickSynth")), bool(line.get("Collectable"))
+        )
+
+
+def line_amount(line: dict) -> int:
+    try:
+        return max(0, int(line.get("Amount", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def load_order(path) -> List[dict]:
+    """Reads a Lisbeth order JSON (a list of order lines); raises ValueError if it is not one."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        data = json.load(f)
+    if not isinstance(data, list) or not all(isinstance(line, dict) and "Item" in line for line in data):
+        raise ValueError("Not a Lisbeth order file (expected a list of orders with 'Item')")
+    return data
+
+
+# =============================================================================
+# Planning
+# =============================================================================
+
+@dataclass
+class Shard:
+    """A slice of an order, sent to one instance as its own order JSON."""
+    index: int
+    orders: List[dict] = field(default_factory=list)
+    work: float = 0.0  # estimated seconds
+    eligible: Optional[frozenset] = None  # instance keys whose gear can craft it; None = any
+
+    @property
+    def items(self) -> int:
+        return sum(line_amount(line) for line in self.orders)
+
+    def to_json(self) -> str:
+        return json.dumps(self.orders)
+
+
+def plan_shards(orders: Iterable[dict], shard_count: int,
+                estimator: Optional[WorkEstimator] = None) -> List[Shard]:
+    """Splits order lines into up to shard_count shards of roughly equal work.
+
+    Lines larger than one shard's share are cut by Amount; disabled lines
+    are dropped. Returns shards sorted by work, largest first.
+    """
+    estimator = estimator or WorkEstimator()
+    lines = [line for line in orders if line.get("Enabled", True) and line_amount(line) > 0]
+    costs = [(line, estimator.line_cost(line) / line_amount(line)) for line in lines]
+    total = sum(unit * line_amount(line) for line, unit in costs)
+    if not costs:
+        return []
+
+    shard_count = max(1, min(shard_count, int(total // MIN_SHARD_WORK) or 1))
+    target = total / shard_count
+
+    # Cut lines into pieces no larger than one shard's share
+    pieces = []  # (work, line index, amount)
+    for index, (line, unit) in enumerate(costs):
+        remaining = line_amount(line)
+        per_piece = max(1, math.floor(target / unit)) if unit > 0 else remaining
+        while remaining > 0:
+            take = min(per_piece, remaining)
+            pieces.append((take * unit, index, take))
+            remaining -= take
+
+    # Largest piece first onto the lightest shard
+    pieces.sort(key=lambda piece: piece[0], reverse=True)
+    loads = [(0.0, n) for n in range(shard_count)]
+    amounts: List[Dict[int, int]] = [{} for _ in range(shard_count)]
+    for work, index, take in pieces:
+        load, n = heapq.heappop(loads)
+        amounts[n][index] = amounts[n].get(index, 0) + take
+        heapq.heappush(loads, (load + work, n))
+
+    shards = []
+    for n, by_line in enumerate(amounts):
+        if not by_line:
+            continue
+        shard = Shard(n)
+        for index in sorted(by_line):
+            line, unit = costs[index]
+            shard.orders.append(dict(line, Amount=by_line[index]))
+            shard.work += unit * by_line[index]
+        shards.append(shard)
+
+    shards.sort(key=lambda shard: shard.work, reverse=True)
+    for n, shard in enumerate(shards):
+        shard.index = n + 1
+    return shards
+
+
+def plan_placed_shards(orders: Iterable[dict], shard_count: int,
+                       estimator: Optional[WorkEstimator],
+                       placement: PlacementEngine,
+                       characters: Dict[str, Optional[CharacterGear]]) -> Tuple[List[Shard], List[dict]]:
+    """Like plan_shards, but keeps every shard to the instances able to craft all of it.
+
+    characters maps each participating instance key to its gear (None if
+    unknown). Lines are grouped by the set of instances that can craft
+    them and each group gets shards in proportion to its work. Returns
+    (shards, lines no participant can craft).
+    """
+    estimator = estimator or WorkEstimator()
+    groups: Dict[Optional[frozenset], List[dict]] = {}
+    unplaceable = []
+    for line in orders:
+        if not line.get("Enabled", True) or line_amount(line) <= 0:
+            continue
+        eligible = placement.eligible(line, characters)
+        if eligible is not None and not eligible:
+            unplaceable.append(line)
+        else:
+            groups.setdefault(eligible, []).append(line)
+
+    total = sum(estimator.line_cost(line) for lines in groups.values() for line in lines) or 1.0
+    shards = []
+    for eligible, lines in groups.items():
+        share = sum(estimator.line_cost(line) for line in lines) / total
+        for shard in plan_shards(lines, max(1, round(shard_count * share)), estimator):
+            shard.eligible = eligible
+            shards.append(shard)
+
+    shards.sort(key=lambda shard: shard.work, reverse=True)
+    for n, shard in enumerate(shards):
+        shard.index = n + 1
+    return shards, unplaceable
+
+
+def describe_plan(shards: List[Shard], instance_count: int) -> str:
+    """One-line summary, e.g. "9 shards, 5000 items, ~2h 10m of work, ~26m on 5 instances"."""
+    total = sum(shard.work for shard in shards)
+    items = sum(shard.items for shard in shards)
+    wall = max(total / max(1, instance_count), max((s.work for s in shards), default=0.0))
+    return (f"{len(shards)} shards, {items} items, ~{format_duration(total)} of work, "
+            f"~{format_duration(wall)} on {instance_count} instance(s)")
+
+
+def format_duration(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m" if hours else f"{minutes}m"
+
+
+# =============================================================================
+# Dispatch
+# =============================================================================
+
+class ShardRun:
+    """Dispatches shards from a shared pool to participating instances as they go idle.
+
+    An idle instance takes the pending shard it is eligible for with the
+    fewest other eligible instances (then the largest), so restricted work
+    is not left until the end. Feed every status for the fleet to on_status(); it returns True while
+    the run owns the instance, so callers can skip other automation (such
+    as order queues) for it. An instance stopped with incomplete orders
+    keeps its shard (resume it there) and takes no more; an instance whose
+    /run fails returns its shard to the pool for the others.
+    """
+
+    def __init__(self, client: WranglerClient, shards: List[Shard],
+                 instances: Iterable[WranglerInstance],
+                 on_message: Callable[[str], None] = None,
+                 on_change: Callable[[], None] = None,
+                 throttle: StartThrottle = None,
+                 poll_soon: Callable[[str], None] = None):
+        self.client = client
+        self.participants = {instance.key for instance in instances}
+        self.on_message = on_message or (lambda message: None)
+        self.on_change = on_change or (lambda: None)
+        self.throttle = throttle
+        self.poll_soon = poll_soon or (lambda key: None)
+
+        self.total = len(shards)
+        self.total_work = sum(shard.work for shard in shards) or 1.0
+        self.pending = deque(sorted(shards, key=lambda shard: shard.work, reverse=True))
+        self.active: Dict[str, dict] = {}  # key -> {"shard", "sent"}
+        self.done: List[Shard] = []
+        self.held: Dict[str, Shard] = {}  # key -> shard stopped with incomplete orders
+        self.failed = set()
+        self.cancelled = False
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Asks for a fresh status from every participant so idle ones start at once."""
+        for key in self.participants:
+            self.poll_soon(key)
+
+    def cancel(self):
+        """Stops handing out shards; shards already running finish normally."""
+        with self._lock:
+            self.cancelled = True
+            self.pending.clear()
+        self.on_change()
+
+    @property
+    def finished(self) -> bool:
+        with self._lock:
+            return self._finished_locked()
+
+    def _finished_locked(self) -> bool:
+        """Nothing running and nothing left that a usable participant could take."""
+        if self.active:
+            return False
+        usable = self.participants - set(self.held) - self.failed
+        return not any(shard.eligible is None or shard.eligible & usable for shard in self.pending)
+
+    def _take_locked(self, key: str) -> Optional[Shard]:
+        """Removes and returns the best pending shard for an instance, if any."""
+        best = None
+        for shard in self.pending:
+            if shard.eligible is not None and key not in shard.eligible:
+                continue
+            rank = (len(shard.eligible) if shard.eligible is not None else len(self.participants), -shard.work)
+            if best is None or rank < best[0]:
+                best = (rank, shard)
+        if best is None:
+            return None
+        self.pending.remove(best[1])
+        return best[1]
+
+    def progress(self) -> str:
+        with self._lock:
+            done_work = sum(shard.work for shard in self.done)
+            text = (f"Shards: {len(self.done)}/{self.total} done, {len(self.active)} running, "
+                    f"{len(self.pending)} waiting ({done_work * 100 / self.total_work:.0f}% of work)")
+            if self.held:
+                text += f", {len(self.held)} stopped with incomplete orders"
+            if self.pending and self._finished_locked():
+                text += f", {len(self.pending)} with no instance left to run them"
+            return text
+
+    def on_status(self, instance: WranglerInstance, status: InstanceStatus) -> bool:
+        """Notes finished shards and hands the next one to an idle participant."""
+        key = instance.key
+        if key not in self.participants:
+            return False
+
+        finished = None
+        shard = None
+        with self._lock:
+            if self._finished_locked():
+                return False  # Run is over - the instance is free again
+            if not status.reachable:
+                return True
+
+            active = self.active.get(key)
+            if active:
+                if status.is_executing or status.state == "pending" or status.has_pending_order:
+                    return True
+                if active["sent"] is None or status.fetched_at < active["sent"]:
+                    return True  # Waiting for a start slot, or a status from before /run
+                del self.active[key]
+                finished = active["shard"]
+                if status.has_incomplete_orders:
+                    self.held[key] = finished
+                else:
+                    self.done.append(finished)
+
+            if (self.pending and key not in self.held and key not in self.failed
+                    and status.state == "idle"
+                    and not status.has_pending_order and not status.has_incomplete_orders):
+                shard = self._take_locked(key)
+                if shard:
+                    self.active[key] = {"shard": shard, "sent": None}
+
+            run_over = self._finished_locked()
+
+        if finished:
+            if key in self.held:
+                self.on_message(f"{instance.name}: Shard {finished.index} stopped with incomplete orders")
+            else:
+                self.on_message(f"{instance.name}: Shard {finished.index} done - {self.progress()}")
+        if shard:
+            threading.Thread(target=self._dispatch, args=(instance, shard), daemon=True).start()
+        if run_over and finished:
+            elapsed = format_duration(time.time() - self.started_at)
+            self.on_message(f"Shard run finished in {elapsed}: {self.progress()}")
+        if finished or shard:
+            self.on_change()
+        return True
+
+    def _dispatch(self, instance: WranglerInstance, shard: Shard):
+        content = shard.to_json()
+
+        def command(inst: WranglerInstance):
+            return self.client.run_order(inst, json_content=content)
+
+        if self.throttle:
+            success, message = self.throttle.start(instance, command)
+        else:
+            success, message = command(instance)
+
+        with self._lock:
+            if success:
+                active = self.active.get(instance.key)
+                if active and active["shard"] is shard:
+                    active["sent"] = time.monotonic()
+            else:
+                self.active.pop(instance.key, None)
+                self.failed.add(instance.key)
+                if not self.cancelled:
+                    self.pending.appendleft(shard)
+
+        if success:
+            self.on_message(f"{instance.name}: Started shard {shard.index} ({shard.items} items)")
+            self.poll_soon(instance.key)
+        else:
+            self.on_message(f"{instance.name}: Shard {shard.index} failed ({message}) - returned to the pool")
+            self.on_change()
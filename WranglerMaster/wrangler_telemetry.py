@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Wrangler Telemetry
+==================
+
+Keeps the fleet's past in a local SQLite database (next to
+wrangler_config.json) so questions like "uptime per character last
+week" or "how often did Frog Giraffe go unreachable" can be answered.
+
+Recorded:
+- every polled or pushed status (polls)
+- state changes, lost / regained reachability, every command sent with
+  its outcome and latency, and timer / schedule transitions (events)
+
+record_*() only queue a row and return; a writer thread inserts the
+queue in one transaction per FLUSH_INTERVAL (or FLUSH_BATCH rows), with
+the database in WAL mode so reports never block the writer.
+
+Raw polls are rolled up into 1-minute buckets, and those into 1-hour
+buckets, once every MAINTENANCE_INTERVAL. A bucket holds per instance
+and character the seconds observed, reachable and executing - each poll
+counts for the time until the next poll of its instance (its last poll
+until the end of the polls read), capped at MAX_SAMPLE_SPAN, so fast
+polling while executing does not skew the numbers - and the poll
+latency. Raw polls are dropped after
+RAW_RETENTION, minute buckets after MINUTE_RETENTION; a year of hourly
+buckets is about 9000 rows per character.
+
+Queries read the hourly buckets for whole hours and minute buckets for
+the ragged ends, so a report over a week touches a few hundred rows per
+character. Buckets lag real time by MAX_SAMPLE_SPAN.
+
+Nothing in this module may import a GUI toolkit.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from wrangler_core import InstanceStatus
+from wrangler_history import STATES
+from wrangler_model import describe_state
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+TELEMETRY_FILENAME = "wrangler_telemetry.db"
+FLUSH_INTERVAL = 1.0  # seconds between batched inserts
+FLUSH_BATCH = 1000  # queued rows that trigger an insert before FLUSH_INTERVAL
+MAINTENANCE_INTERVAL = 60.0  # seconds between rollup and retention passes
+MAX_SAMPLE_SPAN = 180.0  # longest a poll counts for (above the 120 s unreachable backoff)
+
+RAW_RETENTION = 2 * 86400  # seconds raw polls are kept
+MINUTE_RETENTION = 35 * 86400  # seconds 1-minute buckets are kept
+HOUR_RETENTION = 400 * 86400  # seconds 1-hour buckets are kept
+EVENT_RETENTION = 400 * 86400  # seconds events are kept
+
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS instances (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS characters (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL COLLATE NOCASE,
+    world TEXT NOT NULL COLLATE NOCASE,
+    UNIQUE (name, world)
+);
+CREATE TABLE IF NOT EXISTS polls (
+    t REAL NOT NULL,
+    instance INTEGER NOT NULL,
+    character INTEGER NOT NULL,  -- 0 before the instance ever reported one
+    state INTEGER NOT NULL,  -- index into wrangler_history.STATES
+    reachable INTEGER NOT NULL,
+    latency REAL,  -- seconds; NULL for pushed statuses
+    runtime INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS polls_instance_t ON polls (instance, t);
+CREATE INDEX IF NOT EXISTS polls_t ON polls (t);
+CREATE TABLE IF NOT EXISTS events (
+    t REAL NOT NULL,
+    instance INTEGER NOT NULL,
+    character INTEGER NOT NULL,
+    kind TEXT NOT NULL,  -- state, reachability, command, timer, schedule
+    name TEXT NOT NULL,  -- e.g. executing; lost / regained; run; started
+    success INTEGER,  -- commands only
+    detail TEXT,  -- command reply
+    latency REAL  -- commands only, seconds
+);
+CREATE INDEX IF NOT EXISTS events_instance_t ON events (instance, t);
+CREATE INDEX IF NOT EXISTS events_character_t ON events (character, t);
+CREATE INDEX IF NOT EXISTS events_kind_t ON events (kind, t);
+CREATE INDEX IF NOT EXISTS events_t ON events (t);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+ROLLUP_COLUMNS = """
+    instance INTEGER NOT NULL,
+    character INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,  -- unix time the bucket starts
+    samples INTEGER NOT NULL,
+    observed REAL NOT NULL,  -- seconds
+    reachable REAL NOT NULL,
+    executing REAL NOT NULL,
+    latency_sum REAL NOT NULL,
+    latency_count INTEGER NOT NULL,
+    latency_max REAL,
+    PRIMARY KEY (bucket, instance, character)  -- clustered by time: a report reads one range
+"""
+ROLLUP_TABLES = ("rollups_1m", "rollups_1h")
+
+ROLLUP_MINUTES = """
+INSERT OR REPLACE INTO rollups_1m
+SELECT instance, character, CAST(t / 60 AS INTEGER) * 60, COUNT(*), SUM(span),
+       SUM(CASE WHEN reachable THEN span ELSE 0 END),
+       SUM(CASE WHEN state = :executing THEN span ELSE 0 END),
+       TOTAL(latency), COUNT(latency), MAX(latency)
+FROM (
+    SELECT t, instance, character, state, reachable, latency,
+           MIN(COALESCE(LEAD(t) OVER (PARTITION BY instance ORDER BY t), :end + :max_span) - t,
+               :max_span) AS span  -- An instance's last poll counts up to the end of what was read
+    FROM polls WHERE t >= :start AND t < :end + :max_span
+)
+WHERE t >= :start AND t < :end
+GROUP BY instance, character, CAST(t / 60 AS INTEGER)
+"""
+ROLLUP_HOURS = """
+INSERT OR REPLACE INTO rollups_1h
+SELECT instance, character, bucket / 3600 * 3600, SUM(samples), SUM(observed), SUM(reachable),
+       SUM(executing), SUM(latency_sum), SUM(latency_count), MAX(latency_max)
+FROM rollups_1m WHERE bucket >= :start AND bucket < :end
+GROUP BY instance, character, bucket / 3600
+"""
+# Whole hours from the hourly buckets, the ragged ends from the minute buckets
+BUCKETS = """
+WITH buckets AS (
+    SELECT * FROM rollups_1h WHERE bucket >= :h0 AND bucket < :h1
+    UNION ALL
+    SELECT * FROM rollups_1m WHERE bucket >= :since AND bucket < MIN(:h0, :until)
+    UNION ALL
+    SELECT * FROM rollups_1m WHERE bucket >= MAX(:h1, :since) AND bucket < :until
+)
+"""
+
+
+def _connect(path: str, **kwargs) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=10.0, **kwargs)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; a power cut may lose the last second
+    return conn
+
+
+class TelemetryStore:
+    """Batched, thread-safe writer and queries for the telemetry database.
+
+    record_*() may be called from any thread. on_error receives a message
+    when a write fails; telemetry never stops polling or commands.
+    """
+
+    def __init__(self, path, on_error: Callable[[str], None] = None,
+                 clock: Callable[[], float] = time.time):
+        self.path = str(path)
+        self.on_error = on_error or (lambda message: None)
+        self._clock = clock
+        self.rows_written = 0
+
+        conn = _connect(self.path)
+        with conn:
+            conn.executescript(SCHEMA)
+            for table in ROLLUP_TABLES:
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({ROLLUP_COLUMNS}) WITHOUT ROWID")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.close()
+
+        self._cond = threading.Condition()
+        self._pending: List[tuple] = []
+        self._wanted = 0  # flush() requests made
+        self._served = 0  # flush() requests done
+        self._maintain_wanted = False
+        self._closed = False
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+
+        # Writer thread only
+        self._instance_ids: Dict[str, int] = {}
+        self._character_ids: Dict[Tuple[str, str], int] = {}
+        self._last: Dict[int, Tuple[int, bool, int, int]] = {}  # instance -> state, reachable, character, runtime
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def _queue(self, row: tuple):
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.append(row)
+            if len(self._pending) >= FLUSH_BATCH:
+                self._cond.notify()
+
+    def _status_row(self, now: float, key: str, status: InstanceStatus, pushed: bool) -> tuple:
+        if status.not_modified:
+            return ("status", now, key, None, None, status.latency, None, None)
+        character = None
+        if status.reachable and status.character_name != "Unknown":
+            character = (status.character_name, status.world_name)
+        return (
+            "status", now, key,
+            STATES.index(describe_state(status)[0]),
+            status.reachable,
+            None if pushed else status.latency,
+            max(0, status.runtime_seconds),
+            character,
+        )
+
+    def record_status(self, key: str, status: InstanceStatus, pushed: bool = False):
+        """Queues one polled (or pushed) status; a 304 repeats the previous one."""
+        self._queue(self._status_row(self._clock(), key, status, pushed))
+
+    def record_statuses(self, statuses: Dict[str, InstanceStatus]):
+        """Queues a poll cycle's statuses, by key."""
+        now = self._clock()
+        rows = [self._status_row(now, key, status, False) for key, status in statuses.items()]
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.extend(rows)
+            if len(self._pending) >= FLUSH_BATCH:
+                self._cond.notify()
+
+    def record_command(self, key: str, command: str, success: bool, message: str, latency: float):
+        """Queues a command sent to an instance ("run", "stop", ...) and its outcome."""
+        self._queue(("command", self._clock(), key, command, success, message, latency))
+
+    def record_transition(self, key: str, kind: str, event: str):
+        """Queues a timer or schedule transition, e.g. ("timer", "expired")."""
+        self._queue(("transition", self._clock(), key, kind, event))
+
+    def flush(self, maintain: bool = False, timeout: float = 30.0):
+        """Writes everything queued so far (and rolls up, with maintain=True) before returning."""
+        with self._cond:
+            self._wanted += 1
+            ticket = self._wanted
+            self._maintain_wanted |= maintain
+            self._cond.notify()
+            self._cond.wait_for(lambda: self._served >= ticket or not self._thread.is_alive(), timeout)
+
+    def close(self):
+        """Writes what is queued and stops the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=10.0)
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    # =========================================================================
+    # Writer Thread
+    # =========================================================================
+
+    def _run(self):
+        conn = _connect(self.path)
+        next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+        while True:
+            with self._cond:
+                if not (self._closed or self._wanted > self._served or len(self._pending) >= FLUSH_BATCH):
+                    self._cond.wait(FLUSH_INTERVAL)
+                batch, self._pending = self._pending, []
+                ticket = self._wanted
+                maintain, self._maintain_wanted = self._maintain_wanted, False
+                closed = self._closed
+
+            try:
+                if batch:
+                    self._write(conn, batch)
+                if maintain or time.monotonic() >= next_maintenance:
+                    next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+                    self._maintain(conn, self._clock())
+            except sqlite3.Error as e:
+                self.on_error(f"Telemetry write failed: {e}")
+
+            with self._cond:
+                self._served = ticket
+                self._cond.notify_all()
+            if closed:
+                conn.close()
+                return
+
+    def _instance_id(self, conn: sqlite3.Connection, key: str) -> int:
+        instance = self._instance_ids.get(key)
+        if instance is None:
+            conn.execute("INSERT OR IGNORE INTO instances (key) VALUES (?)", (key,))
+            instance = conn.execute("SELECT id FROM instances WHERE key = ?", (key,)).fetchone()[0]
+            self._instance_ids[key] = instance
+        return instance
+
+    def _character_id(self, conn: sqlite3.Connection, character: Tuple[str, str]) -> int:
+        character_id = self._character_ids.get(character)
+        if character_id is None:
+            conn.execute("INSERT OR IGNORE INTO characters (name, world) VALUES (?, ?)", character)
+            character_id = conn.execute(
+                "SELECT id FROM characters WHERE name = ? AND world = ?", character
+            ).fetchone()[0]
+            self._character_ids[character] = character_id
+        return character_id
+
+    def _write(self, conn: sqlite3.Connection, batch: List[tuple]):
+        polls, events = [], []
+        with conn:
+            for row in batch:
+                kind, t, key = row[:3]
+                instance = self._instance_id(conn, key)
+                last = self._last.get(instance)
+                character = last[2] if last else 0  # Unreachable polls count for the last character seen
+
+                if kind == "command":
+                    command, success, message, latency = row[3:]
+                    events.append((t, instance, character, "command", command, int(bool(success)), message, latency))
+                    continue
+                if kind == "transition":
+                    events.append((t, instance, character, row[3], row[4], None, None, None))
+                    continue
+
+                state, reachable, latency, runtime, reported = row[3:]
+                if state is None:  # 304
+                    if last is None:
+                        continue
+                    state, reachable, character, runtime = last
+                else:
+                    if reported is not None:
+                        character = self._character_id(conn, reported)
+                    if last is None or state != last[0]:
+                        events.append((t, instance, character, "state", STATES[state], None, None, None))
+                    if last is not None and reachable != last[1]:
+                        events.append((t, instance, character, "reachability",
+                                       "regained" if reachable else "lost", None, None, None))
+                self._last[instance] = (state, reachable, character, runtime)
+                polls.append((t, instance, character, state, int(reachable), latency, runtime))
+
+            conn.executemany("INSERT INTO polls VALUES (?, ?, ?, ?, ?, ?, ?)", polls)
+            conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", events)
+        self.rows_written += len(polls) + len(events)
+
+    def _meta(self, conn: sqlite3.Connection, key: str) -> Optional[float]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _maintain(self, conn: sqlite3.Connection, now: float):
+        """Rolls finished minutes and hours up and drops rows past their retention."""
+        with conn:
+            rolled = self._meta(conn, "rolled_1m")
+            end = int((now - MAX_SAMPLE_SPAN) // 60 * 60)
+            start = rolled
+            if start is None:
+                first = conn.execute("SELECT MIN(t) FROM polls").fetchone()[0]
+                start = int(first // 60 * 60) if first is not None else end
+            if end > start:
+                conn.execute(ROLLUP_MINUTES, {
+                    "start": start, "end": end, "max_span": MAX_SAMPLE_SPAN,
+                    "executing": STATES.index("executing"),
+                })
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('rolled_1m', ?)", (end,))
+                rolled = end
+
+            rolled_hours = self._meta(conn, "rolled_1h")
+            if rolled is not None:
+                end = int(rolled) // 3600 * 3600
+                start = rolled_hours
+                if start is None:
+                    first = conn.execute("SELECT MIN(bucket) FROM rollups_1m").fetchone()[0]
+                    start = first // 3600 * 3600 if first is not None else end
+                if end > start:
+                    conn.execute(ROLLUP_HOURS, {"start": start, "end": end})
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('rolled_1h', ?)", (end,))
+                    rolled_hours = end
+
+            # Raw rows only go once they are rolled up
+            conn.execute("DELETE FROM polls WHERE t < ?", (min(now - RAW_RETENTION, rolled or 0),))
+            conn.execute("DELETE FROM rollups_1m WHERE bucket < ?",
+                         (min(now - MINUTE_RETENTION, rolled_hours or 0),))
+            conn.execute("DELETE FROM rollups_1h WHERE bucket < ?", (now - HOUR_RETENTION,))
+            conn.execute("DELETE FROM events WHERE t < ?", (now - EVENT_RETENTION,))
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _query(self, sql: str, params) -> List[tuple]:
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = _connect(self.path, check_same_thread=False)
+            return self._reader.execute(sql, params).fetchall()
+
+    def _range(self, since: float, until: Optional[float]) -> dict:
+        until = self._clock() if until is None else until
+        rolled_hours = self._query("SELECT value FROM meta WHERE key = 'rolled_1h'", ())
+        h0 = -(-int(since) // 3600) * 3600
+        h1 = int(until) // 3600 * 3600
+        if rolled_hours:
+            h1 = min(h1, int(rolled_hours[0][0]))
+        else:
+            h1 = h0
+        return {"since": since, "until": until, "h0": h0, "h1": max(h0, h1)}
+
+    def uptime(self, since: float, until: Optional[float] = None) -> List[dict]:
+        """Seconds observed, reachable and executing per character between two unix times.
+
+        Most executing first; time before an instance reported a character
+        is listed under the character None.
+        """
+        rows = self._query(BUCKETS + """
+            SELECT c.name, c.world, SUM(b.observed), SUM(b.reachable), SUM(b.executing),
+                   SUM(b.latency_sum) / NULLIF(SUM(b.latency_count), 0)
+            FROM buckets b LEFT JOIN characters c ON c.id = b.character
+            GROUP BY b.character ORDER BY SUM(b.executing) DESC
+        """, self._range(since, until))
+        return [
+            {"character": name, "world": world, "observed": observed, "reachable": reachable,
+             "executing": executing, "latency": latency}
+            for name, world, observed, reachable, executing, latency in rows
+        ]
+
+    def outages(self, since: float, until: Optional[float] = None,
+                character: Optional[str] = None) -> List[dict]:
+        """How often each character's instance became unreachable, most often first.
+
+        character limits the result to one character name (case-insensitive).
+        """
+        until = self._clock() if until is None else until
+        if character is None:
+            scope, params = "e.kind = 'reachability'", (since, until)
+        else:  # By character first, so a year of one character's events is an index range
+            scope = "e.character IN (SELECT id FROM characters WHERE name = ?)"
+            params = (character, since, until)
+        rows = self._query(f"""
+            SELECT c.name, c.world, COUNT(*), MAX(e.t)
+            FROM events e LEFT JOIN characters c ON c.id = e.character
+            WHERE {scope} AND e.t >= ? AND e.t < ? AND e.kind = 'reachability' AND e.name = 'lost'
+            GROUP BY e.character ORDER BY COUNT(*) DESC
+        """, params)
+        return [{"character": name, "world": world, "count": count, "last": last}
+                for name, world, count, last in rows]
+
+    def command_stats(self, since: float, until: Optional[float] = None) -> List[dict]:
+        """Commands sent per kind with failures and average latency, most sent first."""
+        until = self._clock() if until is None else until
+        rows = self._query("""
+            SELECT name, COUNT(*), SUM(success = 0), AVG(latency)
+            FROM events WHERE t >= ? AND t < ? AND kind = 'command'
+            GROUP BY name ORDER BY COUNT(*) DESC
+        """, (since, until))
+        return [{"command": name, "count": count, "failures": failures, "latency": latency}
+                for name, count, failures, latency in rows]